@@ -4,42 +4,77 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import timedelta
-from typing import Any
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT, Platform
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.importlib import async_import_module
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from . import repairs
-from .api_client import UnraidAPIClient
+from .api_client import UnraidAPIClient, UnraidDurationHistogram
 from .const import (
+    ACTIVE_POLL_DECAY,
+    ACTIVE_POLL_INTERVAL,
+    CATEGORY_POLL_INTERVALS,
+    CONF_CAPTURE_WEBSOCKET,
+    CONF_DISABLED_CATEGORIES,
     CONF_ENABLE_WEBSOCKET,
     CONF_UPDATE_INTERVAL,
+    DATA_FLOW_SYSTEM,
+    DEFAULT_CAPTURE_WEBSOCKET,
     DEFAULT_ENABLE_WEBSOCKET,
     DEFAULT_UPDATE_INTERVAL,
+    DEGRADED_POLL_CATEGORIES,
+    DEGRADED_POLL_INTERVAL,
+    DEGRADED_RECOVERY_DELAY,
     DOMAIN,
     EVENT_ARRAY_STATUS_UPDATE,
     EVENT_CONTAINER_LIST_UPDATE,
     EVENT_DISK_LIST_UPDATE,
     EVENT_GPU_UPDATE,
     EVENT_NETWORK_LIST_UPDATE,
+    EVENT_SHARE_LIST_UPDATE,
     EVENT_SYSTEM_UPDATE,
+    EVENT_UPS_POWER_CHANGED,
     EVENT_UPS_STATUS_UPDATE,
     EVENT_VM_LIST_UPDATE,
+    ITEM_ID_FIELDS,
     KEY_ARRAY,
     KEY_CONTAINERS,
     KEY_DISKS,
     KEY_GPU,
     KEY_NETWORK,
+    KEY_SHARES,
     KEY_SYSTEM,
     KEY_UPS,
     KEY_VMS,
+    MANUFACTURER,
+    MODEL,
+    MODEL_CONTAINER,
+    MODEL_VM,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_STALE_GRACE,
+    SNAPSHOT_STORAGE_VERSION,
+    TRANSITION_TIMEOUT,
+    UPS_ON_BATTERY_POLL_INTERVAL,
 )
-from .websocket_client import UnraidWebSocketClient
+from .services import async_setup_services, async_unload_services
+
+if TYPE_CHECKING:
+    from .websocket_client import UnraidWebSocketClient, UnraidWebSocketStats
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -50,36 +85,124 @@ PLATFORMS: list[Platform] = [
     Platform.BUTTON,
 ]
 
+# API client method and empty value for each data category
+CATEGORY_ENDPOINTS: dict[str, tuple[str, Callable[[], Any]]] = {
+    KEY_SYSTEM: ("get_system_info", dict),
+    KEY_ARRAY: ("get_array_status", dict),
+    KEY_DISKS: ("get_disks", list),
+    KEY_CONTAINERS: ("get_containers", list),
+    KEY_VMS: ("get_vms", list),
+    KEY_UPS: ("get_ups_status", dict),
+    KEY_GPU: ("get_gpu_metrics", list),
+    KEY_NETWORK: ("get_network_interfaces", list),
+    KEY_SHARES: ("get_shares", list),
+}
+
+# Data category replaced by each WebSocket event
+EVENT_CATEGORIES: dict[str, str] = {
+    EVENT_SYSTEM_UPDATE: KEY_SYSTEM,
+    EVENT_ARRAY_STATUS_UPDATE: KEY_ARRAY,
+    EVENT_DISK_LIST_UPDATE: KEY_DISKS,
+    EVENT_CONTAINER_LIST_UPDATE: KEY_CONTAINERS,
+    EVENT_VM_LIST_UPDATE: KEY_VMS,
+    EVENT_UPS_STATUS_UPDATE: KEY_UPS,
+    EVENT_GPU_UPDATE: KEY_GPU,
+    EVENT_NETWORK_LIST_UPDATE: KEY_NETWORK,
+    EVENT_SHARE_LIST_UPDATE: KEY_SHARES,
+}
+
+# Name label and model of the child devices created for containers and VMs
+CHILD_DEVICE_TYPES: dict[str, tuple[str, str]] = {
+    "container": ("Container", MODEL_CONTAINER),
+    "vm": ("VM", MODEL_VM),
+}
+
+
+def _array_active(array_data: dict[str, Any]) -> bool:
+    """Return True while a parity check, the mover or a start/stop is running."""
+    return (
+        str(array_data.get("parity_check_status", "")).lower() == "running"
+        or bool(array_data.get("mover_running"))
+        or str(array_data.get("state", "")).upper() in ("STARTING", "STOPPING")
+    )
+
+
+def _ups_on_battery(ups_data: dict[str, Any]) -> bool:
+    """Return True while the UPS runs on battery."""
+    if "on_battery" in ups_data:
+        return bool(ups_data["on_battery"])
+    status = str(ups_data.get("status", "")).upper().replace("_", " ")
+    return "ONBATT" in status or "ON BATTERY" in status
+
+
+# Categories whose data tells when they are busy, with the interval to poll
+# them at while busy and the factor it grows by once idle (None to return to
+# the normal interval right away). A UPS on battery is sampled on its own
+# instead; see _async_sample_ups
+ACTIVITY_CHECKS: dict[str, tuple[Callable[[Any], bool], float, float | None]] = {
+    KEY_ARRAY: (_array_active, ACTIVE_POLL_INTERVAL, ACTIVE_POLL_DECAY),
+}
+
+# Slack so a category is not skipped when a tick lands just short of its interval
+_POLL_TOLERANCE = 1.0
+
+
+class _Transition(NamedTuple):
+    """A container or VM switched to a state that is not confirmed yet."""
+
+    running: bool
+    cancel_timeout: CALLBACK_TYPE
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Unraid Management Agent from a config entry."""
+    started = time.monotonic()
     host = entry.data[CONF_HOST]
     port = entry.data[CONF_PORT]
     update_interval = entry.options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
     enable_websocket = entry.options.get(
         CONF_ENABLE_WEBSOCKET, DEFAULT_ENABLE_WEBSOCKET
     )
+    disabled_categories = entry.options.get(CONF_DISABLED_CATEGORIES, [])
 
     session = async_get_clientsession(hass)
     client = UnraidAPIClient(host=host, port=port, session=session)
 
-    # Test connection
-    try:
-        await client.health_check()
-    except Exception as err:
-        _LOGGER.error("Failed to connect to Unraid server: %s", err)
-        raise ConfigEntryNotReady from err
-
     # Create coordinator
     coordinator = UnraidDataUpdateCoordinator(
         hass,
         client=client,
         update_interval=update_interval,
         enable_websocket=enable_websocket,
+        store=_snapshot_store(hass, entry),
+        disabled_categories=disabled_categories,
+        capture_path=_capture_path(hass, entry),
     )
 
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    # Connect the WebSocket while the first data is fetched; pushes are
+    # ignored until there is data to apply them to
+    if enable_websocket:
+        await coordinator.async_start_websocket()
+
+    if await coordinator.async_load_snapshot():
+        # Entities start from the last snapshot, live data follows
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+        )
+    else:
+        # Reuse the system data the config flow just fetched
+        flow_system = hass.data.get(DATA_FLOW_SYSTEM, {}).pop(entry.unique_id, None)
+        if flow_system is not None:
+            coordinator.seed_category(KEY_SYSTEM, flow_system[1], flow_system[0])
+
+        # The first refresh doubles as the connection test: it fails only
+        # when the server answers none of the requests
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except ConfigEntryNotReady:
+            await coordinator.async_stop_websocket()
+            raise
+    coordinator.setup_timings["first_data"] = time.monotonic() - started
 
     # Store coordinator
     hass.data.setdefault(DOMAIN, {})
@@ -88,16 +211,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Register services
-    await async_setup_services(hass, coordinator)
+    # Register services; they are shared by all servers
+    await async_setup_services(hass)
 
-    # Start WebSocket for real-time updates
-    if enable_websocket:
-        await coordinator.async_start_websocket()
+    # Repair issues follow polls and pushes from here on
+    entry.async_on_unload(_async_track_issues(hass, entry, coordinator))
 
-    # Register update listener for options
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    # Register update listener for options; only a new server or different
+    # entities need a reload
+    entry.async_on_unload(
+        entry.add_update_listener(partial(async_update_options, server=(host, port)))
+    )
 
+    coordinator.setup_timings["total"] = time.monotonic() - started
+    _LOGGER.debug(
+        "Set up %s in %.3f s (first data after %.3f s)",
+        host,
+        coordinator.setup_timings["total"],
+        coordinator.setup_timings["first_data"],
+    )
     return True
 
 
@@ -107,224 +239,103 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         coordinator: UnraidDataUpdateCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
         # Stop WebSocket if running
         await coordinator.async_stop_websocket()
+        if not hass.data[DOMAIN]:
+            async_unload_services(hass)
 
     return unload_ok
 
 
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry when options change."""
-    await hass.config_entries.async_reload(entry.entry_id)
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored snapshot and health data of a deleted config entry."""
+    await _snapshot_store(hass, entry).async_remove()
+    repairs = await async_import_module(hass, f"{__name__}.repairs")
+    await repairs.health_store(hass, entry.entry_id).async_remove()
 
 
-async def async_setup_services(
-    hass: HomeAssistant, coordinator: UnraidDataUpdateCoordinator
-) -> None:
-    """Set up services for Unraid Management Agent."""
+@callback
+def _async_track_issues(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: UnraidDataUpdateCoordinator
+) -> CALLBACK_TYPE:
+    """
+    Start raising and clearing repair issues for the entry; return the stop.
 
-    async def handle_container_start(call: ServiceCall) -> None:
-        """Handle container start service."""
-        container_id = call.data["container_id"]
-        try:
-            await coordinator.client.start_container(container_id)
-            await coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to start container %s: %s", container_id, err)
-            raise HomeAssistantError(f"Failed to start container: {err}") from err
+    The tracker starts in the background, so the stop also covers an entry
+    unloaded before the tracker is up.
+    """
+    stop_tracking: CALLBACK_TYPE | None = None
 
-    async def handle_container_stop(call: ServiceCall) -> None:
-        """Handle container stop service."""
-        container_id = call.data["container_id"]
-        try:
-            await coordinator.client.stop_container(container_id)
-            await coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to stop container %s: %s", container_id, err)
-            raise HomeAssistantError(f"Failed to stop container: {err}") from err
+    async def async_start() -> None:
+        nonlocal stop_tracking
+        # Loaded off the setup path; issues can wait until the entry is up
+        repairs = await async_import_module(hass, f"{__name__}.repairs")
+        stop_tracking = await repairs.async_track_issues(hass, coordinator)
 
-    async def handle_container_restart(call: ServiceCall) -> None:
-        """Handle container restart service."""
-        container_id = call.data["container_id"]
-        try:
-            await coordinator.client.restart_container(container_id)
-            await coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to restart container %s: %s", container_id, err)
-            raise HomeAssistantError(f"Failed to restart container: {err}") from err
+    task = entry.async_create_background_task(hass, async_start(), f"{DOMAIN} repairs")
 
-    async def handle_container_pause(call: ServiceCall) -> None:
-        """Handle container pause service."""
-        container_id = call.data["container_id"]
-        try:
-            await coordinator.client.pause_container(container_id)
-            await coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to pause container %s: %s", container_id, err)
-            raise HomeAssistantError(f"Failed to pause container: {err}") from err
-
-    async def handle_container_resume(call: ServiceCall) -> None:
-        """Handle container resume service."""
-        container_id = call.data["container_id"]
-        try:
-            await coordinator.client.unpause_container(container_id)
-            await coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to resume container %s: %s", container_id, err)
-            raise HomeAssistantError(f"Failed to resume container: {err}") from err
-
-    async def handle_vm_start(call: ServiceCall) -> None:
-        """Handle VM start service."""
-        vm_id = call.data["vm_id"]
-        try:
-            await coordinator.client.start_vm(vm_id)
-            await coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to start VM %s: %s", vm_id, err)
-            raise HomeAssistantError(f"Failed to start VM: {err}") from err
-
-    async def handle_vm_stop(call: ServiceCall) -> None:
-        """Handle VM stop service."""
-        vm_id = call.data["vm_id"]
-        try:
-            await coordinator.client.stop_vm(vm_id)
-            await coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to stop VM %s: %s", vm_id, err)
-            raise HomeAssistantError(f"Failed to stop VM: {err}") from err
+    @callback
+    def async_stop() -> None:
+        task.cancel()
+        if stop_tracking is not None:
+            stop_tracking()
 
-    async def handle_vm_restart(call: ServiceCall) -> None:
-        """Handle VM restart service."""
-        vm_id = call.data["vm_id"]
-        try:
-            await coordinator.client.restart_vm(vm_id)
-            await coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to restart VM %s: %s", vm_id, err)
-            raise HomeAssistantError(f"Failed to restart VM: {err}") from err
+    return async_stop
 
-    async def handle_vm_pause(call: ServiceCall) -> None:
-        """Handle VM pause service."""
-        vm_id = call.data["vm_id"]
-        try:
-            await coordinator.client.pause_vm(vm_id)
-            await coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to pause VM %s: %s", vm_id, err)
-            raise HomeAssistantError(f"Failed to pause VM: {err}") from err
 
-    async def handle_vm_resume(call: ServiceCall) -> None:
-        """Handle VM resume service."""
-        vm_id = call.data["vm_id"]
-        try:
-            await coordinator.client.resume_vm(vm_id)
-            await coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to resume VM %s: %s", vm_id, err)
-            raise HomeAssistantError(f"Failed to resume VM: {err}") from err
+def _snapshot_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Return the storage holding the last good snapshot of an entry."""
+    return Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}")
 
-    async def handle_vm_hibernate(call: ServiceCall) -> None:
-        """Handle VM hibernate service."""
-        vm_id = call.data["vm_id"]
-        try:
-            await coordinator.client.hibernate_vm(vm_id)
-            await coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to hibernate VM %s: %s", vm_id, err)
-            raise HomeAssistantError(f"Failed to hibernate VM: {err}") from err
 
-    async def handle_vm_force_stop(call: ServiceCall) -> None:
-        """Handle VM force stop service."""
-        vm_id = call.data["vm_id"]
-        try:
-            await coordinator.client.force_stop_vm(vm_id)
-            await coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to force stop VM %s: %s", vm_id, err)
-            raise HomeAssistantError(f"Failed to force stop VM: {err}") from err
+def _capture_path(hass: HomeAssistant, entry: ConfigEntry) -> str | None:
+    """Return the file WebSocket frames are captured to, if capturing is on."""
+    if not entry.options.get(CONF_CAPTURE_WEBSOCKET, DEFAULT_CAPTURE_WEBSOCKET):
+        return None
+    return hass.config.path(f"{DOMAIN}.{entry.entry_id}.capture.jsonl.gz")
 
-    async def handle_array_start(call: ServiceCall) -> None:
-        """Handle array start service."""
-        try:
-            await coordinator.client.start_array()
-            await coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to start array: %s", err)
-            raise HomeAssistantError(f"Failed to start array: {err}") from err
 
-    async def handle_array_stop(call: ServiceCall) -> None:
-        """Handle array stop service."""
-        try:
-            await coordinator.client.stop_array()
-            await coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to stop array: %s", err)
-            raise HomeAssistantError(f"Failed to stop array: {err}") from err
+async def async_update_options(
+    hass: HomeAssistant, entry: ConfigEntry, *, server: tuple[str, int]
+) -> None:
+    """Apply changed options in place, reloading only when entities change."""
+    coordinator: UnraidDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if (entry.data[CONF_HOST], entry.data[CONF_PORT]) != server or frozenset(
+        entry.options.get(CONF_DISABLED_CATEGORIES, [])
+    ) != coordinator.disabled_categories:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    await coordinator.async_apply_options(
+        update_interval=entry.options.get(
+            CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
+        ),
+        enable_websocket=entry.options.get(
+            CONF_ENABLE_WEBSOCKET, DEFAULT_ENABLE_WEBSOCKET
+        ),
+        capture_path=_capture_path(hass, entry),
+    )
 
-    async def handle_parity_check_start(call: ServiceCall) -> None:
-        """Handle parity check start service."""
-        try:
-            await coordinator.client.start_parity_check()
-            await coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to start parity check: %s", err)
-            raise HomeAssistantError(f"Failed to start parity check: {err}") from err
 
-    async def handle_parity_check_stop(call: ServiceCall) -> None:
-        """Handle parity check stop service."""
-        try:
-            await coordinator.client.stop_parity_check()
-            await coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to stop parity check: %s", err)
-            raise HomeAssistantError(f"Failed to stop parity check: {err}") from err
+def _item_id(item: Any, id_fields: tuple[str, ...]) -> str | None:
+    """
+    Return the id of a list item from the first id field it has.
 
-    async def handle_parity_check_pause(call: ServiceCall) -> None:
-        """Handle parity check pause service."""
-        try:
-            await coordinator.client.pause_parity_check()
-            await coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to pause parity check: %s", err)
-            raise HomeAssistantError(f"Failed to pause parity check: {err}") from err
+    Always a string: the agent may send numeric ids, and entities look
+    items up with the string ids their unique IDs are built from.
+    """
+    if not isinstance(item, dict):
+        return None
+    for field in id_fields:
+        if item.get(field) is not None:
+            return str(item[field])
+    return None
 
-    async def handle_parity_check_resume(call: ServiceCall) -> None:
-        """Handle parity check resume service."""
-        try:
-            await coordinator.client.resume_parity_check()
-            await coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to resume parity check: %s", err)
-            raise HomeAssistantError(f"Failed to resume parity check: {err}") from err
-
-    # Register all services
-    hass.services.async_register(DOMAIN, "container_start", handle_container_start)
-    hass.services.async_register(DOMAIN, "container_stop", handle_container_stop)
-    hass.services.async_register(DOMAIN, "container_restart", handle_container_restart)
-    hass.services.async_register(DOMAIN, "container_pause", handle_container_pause)
-    hass.services.async_register(DOMAIN, "container_resume", handle_container_resume)
-
-    hass.services.async_register(DOMAIN, "vm_start", handle_vm_start)
-    hass.services.async_register(DOMAIN, "vm_stop", handle_vm_stop)
-    hass.services.async_register(DOMAIN, "vm_restart", handle_vm_restart)
-    hass.services.async_register(DOMAIN, "vm_pause", handle_vm_pause)
-    hass.services.async_register(DOMAIN, "vm_resume", handle_vm_resume)
-    hass.services.async_register(DOMAIN, "vm_hibernate", handle_vm_hibernate)
-    hass.services.async_register(DOMAIN, "vm_force_stop", handle_vm_force_stop)
-
-    hass.services.async_register(DOMAIN, "array_start", handle_array_start)
-    hass.services.async_register(DOMAIN, "array_stop", handle_array_stop)
-
-    hass.services.async_register(
-        DOMAIN, "parity_check_start", handle_parity_check_start
-    )
-    hass.services.async_register(DOMAIN, "parity_check_stop", handle_parity_check_stop)
-    hass.services.async_register(
-        DOMAIN, "parity_check_pause", handle_parity_check_pause
-    )
-    hass.services.async_register(
-        DOMAIN, "parity_check_resume", handle_parity_check_resume
-    )
 
-    _LOGGER.info("Registered %d services for Unraid Management Agent", 18)
+def _same_item(old: dict[str, Any], new: dict[str, Any]) -> bool:
+    """Return True if two versions of an item differ only in their timestamp."""
+    fields = new.keys() - {"timestamp"}
+    if fields != old.keys() - {"timestamp"}:
+        return False
+    return all(old[field] == new[field] for field in fields)
 
 
 class UnraidDataUpdateCoordinator(DataUpdateCoordinator):
@@ -336,19 +347,552 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator):
         client: UnraidAPIClient,
         update_interval: int,
         enable_websocket: bool,
+        store: Store | None = None,
+        disabled_categories: Iterable[str] = (),
+        capture_path: str | None = None,
     ) -> None:
         """Initialize the coordinator."""
         self.client = client
         self.enable_websocket = enable_websocket
+        # Categories turned off in the options are neither polled nor pushed
+        self.disabled_categories = frozenset(disabled_categories)
+        # Snapshot storage; data is stale while it only comes from the snapshot
+        self._store = store
+        self._save_pending = False
+        self.stale = False
+        # time.monotonic() the snapshot was loaded at
+        self._stale_since = 0.0
+        # Seconds from the start of setup to each setup milestone
+        self.setup_timings: dict[str, float] = {}
         self.websocket_task = None
+        self.websocket_client: UnraidWebSocketClient | None = None
+        # Kept on the coordinator so statistics survive client restarts;
+        # created with the first client
+        self.websocket_stats: UnraidWebSocketStats | None = None
+        # File received frames are recorded to, when capturing is turned on
+        self.capture_path = capture_path
+
+        # Per-category polling state; see poll_plan
+        self.base_interval = update_interval
+        self.degraded = False
+        self._last_polled: dict[str, float] = {}
+        # Wall clock time each category last arrived, polled or pushed
+        self.received_at: dict[str, float] = {}
+        # Categories refreshed since listeners were last updated, None for
+        # all; see async_update_listeners
+        self._updated_categories: set[str] | None = None
+        self._notified_health: tuple[bool, bool] | None = None
+        # Durations of refreshes that polled at least one category
+        self.refresh_durations = UnraidDurationHistogram()
+        self._cancel_recovery: Callable[[], None] | None = None
+        # Faster intervals of busy or recently busy categories; see _track_activity
+        self._active_intervals: dict[str, float] = {}
+        # Last seen UPS power source and its fast sampling; see _track_ups_power
+        self._ups_on_battery = False
+        self._cancel_ups_sampling: CALLBACK_TYPE | None = None
+        self._sampling_ups = False
+        # Items switched to a state not confirmed yet; see async_start_transition
+        self._transitions: dict[tuple[str, str], _Transition] = {}
+        # Service calls waiting for a state per category; see async_wait_for_state
+        self._waiters: dict[
+            str, list[tuple[Callable[[Any], bool], asyncio.Future[Any]]]
+        ] = {}
+
+        # Items of list categories keyed by ITEM_ID_FIELDS; see get_item
+        self._items: dict[str, dict[str, dict[str, Any]]] = {}
+
+        # Device info shared by all entities; see device_info
+        self._device_info: DeviceInfo | None = None
+        self._device_info_key: tuple[str, str, str] | None = None
+        self._child_device_info: dict[tuple[str, str], tuple[str, DeviceInfo]] = {}
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=update_interval),
+            # Polls that change nothing leave the entities alone
+            always_update=False,
         )
 
+    @property
+    def poll_plan(self) -> dict[str, float]:
+        """Return the polling interval in seconds for each data category."""
+        plan = {
+            key: self._normal_interval(key)
+            for key in CATEGORY_ENDPOINTS
+            if key not in self.disabled_categories
+        }
+        if self.degraded:
+            for key in DEGRADED_POLL_CATEGORIES:
+                if key in plan:
+                    plan[key] = float(min(self.base_interval, DEGRADED_POLL_INTERVAL))
+        for key, interval in self._active_intervals.items():
+            if key in plan:
+                plan[key] = min(plan[key], interval)
+        for key, interval in plan.items():
+            if self._confirming(key):
+                plan[key] = min(interval, float(ACTIVE_POLL_INTERVAL))
+        return plan
+
+    @property
+    def poll_ages(self) -> dict[str, float]:
+        """Return seconds since each category was polled, or a push stood in."""
+        now = time.monotonic()
+        return {key: now - polled for key, polled in self._last_polled.items()}
+
+    @property
+    def entity_categories(self) -> dict[str, int]:
+        """
+        Return the number of entities listening to each data category.
+
+        Entities without a category, updated on every refresh, are counted
+        as "none"; listeners other than entities are left out.
+        """
+        counts: Counter[str] = Counter()
+        for update_callback, context in self._listeners.values():
+            if isinstance(getattr(update_callback, "__self__", None), Entity):
+                counts[context or "none"] += 1
+        return dict(counts)
+
+    @property
+    def ups_sample_interval(self) -> float | None:
+        """Return how often the UPS is sampled between refreshes, if it is."""
+        if self._cancel_ups_sampling is None:
+            return None
+        return float(UPS_ON_BATTERY_POLL_INTERVAL)
+
+    def _confirming(self, key: str) -> bool:
+        """Return whether a switched item or a service call waits on a category."""
+        return key in self._waiters or any(
+            pending == key for pending, _item_id in self._transitions
+        )
+
+    def _normal_interval(self, key: str) -> float:
+        """Return the polling interval of a category that is not busy."""
+        # Slow categories rely on push; without it REST polls at the normal rate
+        slow = CATEGORY_POLL_INTERVALS.get(key, 0) if self.enable_websocket else 0
+        return float(max(self.base_interval, slow))
+
+    def _apply_poll_plan(self) -> None:
+        """Tick the coordinator at the fastest interval in the poll plan."""
+        self.update_interval = timedelta(seconds=min(self.poll_plan.values()))
+
+    def _reschedule(self) -> None:
+        """Apply the poll plan now instead of after the tick already scheduled."""
+        interval = self.update_interval
+        self._apply_poll_plan()
+        if self.update_interval != interval and self._listeners:
+            self._unschedule_refresh()
+            self._schedule_refresh()
+
+    def _track_activity(self, key: str, value: Any) -> bool:
+        """
+        Speed up polling of a busy category and decay it once idle.
+
+        Returns True if the category's interval changed.
+        """
+        if key not in ACTIVITY_CHECKS or not isinstance(value, dict):
+            return False
+        check, active_interval, decay = ACTIVITY_CHECKS[key]
+        previous = self._active_intervals.get(key)
+        if check(value):
+            interval: float | None = float(active_interval)
+        elif previous is None:
+            return False
+        elif decay is None:
+            interval = None
+        else:
+            interval = previous * decay
+            if interval >= self._normal_interval(key):
+                interval = None
+
+        if interval == previous:
+            return False
+        if interval is None:
+            del self._active_intervals[key]
+            _LOGGER.debug("%s idle again, back to normal polling", key)
+        else:
+            self._active_intervals[key] = interval
+            _LOGGER.debug("%s active, polling every %.0f seconds", key, interval)
+        return True
+
+    def _track_ups_power(self, ups_data: Any) -> None:
+        """Fire an event when the UPS switches between line power and battery."""
+        if not isinstance(ups_data, dict):
+            return
+        on_battery = _ups_on_battery(ups_data)
+        if on_battery == self._ups_on_battery:
+            return
+        self._ups_on_battery = on_battery
+        _LOGGER.info("UPS %s", "on battery" if on_battery else "back on line power")
+        if on_battery:
+            self._cancel_ups_sampling = async_track_time_interval(
+                self.hass,
+                self._async_sample_ups,
+                timedelta(seconds=UPS_ON_BATTERY_POLL_INTERVAL),
+                name=f"{DOMAIN} UPS sampling",
+            )
+        else:
+            self._stop_ups_sampling()
+        self.hass.bus.async_fire(
+            EVENT_UPS_POWER_CHANGED,
+            {
+                "entry_id": self.config_entry.entry_id if self.config_entry else None,
+                "on_battery": on_battery,
+                "status": ups_data.get("status"),
+                "battery_charge": ups_data.get("battery_charge_percent"),
+                "runtime_left": ups_data.get("runtime_left_seconds"),
+            },
+        )
+
+    def _stop_ups_sampling(self) -> None:
+        """Stop sampling the UPS between refreshes."""
+        if self._cancel_ups_sampling is not None:
+            self._cancel_ups_sampling()
+            self._cancel_ups_sampling = None
+
+    async def _async_sample_ups(self, _now: datetime) -> None:
+        """
+        Fetch the UPS alone while it runs on battery.
+
+        Runs beside the refresh schedule so only the UPS entities and the
+        power event follow the battery at UPS_ON_BATTERY_POLL_INTERVAL. A
+        push that arrived since the last sample stands in for it.
+        """
+        polled = self._last_polled.get(KEY_UPS)
+        if self._sampling_ups or (
+            polled is not None
+            and time.monotonic() - polled
+            < UPS_ON_BATTERY_POLL_INTERVAL - _POLL_TOLERANCE
+        ):
+            return
+        self._sampling_ups = True
+        try:
+            ups_data = await self.client.get_ups_status()
+        except Exception as err:
+            _LOGGER.debug("Error sampling UPS: %s", err)
+            return
+        finally:
+            self._sampling_ups = False
+        if not self.data or self._cancel_ups_sampling is None:
+            return
+
+        changed = ups_data != self.data.get(KEY_UPS)
+        self.data[KEY_UPS] = ups_data
+        self._last_polled[KEY_UPS] = time.monotonic()
+        self._observe(KEY_UPS, ups_data)
+        # Like a refresh, a sample that changes nothing updates no one
+        if changed:
+            self._mark_updated(KEY_UPS)
+            self.async_update_listeners()
+
+    def _observe(self, key: str, value: Any) -> None:
+        """React to fresh data of a category, whether polled or pushed."""
+        self.received_at[key] = time.time()
+        if key == KEY_UPS:
+            self._track_ups_power(value)
+        if self._transitions:
+            self._confirm_transitions(key)
+        for check, future in self._waiters.get(key, ()):
+            if not future.done() and check(value):
+                future.set_result(value)
+        if self._track_activity(key, value):
+            self._apply_poll_plan()
+
+    @callback
+    def async_start_transition(self, key: str, item_id: str, *, running: bool) -> None:
+        """
+        Hold a container or VM at the state it is being switched to.
+
+        transition_target returns the target until a poll or push reports the
+        item in that state, or TRANSITION_TIMEOUT passes. Meanwhile the
+        category is polled at ACTIVE_POLL_INTERVAL; pushes count as polls, so
+        with push up this costs no extra requests.
+        """
+        if (transition := self._transitions.pop((key, item_id), None)) is not None:
+            transition.cancel_timeout()
+        self._transitions[(key, item_id)] = _Transition(
+            running,
+            async_call_later(
+                self.hass,
+                TRANSITION_TIMEOUT,
+                partial(self._async_transition_timeout, key, item_id),
+            ),
+        )
+        self._reschedule()
+
+    @callback
+    def async_cancel_transition(self, key: str, item_id: str) -> None:
+        """Stop holding an item at its target state, e.g. when switching failed."""
+        if (transition := self._transitions.pop((key, item_id), None)) is None:
+            return
+        transition.cancel_timeout()
+        self._reschedule()
+
+    def transition_target(self, key: str, item_id: str) -> bool | None:
+        """Return whether an item being switched should run, or None if settled."""
+        transition = self._transitions.get((key, item_id))
+        return None if transition is None else transition.running
+
+    def _confirm_transitions(self, key: str) -> None:
+        """End the transitions of a category whose items reached their target."""
+        confirmed = False
+        for transition_key, item_id in list(self._transitions):
+            if transition_key != key:
+                continue
+            item = self.get_item(key, item_id)
+            if item is None:
+                continue
+            running = str(item.get("state", "")).lower() == "running"
+            if running == self._transitions[(key, item_id)].running:
+                _LOGGER.debug("%s %s reached its target state", key, item_id)
+                self._transitions.pop((key, item_id)).cancel_timeout()
+                confirmed = True
+        if confirmed:
+            self._apply_poll_plan()
+
+    async def async_wait_for_state(
+        self, key: str, check: Callable[[Any], bool], wait_time: float
+    ) -> Any:
+        """
+        Wait until fresh data of a category passes a check and return that data.
+
+        The check sees the category data of every poll or push from now on;
+        item lookups through get_item already see the new items. Meanwhile
+        the category is polled like one with a pending transition. Raises
+        TimeoutError if the check does not pass within wait_time seconds.
+        """
+        future: asyncio.Future[Any] = self.hass.loop.create_future()
+        waiter = (check, future)
+        self._waiters.setdefault(key, []).append(waiter)
+        self._reschedule()
+        try:
+            async with asyncio.timeout(wait_time):
+                return await future
+        finally:
+            self._waiters[key].remove(waiter)
+            if not self._waiters[key]:
+                del self._waiters[key]
+            self._reschedule()
+
+    @callback
+    def _async_transition_timeout(self, key: str, item_id: str, _now: datetime) -> None:
+        """Give up on a target state that was never confirmed."""
+        if self._transitions.pop((key, item_id), None) is None:
+            return
+        _LOGGER.warning(
+            "%s %s did not reach its target state within %d seconds",
+            key,
+            item_id,
+            TRANSITION_TIMEOUT,
+        )
+        self._reschedule()
+        # Entities go back to the reported state
+        self._mark_updated(key)
+        self.async_update_listeners()
+
+    def _mark_updated(self, key: str) -> None:
+        """Have the next listener update include the entities of a category."""
+        if self._updated_categories is not None:
+            self._updated_categories.add(key)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """
+        Update the listeners of the categories refreshed since the last update.
+
+        Entities pass their data category as listener context; a poll or push
+        of one category leaves the entities of the others alone. Listeners
+        without a context, and all of them when availability or staleness
+        changed, are always updated.
+        """
+        updated, self._updated_categories = self._updated_categories, set()
+        health = (self.last_update_success, self.stale)
+        if health != self._notified_health:
+            self._notified_health = health
+            updated = None
+        for update_callback, context in list(self._listeners.values()):
+            if updated is None or context is None or context in updated:
+                update_callback()
+
+    def _due_categories(self, now: float) -> list[str]:
+        """Return the categories whose polling interval has elapsed."""
+        due = []
+        for key, interval in self.poll_plan.items():
+            last = self._last_polled.get(key)
+            if last is None or now - last >= interval - _POLL_TOLERANCE:
+                due.append(key)
+        return due
+
+    def device_info(self, entry_id: str) -> DeviceInfo:
+        """Return the server device, rebuilt only when hostname or version change."""
+        system_data = self.data.get(KEY_SYSTEM, {}) if self.data else {}
+        key = (
+            entry_id,
+            system_data.get("hostname", "Unraid"),
+            system_data.get("version", "Unknown"),
+        )
+        if self._device_info is None or key != self._device_info_key:
+            self._device_info = DeviceInfo(
+                identifiers={(DOMAIN, entry_id)},
+                name=f"Unraid ({key[1]})",
+                manufacturer=MANUFACTURER,
+                model=MODEL,
+                sw_version=key[2],
+            )
+            self._device_info_key = key
+            self._child_device_info.clear()
+        return self._device_info
+
+    def child_device_info(
+        self, entry_id: str, kind: str, item_id: str, name: str
+    ) -> DeviceInfo:
+        """
+        Return the device for a container or VM, linked to the server device.
+
+        The name is prefixed with the server device name so entities that use
+        the device name keep the entity IDs they had on the server device.
+        """
+        server = self.device_info(entry_id)
+        cached = self._child_device_info.get((kind, item_id))
+        if cached is not None and cached[0] == name:
+            return cached[1]
+        label, model = CHILD_DEVICE_TYPES[kind]
+        device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{entry_id}_{kind}_{item_id}")},
+            name=f"{server['name']} {label} {name}",
+            manufacturer=MANUFACTURER,
+            model=model,
+            via_device=(DOMAIN, entry_id),
+        )
+        self._child_device_info[(kind, item_id)] = (name, device_info)
+        return device_info
+
+    def get_item(self, key: str, item_id: str) -> dict[str, Any] | None:
+        """
+        Return one item of an indexed list category.
+
+        Unchanged items keep their identity across updates, so entities can
+        compare the returned object with the one they last rendered.
+        """
+        return self._items.get(key, {}).get(item_id)
+
+    def _index_items(self, key: str, items: list[dict[str, Any]]) -> list[Any]:
+        """Index a list category, reusing the previous objects for unchanged items."""
+        id_fields = ITEM_ID_FIELDS[key]
+        previous = self._items.get(key, {})
+        index: dict[str, dict[str, Any]] = {}
+        stable: list[Any] = []
+        for item in items:
+            item_id = _item_id(item, id_fields)
+            if item_id is None:
+                stable.append(item)
+                continue
+            old = previous.get(item_id)
+            kept = old if old is not None and _same_item(old, item) else item
+            index[item_id] = kept
+            stable.append(kept)
+        self._items[key] = index
+
+        # Hand back the previous list when nothing changed at all
+        old_list = self.data.get(key) if self.data else None
+        if (
+            isinstance(old_list, list)
+            and len(old_list) == len(stable)
+            and all(a is b for a, b in zip(old_list, stable, strict=True))
+        ):
+            return old_list
+        return stable
+
+    async def async_apply_options(
+        self,
+        *,
+        update_interval: int,
+        enable_websocket: bool,
+        capture_path: str | None = None,
+    ) -> None:
+        """Apply a new polling interval and WebSocket settings to the running entry."""
+        if update_interval != self.base_interval:
+            _LOGGER.info("Polling interval changed to %d seconds", update_interval)
+            self.base_interval = update_interval
+            self._apply_poll_plan()
+            # Don't wait out a tick scheduled with the old interval
+            self._unschedule_refresh()
+            self._schedule_refresh()
+
+        if capture_path != self.capture_path:
+            self.capture_path = capture_path
+            if enable_websocket and self.enable_websocket:
+                # The capture is handed to the client when it starts
+                await self.async_stop_websocket()
+                await self.async_start_websocket()
+
+        if enable_websocket == self.enable_websocket:
+            return
+        self.enable_websocket = enable_websocket
+        if enable_websocket:
+            self._apply_poll_plan()
+            await self.async_start_websocket()
+            return
+
+        await self.async_stop_websocket()
+        # Without push there is nothing to recover from
+        self.degraded = False
+        self._apply_poll_plan()
+
+    async def async_load_snapshot(self) -> bool:
+        """
+        Load the last stored snapshot as stale data.
+
+        Returns True if a snapshot was found. The snapshot stays marked stale
+        until a refresh reaches the server; refreshes that reach nothing are
+        only failed once it has stood in for SNAPSHOT_STALE_GRACE.
+        """
+        if self._store is None:
+            return False
+        stored = await self._store.async_load()
+        if not stored or not stored.get("data"):
+            return False
+
+        data: dict[str, Any] = {
+            key: value
+            for key, value in stored["data"].items()
+            if key not in self.disabled_categories
+        }
+        for key, items in data.items():
+            if key in ITEM_ID_FIELDS and isinstance(items, list):
+                data[key] = self._index_items(key, items)
+        self.data = data
+        self.stale = True
+        self._stale_since = time.monotonic()
+        _LOGGER.debug("Starting from the snapshot saved at %s", stored.get("saved_at"))
+        return True
+
+    def seed_category(self, key: str, value: Any, fetched_at: float) -> None:
+        """
+        Use data fetched elsewhere instead of polling it again.
+
+        fetched_at is a time.monotonic() timestamp; the category is next
+        polled once its interval has passed since then.
+        """
+        if key in ITEM_ID_FIELDS and isinstance(value, list):
+            value = self._index_items(key, value)
+        self.data = {**(self.data or {}), key: value}
+        self._last_polled[key] = fetched_at
+
+    @callback
+    def _snapshot(self) -> dict[str, Any]:
+        """Return the data to store as the last good snapshot."""
+        self._save_pending = False
+        return {"saved_at": dt_util.utcnow().isoformat(), "data": self.data}
+
+    async def async_request_category_refresh(self, *keys: str) -> None:
+        """Request a refresh that re-fetches the given categories."""
+        for key in keys:
+            self._last_polled.pop(key, None)
+        await self.async_request_refresh()
+
     async def _async_update_data(self) -> dict[str, Any]:
         """
         Fetch data from API endpoint.
@@ -357,45 +901,56 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator):
         so entities can quickly look up their data.
         """
         try:
-            # Fetch all data in parallel
+            # Only fetch the categories that are due according to the poll plan
+            now = time.monotonic()
+            due = self._due_categories(now)
+            # Left over when the last refresh changed nothing
+            if self._updated_categories is not None:
+                self._updated_categories.clear()
             results = await asyncio.gather(
-                self.client.get_system_info(),
-                self.client.get_array_status(),
-                self.client.get_disks(),
-                self.client.get_containers(),
-                self.client.get_vms(),
-                self.client.get_ups_status(),
-                self.client.get_gpu_metrics(),
-                self.client.get_network_interfaces(),
+                *(getattr(self.client, CATEGORY_ENDPOINTS[key][0])() for key in due),
                 return_exceptions=True,
             )
-
-            # Process results
-            data = {
-                KEY_SYSTEM: results[0] if not isinstance(results[0], Exception) else {},
-                KEY_ARRAY: results[1] if not isinstance(results[1], Exception) else {},
-                KEY_DISKS: results[2] if not isinstance(results[2], Exception) else [],
-                KEY_CONTAINERS: (
-                    results[3] if not isinstance(results[3], Exception) else []
-                ),
-                KEY_VMS: results[4] if not isinstance(results[4], Exception) else [],
-                KEY_UPS: results[5] if not isinstance(results[5], Exception) else {},
-                KEY_GPU: results[6] if not isinstance(results[6], Exception) else [],
-                KEY_NETWORK: (
-                    results[7] if not isinstance(results[7], Exception) else []
-                ),
-            }
-
-            # Log any errors
-            for i, result in enumerate(results):
+            if due:
+                self.refresh_durations.add(time.monotonic() - now)
+
+            # Keep the previous data for categories that were not polled
+            data = dict(self.data) if self.data else {}
+            live = False
+            for key, result in zip(due, results, strict=True):
+                self._last_polled[key] = now
+                self._mark_updated(key)
                 if isinstance(result, Exception):
-                    _LOGGER.warning("Error fetching data for index %d: %s", i, result)
-
-            # Check for issues and create repair flows
-            await repairs.async_check_and_create_issues(self.hass, self)
+                    _LOGGER.warning("Error fetching %s data: %s", key, result)
+                    # Stale snapshot values beat empty ones
+                    if not self.stale or key not in data:
+                        data[key] = CATEGORY_ENDPOINTS[key][1]()
+                    continue
+                live = True
+                if key in ITEM_ID_FIELDS and isinstance(result, list):
+                    data[key] = self._index_items(key, result)
+                else:
+                    data[key] = result
+                self._observe(key, result)
+
+            # The snapshot only stands in for the server for a while
+            in_grace = self.stale and now - self._stale_since < SNAPSHOT_STALE_GRACE
+            if due and not live and not in_grace:
+                raise UpdateFailed(
+                    f"Unraid server did not answer any request: {results[0]}"
+                )
+            if live:
+                self.stale = False
+            # Every save request restarts the delay, so only ask for one
+            # when none is pending; the save writes the data current then
+            if self._store is not None and not self.stale and not self._save_pending:
+                self._save_pending = True
+                self._store.async_delay_save(self._snapshot, SNAPSHOT_SAVE_DELAY)
 
             return data
 
+        except UpdateFailed:
+            raise
         except Exception as err:
             _LOGGER.error("Error communicating with API: %s", err)
             raise UpdateFailed(f"Error communicating with API: {err}") from err
@@ -405,27 +960,76 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator):
         if not self.data:
             return
 
-        # Update coordinator data based on event type
-        if event_type == EVENT_SYSTEM_UPDATE:
-            self.data[KEY_SYSTEM] = data
-        elif event_type == EVENT_ARRAY_STATUS_UPDATE:
-            self.data[KEY_ARRAY] = data
-        elif event_type == EVENT_DISK_LIST_UPDATE:
-            self.data[KEY_DISKS] = data if isinstance(data, list) else [data]
-        elif event_type == EVENT_UPS_STATUS_UPDATE:
-            self.data[KEY_UPS] = data
-        elif event_type == EVENT_GPU_UPDATE:
-            self.data[KEY_GPU] = data if isinstance(data, list) else [data]
-        elif event_type == EVENT_NETWORK_LIST_UPDATE:
-            self.data[KEY_NETWORK] = data if isinstance(data, list) else [data]
-        elif event_type == EVENT_CONTAINER_LIST_UPDATE:
-            self.data[KEY_CONTAINERS] = data if isinstance(data, list) else [data]
-        elif event_type == EVENT_VM_LIST_UPDATE:
-            self.data[KEY_VMS] = data if isinstance(data, list) else [data]
+        key = EVENT_CATEGORIES.get(event_type)
+        if key is None or key in self.disabled_categories:
+            return
+
+        # List categories always receive a list, even for single-item events
+        if CATEGORY_ENDPOINTS[key][1] is list and not isinstance(data, list):
+            data = [data]
+        if key in ITEM_ID_FIELDS:
+            data = self._index_items(key, data)
+        self.data[key] = data
+        self._mark_updated(key)
+        self._observe(key, data)
+
+        # A push makes a slow REST poll, or a fast poll of a busy category,
+        # of the same category unnecessary
+        if (
+            key in CATEGORY_POLL_INTERVALS
+            or key in self._active_intervals
+            or self._confirming(key)
+        ):
+            self._last_polled[key] = time.monotonic()
 
         # Notify listeners of data update
         self.async_set_updated_data(self.data)
 
+    @callback
+    def _handle_websocket_connection(self, connected: bool) -> None:
+        """Switch polling in and out of degraded mode as push comes and goes."""
+        if connected:
+            # Only revert once push has stayed up for the recovery window
+            if self.degraded and self._cancel_recovery is None:
+                self._cancel_recovery = async_call_later(
+                    self.hass, DEGRADED_RECOVERY_DELAY, self._async_exit_degraded
+                )
+            return
+
+        if self._cancel_recovery is not None:
+            self._cancel_recovery()
+            self._cancel_recovery = None
+
+        if self.degraded:
+            return
+
+        _LOGGER.info(
+            "WebSocket down, polling %s every %d seconds",
+            ", ".join(DEGRADED_POLL_CATEGORIES),
+            DEGRADED_POLL_INTERVAL,
+        )
+        self.degraded = True
+        self._apply_poll_plan()
+        self.hass.async_create_task(
+            self.async_request_category_refresh(*DEGRADED_POLL_CATEGORIES)
+        )
+
+    @callback
+    def _async_exit_degraded(self, _now: datetime) -> None:
+        """Return to the normal poll plan after push has recovered."""
+        self._cancel_recovery = None
+        self.degraded = False
+        self._apply_poll_plan()
+        _LOGGER.info("WebSocket healthy again, restoring normal polling")
+
+    async def async_shutdown(self) -> None:
+        """Drop pending transitions and stop refreshing."""
+        for transition in self._transitions.values():
+            transition.cancel_timeout()
+        self._transitions.clear()
+        self._stop_ups_sampling()
+        await super().async_shutdown()
+
     async def async_start_websocket(self) -> None:
         """Start WebSocket connection for real-time updates."""
         if not self.enable_websocket:
@@ -436,14 +1040,31 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.debug("WebSocket already running")
             return
 
+        # Only loaded when push updates are enabled
+        websocket_client = await async_import_module(
+            self.hass, f"{__name__}.websocket_client"
+        )
+        if self.websocket_stats is None:
+            self.websocket_stats = websocket_client.UnraidWebSocketStats()
+
         try:
             # Create WebSocket client
-            ws_client = UnraidWebSocketClient(
+            ws_client = websocket_client.UnraidWebSocketClient(
                 host=self.client.host,
                 port=self.client.port,
                 session=self.client.session,
                 callback=self._handle_websocket_event,
+                stats=self.websocket_stats,
+                on_connection_change=self._handle_websocket_connection,
+                capture=(
+                    websocket_client.UnraidWebSocketCapture(
+                        self.hass, self.capture_path
+                    )
+                    if self.capture_path
+                    else None
+                ),
             )
+            self.websocket_client = ws_client
 
             # Start listening in background task
             self.websocket_task = asyncio.create_task(ws_client.listen())
@@ -455,6 +1076,9 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_stop_websocket(self) -> None:
         """Stop WebSocket connection."""
+        if self.websocket_client is not None:
+            # Close the socket too; cancelling the listener leaves it open
+            await self.websocket_client.disconnect()
         if self.websocket_task:
             self.websocket_task.cancel()
             try:
@@ -462,4 +1086,9 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator):
             except asyncio.CancelledError:
                 pass
             self.websocket_task = None
+            self.websocket_client = None
             _LOGGER.info("WebSocket client stopped")
+
+        if self._cancel_recovery is not None:
+            self._cancel_recovery()
+            self._cancel_recovery = None
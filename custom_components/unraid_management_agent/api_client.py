@@ -1,6 +1,14 @@
 """API client for Unraid Management Agent."""
 
+import asyncio
 import logging
+import time
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from functools import partial
 from typing import Any
 
 import aiohttp
@@ -35,10 +43,247 @@ from .const import (
     API_VM_RESUME,
     API_VM_START,
     API_VM_STOP,
+    REQUEST_DURATION_BUCKETS,
+    REQUEST_STATS_WINDOW,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Targets of control actions; actions on one target run one at a time
+TARGET_ARRAY = "array"
+TARGET_PARITY_CHECK = "parity_check"
+
+# Groups of control actions that set the same piece of state, so a later one
+# makes an earlier one that has not been sent yet pointless
+GROUP_POWER = "power"
+GROUP_PAUSE = "pause"
+
+
+@dataclass
+class _Action:
+    """A control action waiting for its target, or being sent."""
+
+    name: str
+    group: str | None
+    send: Callable[[], Awaitable[dict[str, Any]]]
+    enqueued: float = field(default_factory=time.monotonic)
+    # Callers waiting on the action, including those of actions it replaced
+    waiters: list[asyncio.Future[dict[str, Any]]] = field(default_factory=list)
+
+
+@dataclass
+class _TargetQueue:
+    """Control actions of one target, sent in order by a single worker."""
+
+    pending: deque[_Action] = field(default_factory=deque)
+    running: _Action | None = None
+    worker: asyncio.Task[None] | None = None
+
+
+class UnraidActionStats:
+    """
+    Queue depth and wait time statistics for control actions.
+
+    Wait time is measured from queueing an action until it is sent, so it
+    shows how long actions sit behind others on the same target.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.depths: dict[str, int] = {}
+        self.max_depth = 0
+        self.sent = 0
+        self.collapsed = 0
+        self.failed = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record_depth(self, target: str, depth: int) -> None:
+        """Record the number of actions waiting on a target."""
+        if depth:
+            self.depths[target] = depth
+        else:
+            self.depths.pop(target, None)
+        self.max_depth = max(self.max_depth, depth)
+
+    def record_sent(self, wait: float) -> None:
+        """Record an action leaving the queue after waiting for its target."""
+        self.sent += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+
+    @property
+    def queued(self) -> int:
+        """Return the number of actions currently waiting across targets."""
+        return sum(self.depths.values())
+
+    @property
+    def average_wait(self) -> float | None:
+        """Return the average wait time in seconds of sent actions."""
+        if not self.sent:
+            return None
+        return self.wait_total / self.sent
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all statistics as a dictionary."""
+        average_wait = self.average_wait
+        return {
+            "queued": self.queued,
+            "depths": dict(self.depths),
+            "max_depth": self.max_depth,
+            "sent": self.sent,
+            "collapsed": self.collapsed,
+            "failed": self.failed,
+            "avg_wait_ms": (
+                round(average_wait * 1000, 1) if average_wait is not None else None
+            ),
+            "max_wait_ms": round(self.wait_max * 1000, 1),
+        }
+
+
+class UnraidDurationHistogram:
+    """
+    Durations of recent requests or refreshes counted in fixed buckets.
+
+    Only the last REQUEST_STATS_WINDOW durations are counted, so the
+    histogram follows how responsive the server is now. Percentiles are
+    reported as the upper bound of the bucket they fall in.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        self.counts = [0] * len(REQUEST_DURATION_BUCKETS)
+        self._window: deque[int] = deque(maxlen=REQUEST_STATS_WINDOW)
+
+    def __len__(self) -> int:
+        """Return the number of durations counted."""
+        return len(self._window)
+
+    def add(self, duration: float) -> None:
+        """Count a duration in seconds, dropping the oldest one if full."""
+        bucket = min(
+            bisect_left(REQUEST_DURATION_BUCKETS, duration),
+            len(REQUEST_DURATION_BUCKETS) - 1,
+        )
+        if len(self._window) == self._window.maxlen:
+            self.counts[self._window[0]] -= 1
+        self._window.append(bucket)
+        self.counts[bucket] += 1
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the bucket bound in seconds below which fraction of durations are."""
+        if not self._window:
+            return None
+        rank = min(len(self._window) - 1, int(fraction * len(self._window)))
+        seen = 0
+        for bound, count in zip(REQUEST_DURATION_BUCKETS, self.counts, strict=True):
+            seen += count
+            if seen > rank:
+                return bound
+        return REQUEST_DURATION_BUCKETS[-1]
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the count of each bucket keyed by its upper bound."""
+        return {
+            f"le_{bound * 1000:g}ms": count
+            for bound, count in zip(REQUEST_DURATION_BUCKETS, self.counts, strict=True)
+        }
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    """Return seconds as milliseconds, keeping None."""
+    return round(seconds * 1000, 1) if seconds is not None else None
+
+
+@dataclass
+class _EndpointStats:
+    """Requests to one endpoint."""
+
+    requests: int = 0
+    errors: int = 0
+    durations: UnraidDurationHistogram = field(default_factory=UnraidDurationHistogram)
+    # Whether each recent request failed, for the rolling error rate
+    outcomes: deque[bool] = field(
+        default_factory=lambda: deque(maxlen=REQUEST_STATS_WINDOW)
+    )
+    last_bytes: int | None = None
+    max_bytes: int = 0
+    last_success: str | None = None
+    last_error: str | None = None
+    last_error_at: str | None = None
+
+    @property
+    def error_rate(self) -> float | None:
+        """Return the percentage of recent requests that failed."""
+        if not self.outcomes:
+            return None
+        return round(sum(self.outcomes) / len(self.outcomes) * 100, 1)
+
+
+class UnraidRequestStats:
+    """
+    Duration, payload size and outcome statistics per API endpoint.
+
+    Durations and the error rate cover the most recent requests; failed
+    requests count as errors and do not add a duration.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.endpoints: dict[str, _EndpointStats] = {}
+
+    def record_success(self, endpoint: str, duration: float, size: int) -> None:
+        """Record a request that returned a payload of size characters."""
+        stats = self.endpoints.setdefault(endpoint, _EndpointStats())
+        stats.requests += 1
+        stats.durations.add(duration)
+        stats.outcomes.append(False)
+        stats.last_bytes = size
+        stats.max_bytes = max(stats.max_bytes, size)
+        stats.last_success = datetime.now(UTC).isoformat()
+
+    def record_error(self, endpoint: str, err: Exception) -> None:
+        """Record a request that failed."""
+        stats = self.endpoints.setdefault(endpoint, _EndpointStats())
+        stats.requests += 1
+        stats.errors += 1
+        stats.outcomes.append(True)
+        # Only the type: connection errors name the server's address
+        stats.last_error = type(err).__name__
+        stats.last_error_at = datetime.now(UTC).isoformat()
+
+    @property
+    def error_rate(self) -> float | None:
+        """Return the percentage of recent requests to any endpoint that failed."""
+        failed = 0
+        total = 0
+        for stats in self.endpoints.values():
+            failed += sum(stats.outcomes)
+            total += len(stats.outcomes)
+        if not total:
+            return None
+        return round(failed / total * 100, 1)
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the statistics of each endpoint as a dictionary."""
+        summary: dict[str, dict[str, Any]] = {}
+        for endpoint, stats in sorted(self.endpoints.items()):
+            summary[endpoint] = {
+                "requests": stats.requests,
+                "errors": stats.errors,
+                "error_rate": stats.error_rate,
+                "p50_ms": _milliseconds(stats.durations.percentile(0.5)),
+                "p95_ms": _milliseconds(stats.durations.percentile(0.95)),
+                "p99_ms": _milliseconds(stats.durations.percentile(0.99)),
+                "histogram": stats.durations.as_dict(),
+                "last_bytes": stats.last_bytes,
+                "max_bytes": stats.max_bytes,
+                "last_success": stats.last_success,
+                "last_error": stats.last_error,
+                "last_error_at": stats.last_error_at,
+            }
+        return summary
+
 
 class UnraidAPIClient:
     """API client for Unraid Management Agent."""
@@ -54,16 +299,27 @@ class UnraidAPIClient:
         self.port = port
         self.session = session
         self.base_url = f"http://{host}:{port}"
+        self.action_stats = UnraidActionStats()
+        self.request_stats = UnraidRequestStats()
+        self._queues: dict[str, _TargetQueue] = {}
 
     async def _request(
         self,
         method: str,
         endpoint: str,
         timeout: int = 10,
+        stats_key: str | None = None,
         **kwargs: Any,
     ) -> dict[str, Any] | list[dict[str, Any]]:
-        """Make a request to the API."""
+        """
+        Make a request to the API.
+
+        Its duration and outcome are recorded under stats_key, or under the
+        endpoint if there is none.
+        """
         url = f"{self.base_url}{endpoint}"
+        stats_key = stats_key or endpoint
+        started = time.monotonic()
 
         try:
             async with async_timeout.timeout(timeout):
@@ -89,6 +345,9 @@ class UnraidAPIClient:
                         if data is None:
                             _LOGGER.error("API returned null/None from %s", url)
                             raise ValueError(f"API returned null from {url}")
+                        self.request_stats.record_success(
+                            stats_key, time.monotonic() - started, len(text)
+                        )
                         return data
                     except ValueError as json_err:
                         _LOGGER.error(
@@ -100,12 +359,15 @@ class UnraidAPIClient:
                         raise
         except TimeoutError as err:
             _LOGGER.error("Timeout connecting to %s", url)
+            self.request_stats.record_error(stats_key, err)
             raise TimeoutError(f"Timeout connecting to {url}") from err
         except aiohttp.ClientError as err:
             _LOGGER.error("Error connecting to %s: %s", url, err)
+            self.request_stats.record_error(stats_key, err)
             raise ConnectionError(f"Error connecting to {url}: {err}") from err
         except Exception as err:
             _LOGGER.error("Unexpected error connecting to %s: %s", url, err)
+            self.request_stats.record_error(stats_key, err)
             raise
 
     async def _get(
@@ -118,6 +380,85 @@ class UnraidAPIClient:
         """Make a POST request."""
         return await self._request("POST", endpoint, **kwargs)
 
+    async def _control(
+        self, target: str, name: str, endpoint: str, group: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Send a control action once earlier actions on the same target are done.
+
+        Actions on different targets run concurrently. An action of a group
+        replaces the actions of that group queued right before it, and joins
+        the action being sent if that is the same one, so start, stop, start
+        sends a single start. Callers of a replaced action that is the same
+        as its replacement get the result of the replacement; those of a
+        different one get UnraidActionSupersededError, as it was never sent.
+        """
+        queue = self._queues.setdefault(target, _TargetQueue())
+        future: asyncio.Future[dict[str, Any]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        waiters = [future]
+
+        if group is not None:
+            while queue.pending and queue.pending[-1].group == group:
+                replaced = queue.pending.pop()
+                self.action_stats.collapsed += 1
+                _LOGGER.debug("Dropped queued %s of %s", replaced.name, target)
+                if replaced.name == name:
+                    waiters.extend(replaced.waiters)
+                    continue
+                err = UnraidActionSupersededError(
+                    f"{replaced.name} of {target} was replaced by {name} "
+                    "before it was sent"
+                )
+                for waiter in replaced.waiters:
+                    if not waiter.done():
+                        waiter.set_exception(err)
+
+        running = queue.running
+        if not queue.pending and running is not None and running.name == name:
+            running.waiters.extend(waiters)
+            self.action_stats.collapsed += 1
+        else:
+            queue.pending.append(
+                _Action(
+                    name,
+                    group,
+                    # Recorded per action; the endpoint holds the item id
+                    partial(self._post, endpoint, stats_key=name),
+                    waiters=waiters,
+                )
+            )
+            if queue.worker is None:
+                queue.worker = asyncio.get_running_loop().create_task(
+                    self._run_queue(target, queue)
+                )
+        self.action_stats.record_depth(target, len(queue.pending))
+
+        return await future
+
+    async def _run_queue(self, target: str, queue: _TargetQueue) -> None:
+        """Send the actions queued on a target until none are left."""
+        try:
+            while queue.pending:
+                action = queue.running = queue.pending.popleft()
+                self.action_stats.record_depth(target, len(queue.pending))
+                self.action_stats.record_sent(time.monotonic() - action.enqueued)
+                try:
+                    result = await action.send()
+                except Exception as err:
+                    self.action_stats.failed += 1
+                    for waiter in action.waiters:
+                        if not waiter.done():
+                            waiter.set_exception(err)
+                else:
+                    for waiter in action.waiters:
+                        if not waiter.done():
+                            waiter.set_result(result)
+        finally:
+            queue.running = None
+            del self._queues[target]
+
     # Health check
     async def health_check(self) -> dict[str, Any]:
         """Check if the API is healthy."""
@@ -135,27 +476,48 @@ class UnraidAPIClient:
 
     async def start_array(self) -> dict[str, Any]:
         """Start the array."""
-        return await self._post(API_ARRAY_START)
+        return await self._control(
+            TARGET_ARRAY, "start_array", API_ARRAY_START, GROUP_POWER
+        )
 
     async def stop_array(self) -> dict[str, Any]:
         """Stop the array."""
-        return await self._post(API_ARRAY_STOP)
+        return await self._control(
+            TARGET_ARRAY, "stop_array", API_ARRAY_STOP, GROUP_POWER
+        )
 
     async def start_parity_check(self) -> dict[str, Any]:
         """Start a parity check."""
-        return await self._post(API_PARITY_CHECK_START)
+        return await self._control(
+            TARGET_PARITY_CHECK,
+            "start_parity_check",
+            API_PARITY_CHECK_START,
+            GROUP_POWER,
+        )
 
     async def stop_parity_check(self) -> dict[str, Any]:
         """Stop the parity check."""
-        return await self._post(API_PARITY_CHECK_STOP)
+        return await self._control(
+            TARGET_PARITY_CHECK, "stop_parity_check", API_PARITY_CHECK_STOP, GROUP_POWER
+        )
 
     async def pause_parity_check(self) -> dict[str, Any]:
         """Pause the parity check."""
-        return await self._post(API_PARITY_CHECK_PAUSE)
+        return await self._control(
+            TARGET_PARITY_CHECK,
+            "pause_parity_check",
+            API_PARITY_CHECK_PAUSE,
+            GROUP_PAUSE,
+        )
 
     async def resume_parity_check(self) -> dict[str, Any]:
         """Resume the parity check."""
-        return await self._post(API_PARITY_CHECK_RESUME)
+        return await self._control(
+            TARGET_PARITY_CHECK,
+            "resume_parity_check",
+            API_PARITY_CHECK_RESUME,
+            GROUP_PAUSE,
+        )
 
     # Disks
     async def get_disks(self) -> list[dict[str, Any]]:
@@ -175,27 +537,37 @@ class UnraidAPIClient:
     async def start_container(self, container_id: str) -> dict[str, Any]:
         """Start a Docker container."""
         endpoint = API_DOCKER_START.format(id=container_id)
-        return await self._post(endpoint)
+        return await self._control(
+            f"container:{container_id}", "start_container", endpoint, GROUP_POWER
+        )
 
     async def stop_container(self, container_id: str) -> dict[str, Any]:
         """Stop a Docker container."""
         endpoint = API_DOCKER_STOP.format(id=container_id)
-        return await self._post(endpoint)
+        return await self._control(
+            f"container:{container_id}", "stop_container", endpoint, GROUP_POWER
+        )
 
     async def restart_container(self, container_id: str) -> dict[str, Any]:
         """Restart a Docker container."""
         endpoint = API_DOCKER_RESTART.format(id=container_id)
-        return await self._post(endpoint)
+        return await self._control(
+            f"container:{container_id}", "restart_container", endpoint
+        )
 
     async def pause_container(self, container_id: str) -> dict[str, Any]:
         """Pause a Docker container."""
         endpoint = API_DOCKER_PAUSE.format(id=container_id)
-        return await self._post(endpoint)
+        return await self._control(
+            f"container:{container_id}", "pause_container", endpoint, GROUP_PAUSE
+        )
 
     async def unpause_container(self, container_id: str) -> dict[str, Any]:
         """Unpause (resume) a Docker container."""
         endpoint = API_DOCKER_UNPAUSE.format(id=container_id)
-        return await self._post(endpoint)
+        return await self._control(
+            f"container:{container_id}", "unpause_container", endpoint, GROUP_PAUSE
+        )
 
     # Virtual machines
     async def get_vms(self) -> list[dict[str, Any]]:
@@ -205,37 +577,39 @@ class UnraidAPIClient:
     async def start_vm(self, vm_id: str) -> dict[str, Any]:
         """Start a virtual machine."""
         endpoint = API_VM_START.format(id=vm_id)
-        return await self._post(endpoint)
+        return await self._control(f"vm:{vm_id}", "start_vm", endpoint, GROUP_POWER)
 
     async def stop_vm(self, vm_id: str) -> dict[str, Any]:
         """Stop a virtual machine."""
         endpoint = API_VM_STOP.format(id=vm_id)
-        return await self._post(endpoint)
+        return await self._control(f"vm:{vm_id}", "stop_vm", endpoint, GROUP_POWER)
 
     async def restart_vm(self, vm_id: str) -> dict[str, Any]:
         """Restart a virtual machine."""
         endpoint = API_VM_RESTART.format(id=vm_id)
-        return await self._post(endpoint)
+        return await self._control(f"vm:{vm_id}", "restart_vm", endpoint)
 
     async def pause_vm(self, vm_id: str) -> dict[str, Any]:
         """Pause a virtual machine (suspend to RAM)."""
         endpoint = API_VM_PAUSE.format(id=vm_id)
-        return await self._post(endpoint)
+        return await self._control(f"vm:{vm_id}", "pause_vm", endpoint, GROUP_PAUSE)
 
     async def resume_vm(self, vm_id: str) -> dict[str, Any]:
         """Resume a paused virtual machine."""
         endpoint = API_VM_RESUME.format(id=vm_id)
-        return await self._post(endpoint)
+        return await self._control(f"vm:{vm_id}", "resume_vm", endpoint, GROUP_PAUSE)
 
     async def hibernate_vm(self, vm_id: str) -> dict[str, Any]:
         """Hibernate a virtual machine (suspend to disk)."""
         endpoint = API_VM_HIBERNATE.format(id=vm_id)
-        return await self._post(endpoint)
+        return await self._control(f"vm:{vm_id}", "hibernate_vm", endpoint, GROUP_POWER)
 
     async def force_stop_vm(self, vm_id: str) -> dict[str, Any]:
         """Force stop a virtual machine (power off)."""
         endpoint = API_VM_FORCE_STOP.format(id=vm_id)
-        return await self._post(endpoint)
+        return await self._control(
+            f"vm:{vm_id}", "force_stop_vm", endpoint, GROUP_POWER
+        )
 
     # UPS status
     async def get_ups_status(self) -> dict[str, Any]:
@@ -263,3 +637,7 @@ class UnraidConnectionError(UnraidAPIError):
 
 class UnraidTimeoutError(UnraidAPIError):
     """Exception for timeout errors."""
+
+
+class UnraidActionSupersededError(UnraidAPIError):
+    """Exception for a queued action replaced by another before it was sent."""
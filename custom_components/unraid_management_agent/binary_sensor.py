@@ -12,6 +12,7 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -26,10 +27,7 @@ from .const import (
     ICON_UPS,
     KEY_ARRAY,
     KEY_NETWORK,
-    KEY_SYSTEM,
     KEY_UPS,
-    MANUFACTURER,
-    MODEL,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -97,29 +95,28 @@ async def async_setup_entry(
 class UnraidBinarySensorBase(CoordinatorEntity, BinarySensorEntity):
     """Base class for Unraid binary sensors."""
 
+    # Coordinator category the sensor reads, None to follow every update
+    _category: str | None = None
+
     def __init__(
         self,
         coordinator: UnraidDataUpdateCoordinator,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, self._category)
         self._attr_has_entity_name = True
         self._entry = entry
 
     @property
-    def device_info(self) -> dict[str, Any]:
+    def device_info(self) -> DeviceInfo:
         """Return device information."""
-        system_data = self.coordinator.data.get(KEY_SYSTEM, {})
-        hostname = system_data.get("hostname", "Unraid")
+        return self.coordinator.device_info(self._entry.entry_id)
 
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": f"Unraid ({hostname})",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": system_data.get("version", "Unknown"),
-        }
+    @property
+    def assumed_state(self) -> bool:
+        """Return True while the state comes from the stored snapshot."""
+        return self.coordinator.stale
 
 
 # Array Binary Sensors
@@ -132,6 +129,7 @@ class UnraidArrayStartedBinarySensor(UnraidBinarySensorBase):
     _attr_device_class = BinarySensorDeviceClass.RUNNING
     _attr_icon = ICON_ARRAY
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _category = KEY_ARRAY
 
     @property
     def unique_id(self) -> str:
@@ -152,6 +150,7 @@ class UnraidParityCheckRunningBinarySensor(UnraidBinarySensorBase):
     _attr_device_class = BinarySensorDeviceClass.RUNNING
     _attr_icon = ICON_PARITY
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _category = KEY_ARRAY
 
     @property
     def unique_id(self) -> str:
@@ -184,6 +183,7 @@ class UnraidParityValidBinarySensor(UnraidBinarySensorBase):
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
     _attr_icon = ICON_PARITY
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _category = KEY_ARRAY
 
     @property
     def unique_id(self) -> str:
@@ -211,6 +211,7 @@ class UnraidUPSConnectedBinarySensor(UnraidBinarySensorBase):
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
     _attr_icon = ICON_UPS
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _category = KEY_UPS
 
     @property
     def unique_id(self) -> str:
@@ -229,6 +230,8 @@ class UnraidUPSConnectedBinarySensor(UnraidBinarySensorBase):
 class UnraidNetworkInterfaceBinarySensor(UnraidBinarySensorBase):
     """Network interface up/down binary sensor."""
 
+    _category = KEY_NETWORK
+
     def __init__(
         self,
         coordinator: UnraidDataUpdateCoordinator,
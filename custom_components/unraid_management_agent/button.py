@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -18,9 +18,7 @@ from .const import (
     ERROR_CONTROL_FAILED,
     ICON_ARRAY,
     ICON_PARITY,
-    KEY_SYSTEM,
-    MANUFACTURER,
-    MODEL,
+    KEY_ARRAY,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -47,29 +45,23 @@ async def async_setup_entry(
 class UnraidButtonBase(CoordinatorEntity, ButtonEntity):
     """Base class for Unraid buttons."""
 
+    # Buttons have no state of their own; following the array is enough
+    _category = KEY_ARRAY
+
     def __init__(
         self,
         coordinator: UnraidDataUpdateCoordinator,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the button."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, self._category)
         self._attr_has_entity_name = True
         self._entry = entry
 
     @property
-    def device_info(self) -> dict[str, Any]:
+    def device_info(self) -> DeviceInfo:
         """Return device information."""
-        system_data = self.coordinator.data.get(KEY_SYSTEM, {})
-        hostname = system_data.get("hostname", "Unraid")
-
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": f"Unraid ({hostname})",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": system_data.get("version", "Unknown"),
-        }
+        return self.coordinator.device_info(self._entry.entry_id)
 
 
 # Array Control Buttons
@@ -92,7 +84,7 @@ class UnraidArrayStartButton(UnraidButtonBase):
             await self.coordinator.client.start_array()
             _LOGGER.info("Array start command sent")
             # Request immediate update
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_category_refresh(KEY_ARRAY)
         except Exception as err:
             _LOGGER.error("Failed to start array: %s", err)
             raise HomeAssistantError(
@@ -117,7 +109,7 @@ class UnraidArrayStopButton(UnraidButtonBase):
             await self.coordinator.client.stop_array()
             _LOGGER.info("Array stop command sent")
             # Request immediate update
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_category_refresh(KEY_ARRAY)
         except Exception as err:
             _LOGGER.error("Failed to stop array: %s", err)
             raise HomeAssistantError(
@@ -145,7 +137,7 @@ class UnraidParityCheckStartButton(UnraidButtonBase):
             await self.coordinator.client.start_parity_check()
             _LOGGER.info("Parity check start command sent")
             # Request immediate update
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_category_refresh(KEY_ARRAY)
         except Exception as err:
             _LOGGER.error("Failed to start parity check: %s", err)
             raise HomeAssistantError(
@@ -170,7 +162,7 @@ class UnraidParityCheckStopButton(UnraidButtonBase):
             await self.coordinator.client.stop_parity_check()
             _LOGGER.info("Parity check stop command sent")
             # Request immediate update
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_category_refresh(KEY_ARRAY)
         except Exception as err:
             _LOGGER.error("Failed to stop parity check: %s", err)
             raise HomeAssistantError(
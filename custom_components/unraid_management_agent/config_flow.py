@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any
 
 import voluptuous as vol
@@ -15,15 +16,28 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api_client import UnraidAPIClient
 from .const import (
+    CONF_CAPTURE_WEBSOCKET,
+    CONF_DISABLED_CATEGORIES,
+    CONF_DISK_TEMPERATURE_THRESHOLD,
     CONF_ENABLE_WEBSOCKET,
+    CONF_PARITY_STALL_MINUTES,
+    CONF_SMART_ERROR_DELTA,
     CONF_UPDATE_INTERVAL,
+    CONF_UPS_LOAD_THRESHOLD,
+    DATA_FLOW_SYSTEM,
+    DEFAULT_CAPTURE_WEBSOCKET,
+    DEFAULT_DISK_TEMPERATURE_THRESHOLD,
     DEFAULT_ENABLE_WEBSOCKET,
+    DEFAULT_PARITY_STALL_MINUTES,
     DEFAULT_PORT,
+    DEFAULT_SMART_ERROR_DELTA,
     DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_UPS_LOAD_THRESHOLD,
     DOMAIN,
     ERROR_CANNOT_CONNECT,
     ERROR_TIMEOUT,
     ERROR_UNKNOWN,
+    OPTIONAL_CATEGORIES,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -65,6 +79,8 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         return {
             "title": f"Unraid ({hostname})",
             "hostname": hostname,
+            "system_info": system_info,
+            "fetched_at": time.monotonic(),
         }
     except TimeoutError as err:
         _LOGGER.error("Timeout connecting to Unraid server: %s", err)
@@ -105,6 +121,12 @@ class UnraidConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 )
                 self._abort_if_unique_id_configured()
 
+                # Setup uses this instead of fetching /system again
+                self.hass.data.setdefault(DATA_FLOW_SYSTEM, {})[self.unique_id] = (
+                    info["fetched_at"],
+                    info["system_info"],
+                )
+
                 return self.async_create_entry(
                     title=info["title"],
                     data=user_input,
@@ -122,16 +144,12 @@ class UnraidConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         config_entry: config_entries.ConfigEntry,
     ) -> UnraidOptionsFlowHandler:
         """Get the options flow for this handler."""
-        return UnraidOptionsFlowHandler(config_entry)
+        return UnraidOptionsFlowHandler()
 
 
 class UnraidOptionsFlowHandler(config_entries.OptionsFlow):
     """Handle options flow for Unraid Management Agent."""
 
-    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
-        """Initialize options flow."""
-        self.config_entry = config_entry
-
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -155,6 +173,43 @@ class UnraidOptionsFlowHandler(config_entries.OptionsFlow):
                             CONF_ENABLE_WEBSOCKET, DEFAULT_ENABLE_WEBSOCKET
                         ),
                     ): cv.boolean,
+                    vol.Optional(
+                        CONF_DISABLED_CATEGORIES,
+                        default=self.config_entry.options.get(
+                            CONF_DISABLED_CATEGORIES, []
+                        ),
+                    ): cv.multi_select(OPTIONAL_CATEGORIES),
+                    vol.Optional(
+                        CONF_DISK_TEMPERATURE_THRESHOLD,
+                        default=self.config_entry.options.get(
+                            CONF_DISK_TEMPERATURE_THRESHOLD,
+                            DEFAULT_DISK_TEMPERATURE_THRESHOLD,
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=30, max=80)),
+                    vol.Optional(
+                        CONF_SMART_ERROR_DELTA,
+                        default=self.config_entry.options.get(
+                            CONF_SMART_ERROR_DELTA, DEFAULT_SMART_ERROR_DELTA
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
+                    vol.Optional(
+                        CONF_PARITY_STALL_MINUTES,
+                        default=self.config_entry.options.get(
+                            CONF_PARITY_STALL_MINUTES, DEFAULT_PARITY_STALL_MINUTES
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=1440)),
+                    vol.Optional(
+                        CONF_UPS_LOAD_THRESHOLD,
+                        default=self.config_entry.options.get(
+                            CONF_UPS_LOAD_THRESHOLD, DEFAULT_UPS_LOAD_THRESHOLD
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10, max=100)),
+                    vol.Optional(
+                        CONF_CAPTURE_WEBSOCKET,
+                        default=self.config_entry.options.get(
+                            CONF_CAPTURE_WEBSOCKET, DEFAULT_CAPTURE_WEBSOCKET
+                        ),
+                    ): cv.boolean,
                 }
             ),
         )
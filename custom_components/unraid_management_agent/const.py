@@ -11,11 +11,34 @@ CONF_HOST: Final = "host"
 CONF_PORT: Final = "port"
 CONF_UPDATE_INTERVAL: Final = "update_interval"
 CONF_ENABLE_WEBSOCKET: Final = "enable_websocket"
+CONF_CAPTURE_WEBSOCKET: Final = "capture_websocket"
+CONF_DISABLED_CATEGORIES: Final = "disabled_categories"
+CONF_DISK_TEMPERATURE_THRESHOLD: Final = "disk_temperature_threshold"
+CONF_SMART_ERROR_DELTA: Final = "smart_error_delta"
+CONF_PARITY_STALL_MINUTES: Final = "parity_stall_minutes"
+CONF_UPS_LOAD_THRESHOLD: Final = "ups_load_threshold"
 
 # Default values
 DEFAULT_PORT: Final = 8043
 DEFAULT_UPDATE_INTERVAL: Final = 30  # seconds
 DEFAULT_ENABLE_WEBSOCKET: Final = True
+DEFAULT_CAPTURE_WEBSOCKET: Final = False
+DEFAULT_DISK_TEMPERATURE_THRESHOLD: Final = 50  # °C
+DEFAULT_SMART_ERROR_DELTA: Final = 1
+DEFAULT_PARITY_STALL_MINUTES: Final = 60
+DEFAULT_UPS_LOAD_THRESHOLD: Final = 80  # %
+
+# Health checks
+# A raised issue only clears once the value is this far back below its
+# threshold, so a value hovering at the threshold does not flap
+DISK_TEMPERATURE_HYSTERESIS: Final = 5  # °C
+UPS_LOAD_HYSTERESIS: Final = 10  # %
+# A condition must hold this long before its issue is raised or cleared
+ISSUE_DWELL_TIME: Final = 300  # seconds
+# Storage of what the health checks remember across restarts, such as the
+# SMART error count new errors are counted from
+HEALTH_STORAGE_VERSION: Final = 1
+HEALTH_SAVE_DELAY: Final = 10  # seconds
 
 # Update intervals
 UPDATE_INTERVAL: Final = timedelta(seconds=DEFAULT_UPDATE_INTERVAL)
@@ -29,6 +52,29 @@ WEBSOCKET_RECONNECT_DELAY: Final = [
     60,
 ]  # Exponential backoff in seconds
 WEBSOCKET_MAX_RETRIES: Final = 10
+WEBSOCKET_RECONNECT_HISTORY: Final = 20  # Connection events kept for diagnostics
+# Captured frames are written to the capture file in batches of this size
+WEBSOCKET_CAPTURE_BATCH: Final = 100
+# A capture file reaching this size in bytes is moved aside to
+# "<file>.1", replacing the one moved aside before, and a new file started
+WEBSOCKET_CAPTURE_MAX_BYTES: Final = 50 * 1024 * 1024
+# Recent requests per endpoint, and refreshes, that the duration histograms
+# and error rates cover
+REQUEST_STATS_WINDOW: Final = 100
+# Upper bounds in seconds of the duration histogram buckets; the last one
+# is the request timeout, so it takes every request
+REQUEST_DURATION_BUCKETS: Final = (
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
 
 # API endpoints
 API_BASE: Final = "/api/v1"
@@ -77,6 +123,9 @@ EVENT_UPS_STATUS_UPDATE: Final = "ups_status_update"
 EVENT_GPU_UPDATE: Final = "gpu_update"
 EVENT_NETWORK_LIST_UPDATE: Final = "network_list_update"
 
+# Home Assistant events fired by the integration
+EVENT_UPS_POWER_CHANGED: Final = f"{DOMAIN}_ups_power_changed"
+
 # Entity keys
 KEY_SYSTEM: Final = "system"
 KEY_ARRAY: Final = "array"
@@ -88,6 +137,73 @@ KEY_UPS: Final = "ups"
 KEY_GPU: Final = "gpu"
 KEY_NETWORK: Final = "network"
 
+# Data categories that can be disabled in the options, with their labels;
+# a disabled category is never polled and gets no entities
+OPTIONAL_CATEGORIES: Final = {
+    KEY_DISKS: "Disks",
+    KEY_SHARES: "Shares",
+    KEY_CONTAINERS: "Docker containers",
+    KEY_VMS: "Virtual machines",
+    KEY_UPS: "UPS",
+    KEY_GPU: "GPU",
+    KEY_NETWORK: "Network interfaces",
+}
+
+# Polling plan
+# While the WebSocket is down, these categories are polled faster so their
+# sensors stay fresh without push updates.
+DEGRADED_POLL_CATEGORIES: Final = (KEY_SYSTEM, KEY_ARRAY, KEY_UPS)
+DEGRADED_POLL_INTERVAL: Final = 10  # seconds
+# Push must stay connected this long before polling reverts to normal
+DEGRADED_RECOVERY_DELAY: Final = 60  # seconds
+# Categories with something in progress (parity check, mover, array start
+# or stop) are polled this fast; once idle, their interval doubles on every
+# poll until it is back at the normal rate
+ACTIVE_POLL_INTERVAL: Final = 5  # seconds
+ACTIVE_POLL_DECAY: Final = 2
+# A UPS on battery is sampled this fast until line power returns
+UPS_ON_BATTERY_POLL_INTERVAL: Final = 2  # seconds
+# A container or VM that was switched holds its new state until a poll or
+# push confirms it, for at most this long; see async_start_transition
+TRANSITION_TIMEOUT: Final = 120  # seconds
+# Default time a service call with wait_for_state waits for the new state
+DEFAULT_WAIT_TIMEOUT: Final = 120  # seconds
+# Share usage changes slowly and is pushed, so REST is only a fallback
+SHARE_POLL_INTERVAL: Final = 300  # seconds
+# UPS status is pushed and sampled fast on battery, so REST is only a fallback
+UPS_POLL_INTERVAL: Final = 180  # seconds
+# Categories polled less often than the configured update interval while
+# push updates are enabled
+CATEGORY_POLL_INTERVALS: Final = {
+    KEY_SHARES: SHARE_POLL_INTERVAL,
+    KEY_UPS: UPS_POLL_INTERVAL,
+}
+
+# Fields identifying each item in list categories that are indexed by the
+# coordinator for per-item lookups and change detection (first one present)
+ITEM_ID_FIELDS: Final = {
+    KEY_CONTAINERS: ("id", "container_id", "name"),
+    KEY_DISKS: ("id", "name"),
+    KEY_GPU: ("uuid", "pci_id", "id", "name"),
+    KEY_SHARES: ("name",),
+    KEY_VMS: ("id", "name"),
+}
+
+# Last good snapshot kept in HA storage so entities come up before the
+# server answers; saves are coalesced to at most one per delay
+SNAPSHOT_STORAGE_VERSION: Final = 1
+SNAPSHOT_SAVE_DELAY: Final = 60  # seconds
+# Polls that reach no server fail again once the snapshot has stood in for
+# this long, so entities go unavailable and repairs see the outage
+SNAPSHOT_STALE_GRACE: Final = 300  # seconds
+
+# hass.data key for the /system data a config flow fetched, by unique ID
+DATA_FLOW_SYSTEM: Final = f"{DOMAIN}_flow_system"
+
+# Number of fullest shares reported by the summary sensor; the per-share
+# sensors for these are also the only ones enabled by default
+SHARE_SUMMARY_TOP_N: Final = 5
+
 # Sensor types
 SENSOR_CPU_USAGE: Final = "cpu_usage"
 SENSOR_RAM_USAGE: Final = "ram_usage"
@@ -102,6 +218,11 @@ SENSOR_GPU_POWER: Final = "gpu_power"
 SENSOR_UPS_BATTERY: Final = "ups_battery"
 SENSOR_UPS_LOAD: Final = "ups_load"
 SENSOR_UPS_RUNTIME: Final = "ups_runtime"
+SENSOR_SHARE_USAGE: Final = "share_usage"
+SENSOR_SHARES_TOP: Final = "shares_top"
+SENSOR_WEBSOCKET_MESSAGES: Final = "websocket_messages"
+SENSOR_WEBSOCKET_LATENCY: Final = "websocket_latency"
+SENSOR_WEBSOCKET_RECONNECTS: Final = "websocket_reconnects"
 
 # Binary sensor types
 BINARY_SENSOR_ARRAY_STARTED: Final = "array_started"
@@ -126,6 +247,8 @@ BUTTON_CONTAINER_RESTART: Final = "container_restart"
 # Device info
 MANUFACTURER: Final = "Lime Technology"
 MODEL: Final = "Unraid Server"
+MODEL_CONTAINER: Final = "Docker Container"
+MODEL_VM: Final = "Virtual Machine"
 
 # Attributes
 ATTR_HOSTNAME: Final = "hostname"
@@ -156,6 +279,10 @@ ATTR_NETWORK_SPEED: Final = "network_speed"
 ATTR_UPS_STATUS: Final = "ups_status"
 ATTR_UPS_MODEL: Final = "ups_model"
 
+# Service fields
+ATTR_WAIT_FOR_STATE: Final = "wait_for_state"
+ATTR_TIMEOUT: Final = "timeout"
+
 # Icons
 ICON_CPU: Final = "mdi:cpu-64-bit"
 ICON_MEMORY: Final = "mdi:memory"
@@ -172,6 +299,10 @@ ICON_POWER: Final = "mdi:power"
 ICON_START: Final = "mdi:play"
 ICON_STOP: Final = "mdi:stop"
 ICON_RESTART: Final = "mdi:restart"
+ICON_WEBSOCKET: Final = "mdi:lan-connect"
+ICON_REFRESH_TIME: Final = "mdi:timer-outline"
+ICON_ERROR_RATE: Final = "mdi:alert-circle-outline"
+ICON_SHARE: Final = "mdi:folder-network"
 
 # Error messages
 ERROR_CANNOT_CONNECT: Final = "cannot_connect"
@@ -0,0 +1,89 @@
+"""Diagnostics support for Unraid Management Agent."""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from . import UnraidDataUpdateCoordinator
+from .const import DOMAIN
+
+TO_REDACT = {CONF_HOST}
+# Fields of the data snapshot that identify the server or its network
+TO_REDACT_DATA = {
+    "hostname",
+    "ip_address",
+    "mac_address",
+    "serial",
+    "serial_number",
+    "uuid",
+}
+
+
+def _entity_counts(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: UnraidDataUpdateCoordinator
+) -> dict[str, Any]:
+    """Return the number of entities of the entry per platform and category."""
+    entities = er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+    return {
+        "total": len(entities),
+        "disabled": sum(1 for entity in entities if entity.disabled),
+        "platforms": dict(Counter(entity.domain for entity in entities)),
+        # Enabled entities by the data category whose updates they follow
+        "categories": coordinator.entity_categories,
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: UnraidDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    data = coordinator.data or {}
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "setup_timings": {
+            milestone: round(seconds, 3)
+            for milestone, seconds in coordinator.setup_timings.items()
+        },
+        "polling": {
+            "update_interval": coordinator.update_interval.total_seconds(),
+            "degraded": coordinator.degraded,
+            "stale": coordinator.stale,
+            "plan": coordinator.poll_plan,
+            "ups_sample_interval": coordinator.ups_sample_interval,
+            "seconds_since_poll": {
+                key: round(age, 1) for key, age in coordinator.poll_ages.items()
+            },
+        },
+        "requests": coordinator.client.request_stats.as_dict(),
+        "websocket": {
+            "enabled": coordinator.enable_websocket,
+            "connected": (
+                coordinator.websocket_client is not None
+                and coordinator.websocket_client.is_connected
+            ),
+            "capture_path": coordinator.capture_path,
+            **(
+                coordinator.websocket_stats.as_dict()
+                if coordinator.websocket_stats is not None
+                else {}
+            ),
+        },
+        "actions": coordinator.client.action_stats.as_dict(),
+        "cardinality": {
+            key: len(value) for key, value in data.items() if isinstance(value, list)
+        },
+        "entities": _entity_counts(hass, entry, coordinator),
+        "snapshot": async_redact_data(data, TO_REDACT | TO_REDACT_DATA),
+    }
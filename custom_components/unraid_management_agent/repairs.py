@@ -3,18 +3,92 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, NamedTuple
 
 from homeassistant import data_entry_flow
 from homeassistant.components.repairs import RepairsFlow
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import issue_registry as ir
-
-from .const import DOMAIN
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_DISK_TEMPERATURE_THRESHOLD,
+    CONF_PARITY_STALL_MINUTES,
+    CONF_SMART_ERROR_DELTA,
+    CONF_UPS_LOAD_THRESHOLD,
+    DEFAULT_DISK_TEMPERATURE_THRESHOLD,
+    DEFAULT_PARITY_STALL_MINUTES,
+    DEFAULT_SMART_ERROR_DELTA,
+    DEFAULT_UPS_LOAD_THRESHOLD,
+    DISK_TEMPERATURE_HYSTERESIS,
+    DOMAIN,
+    HEALTH_SAVE_DELAY,
+    HEALTH_STORAGE_VERSION,
+    ISSUE_DWELL_TIME,
+    ITEM_ID_FIELDS,
+    KEY_ARRAY,
+    KEY_DISKS,
+    KEY_UPS,
+    UPS_LOAD_HYSTERESIS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class Issue(NamedTuple):
+    """A repair issue as raised by a health check."""
+
+    severity: ir.IssueSeverity
+    translation_key: str
+    placeholders: dict[str, str]
+
+
+class Check(NamedTuple):
+    """
+    The outcome of one health check.
+
+    active is True past the raising threshold, False past the clearing
+    threshold and None in the hysteresis band between them. The state has to
+    hold for dwell seconds before the issue follows it. A new marker starts
+    the condition over, clearing a raised issue.
+    """
+
+    active: bool | None
+    issue: Issue | None = None
+    dwell: float = ISSUE_DWELL_TIME
+    marker: Any = None
+
+
+class Thresholds(NamedTuple):
+    """Per-entry limits of the health checks."""
+
+    disk_temperature: float
+    smart_error_delta: int
+    parity_stall: float  # seconds
+    ups_load: float
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> Thresholds:
+        """Return the thresholds set in the entry options."""
+        return cls(
+            disk_temperature=options.get(
+                CONF_DISK_TEMPERATURE_THRESHOLD, DEFAULT_DISK_TEMPERATURE_THRESHOLD
+            ),
+            smart_error_delta=options.get(
+                CONF_SMART_ERROR_DELTA, DEFAULT_SMART_ERROR_DELTA
+            ),
+            parity_stall=60
+            * options.get(CONF_PARITY_STALL_MINUTES, DEFAULT_PARITY_STALL_MINUTES),
+            ups_load=options.get(CONF_UPS_LOAD_THRESHOLD, DEFAULT_UPS_LOAD_THRESHOLD),
+        )
+
+
 async def async_create_fix_flow(
     hass: HomeAssistant,
     issue_id: str,
@@ -29,6 +103,8 @@ async def async_create_fix_flow(
         return ArrayIssueRepairFlow(hass, issue_id, data)
     if issue_id.startswith("parity_"):
         return ParityCheckRepairFlow(hass, issue_id, data)
+    if issue_id.startswith("ups_"):
+        return UPSIssueRepairFlow(hass, issue_id, data)
     return RepairsFlow()
 
 
@@ -170,102 +246,421 @@ class ParityCheckRepairFlow(RepairsFlow):
         )
 
 
-async def async_check_and_create_issues(hass: HomeAssistant, coordinator) -> None:
-    """Check for issues and create repair flows if needed."""
-    # Check for connection issues
-    if not coordinator.last_update_success:
-        ir.async_create_issue(
-            hass,
-            DOMAIN,
-            f"connection_{coordinator.config_entry.entry_id}",
-            is_fixable=True,
-            severity=ir.IssueSeverity.ERROR,
-            translation_key="connection_failed",
-            translation_placeholders={
-                "host": coordinator.config_entry.data.get("host", "Unknown"),
-                "port": str(coordinator.config_entry.data.get("port", "Unknown")),
-                "error": (
-                    str(coordinator.last_exception)
-                    if coordinator.last_exception
-                    else "Unknown error"
-                ),
+class UPSIssueRepairFlow(RepairsFlow):
+    """Handler for UPS issue repairs."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        issue_id: str,
+        data: dict[str, str | int | float | None] | None,
+    ) -> None:
+        """Initialize the repair flow."""
+        super().__init__()
+        self.hass = hass
+        self.issue_id = issue_id
+        self.data = data or {}
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> data_entry_flow.FlowResult:
+        """Handle the initial step."""
+        if user_input is not None:
+            # Mark issue as resolved
+            ir.async_delete_issue(self.hass, DOMAIN, self.issue_id)
+            return self.async_create_entry(title="", data={})
+
+        return self.async_show_form(
+            step_id="init",
+            description_placeholders={
+                "load": str(self.data.get("load", "Unknown")),
+                "threshold": str(self.data.get("threshold", "Unknown")),
             },
         )
 
-    # Skip further checks if coordinator data is not available
-    if not coordinator.data:
-        return
-
-    # Check for disk health issues
-    disks = coordinator.data.get("disks", [])
-    for disk in disks:
-        disk_id = disk.get("id", disk.get("name", "unknown"))
-        smart_errors = disk.get("smart_errors", 0)
-        smart_status = disk.get("smart_status", "UNKNOWN")
-        temperature = disk.get("temperature_celsius", 0)
-
-        # Check for SMART errors
-        if smart_errors > 0:
-            ir.async_create_issue(
-                hass,
-                DOMAIN,
-                f"disk_health_{disk_id}_smart_errors",
-                is_fixable=True,
-                severity=ir.IssueSeverity.WARNING,
-                translation_key="disk_smart_errors",
-                translation_placeholders={
-                    "disk_name": disk.get("name", disk_id),
+
+def _above(value: float, threshold: float, hysteresis: float, issue: Issue) -> Check:
+    """Check a value against a threshold with a hysteresis band below it."""
+    if value > threshold:
+        return Check(True, issue)
+    if value <= threshold - hysteresis:
+        return Check(False)
+    return Check(None)
+
+
+def _disk_checks(
+    entry_id: str, disk: dict[str, Any], thresholds: Thresholds, state: dict[str, Any]
+) -> dict[str, Check]:
+    """Return the health checks of one disk."""
+    disk_id = _item_id(KEY_DISKS, disk)
+    disk_name = disk.get("name", disk_id)
+    smart_errors = disk.get("smart_errors") or 0
+    temperature = disk.get("temperature_celsius") or 0
+
+    # New errors count from the first count seen, or from a counter reset
+    baseline = state.get("smart_errors")
+    if baseline is None or smart_errors < baseline:
+        state["smart_errors"] = baseline = smart_errors
+
+    return {
+        # Error counts only grow, so there is nothing to wait out
+        f"disk_health_{entry_id}_{disk_id}_smart_errors": Check(
+            smart_errors - baseline >= thresholds.smart_error_delta,
+            Issue(
+                ir.IssueSeverity.WARNING,
+                "disk_smart_errors",
+                {
+                    "disk_name": disk_name,
                     "smart_errors": str(smart_errors),
-                    "smart_status": smart_status,
+                    "smart_status": disk.get("smart_status", "UNKNOWN"),
                 },
-            )
+            ),
+            dwell=0,
+        ),
+        f"disk_health_{entry_id}_{disk_id}_high_temp": _above(
+            temperature,
+            thresholds.disk_temperature,
+            DISK_TEMPERATURE_HYSTERESIS,
+            Issue(
+                ir.IssueSeverity.WARNING,
+                "disk_high_temperature",
+                {"disk_name": disk_name, "temperature": str(temperature)},
+            ),
+        ),
+    }
+
+
+def _array_checks(
+    entry_id: str, array_data: dict[str, Any], thresholds: Thresholds
+) -> dict[str, Check]:
+    """Return the health checks of the array."""
+    checks = {
+        f"array_parity_invalid_{entry_id}": Check(
+            not array_data.get("parity_valid", True),
+            Issue(
+                ir.IssueSeverity.ERROR,
+                "array_parity_invalid",
+                {"array_state": array_data.get("state", "Unknown")},
+            ),
+            dwell=0,
+        )
+    }
 
-        # Check for high temperature (>50°C)
-        if temperature > 50:
-            ir.async_create_issue(
-                hass,
-                DOMAIN,
-                f"disk_health_{disk_id}_high_temp",
-                is_fixable=True,
-                severity=ir.IssueSeverity.WARNING,
-                translation_key="disk_high_temperature",
-                translation_placeholders={
-                    "disk_name": disk.get("name", disk_id),
-                    "temperature": str(temperature),
-                },
-            )
+    # A running parity check is stuck once its progress has not moved for the
+    # stall duration; every bit of progress starts the wait over
+    parity_check_running = array_data.get("parity_check_running") or (
+        str(array_data.get("parity_check_status", "")).lower() == "running"
+    )
+    sync_percent = array_data.get("sync_percent", 0)
+    stuck = f"parity_check_stuck_{entry_id}"
+    if parity_check_running:
+        checks[stuck] = Check(
+            True,
+            Issue(
+                ir.IssueSeverity.WARNING,
+                "parity_check_stuck",
+                {"sync_percent": str(sync_percent)},
+            ),
+            dwell=thresholds.parity_stall,
+            marker=sync_percent,
+        )
+    else:
+        checks[stuck] = Check(False, dwell=0)
+    return checks
+
+
+def _ups_checks(
+    entry_id: str, ups_data: dict[str, Any], thresholds: Thresholds
+) -> dict[str, Check]:
+    """Return the health checks of the UPS."""
+    load = ups_data.get("load_percent") or 0
+    return {
+        f"ups_high_load_{entry_id}": _above(
+            load,
+            thresholds.ups_load,
+            UPS_LOAD_HYSTERESIS,
+            Issue(
+                ir.IssueSeverity.WARNING,
+                "ups_high_load",
+                {"load": str(load), "threshold": str(thresholds.ups_load)},
+            ),
+        )
+    }
 
-    # Check for array issues
-    array_data = coordinator.data.get("array", {})
-    parity_valid = array_data.get("parity_valid", True)
 
-    if not parity_valid:
-        ir.async_create_issue(
-            hass,
-            DOMAIN,
-            f"array_parity_invalid_{coordinator.config_entry.entry_id}",
-            is_fixable=True,
-            severity=ir.IssueSeverity.ERROR,
-            translation_key="array_parity_invalid",
-            translation_placeholders={
-                "array_state": array_data.get("state", "Unknown"),
-            },
-        )
+def _item_id(key: str, item: dict[str, Any]) -> str:
+    """Return the id of an item of a list category."""
+    for field in ITEM_ID_FIELDS[key]:
+        if (value := item.get(field)) is not None:
+            return str(value)
+    return "unknown"
 
-    # Check for parity check issues
-    parity_check_running = array_data.get("parity_check_running", False)
-    sync_percent = array_data.get("sync_percent", 0)
 
-    # If parity check has been running for a very long time (>95% but not complete)
-    if parity_check_running and sync_percent > 95 and sync_percent < 100:
+# Data categories checked as a whole
+CATEGORY_CHECKS: dict[str, Callable[[str, Any, Thresholds], dict[str, Check]]] = {
+    KEY_ARRAY: _array_checks,
+    KEY_UPS: _ups_checks,
+}
+
+# List categories checked item by item; the checks also get a dict to keep
+# what they need to remember about the item, stored across restarts
+ITEM_CHECKS: dict[
+    str, Callable[[str, Any, Thresholds, dict[str, Any]], dict[str, Check]]
+] = {
+    KEY_DISKS: _disk_checks,
+}
+
+# Group of the connection check, which follows the refresh result
+_CONNECTION = ("connection",)
+
+
+@dataclass
+class _Condition:
+    """State of one health check."""
+
+    active: bool = False
+    # When the check started pointing the other way
+    pending_since: datetime | None = None
+    marker: Any = None
+
+
+class UnraidIssueTracker:
+    """
+    Keep repair issues in sync with the coordinator data.
+
+    Checks are grouped by category, and by item for list categories. Only
+    groups whose data changed since the last update are evaluated, plus those
+    waiting out a dwell time.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, coordinator, store: Store | None = None
+    ) -> None:
+        """Initialize the tracker."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.entry_id: str = coordinator.config_entry.entry_id
+        self.thresholds = Thresholds.from_options(coordinator.config_entry.options)
+        # What the item checks remember per item; see async_load
+        self._store = store
+        self._item_state: dict[str, dict[str, dict[str, Any]]] = {}
+        # Issue ids checked per group, and the state of each check
+        self._groups: dict[tuple[str, ...], set[str]] = {}
+        self._conditions: dict[str, _Condition] = {}
+        # Data each category, and each item of list categories, was last
+        # evaluated with
+        self._seen: dict[str, Any] = {}
+        self._seen_items: dict[str, dict[str, Any]] = {}
+        # Groups to evaluate again once a dwell time is over
+        self._recheck: dict[tuple[str, ...], datetime] = {}
+        self._cancel_recheck: CALLBACK_TYPE | None = None
+
+    async def async_load(self) -> None:
+        """Load what the item checks remembered before the last restart."""
+        if self._store is not None and (stored := await self._store.async_load()):
+            self._item_state = stored.get("items", {})
+
+    @callback
+    def _stored_data(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {"items": self._item_state}
+
+    def _item_checks(self, key: str, item_id: str, item: Any) -> dict[str, Check]:
+        """Evaluate the checks of an item, storing what they remember."""
+        state = self._item_state.setdefault(key, {}).setdefault(item_id, {})
+        before = dict(state)
+        checks = ITEM_CHECKS[key](self.entry_id, item, self.thresholds, state)
+        if state != before and self._store is not None:
+            self._store.async_delay_save(self._stored_data, HEALTH_SAVE_DELAY)
+        return checks
+
+    @callback
+    def async_update(self) -> None:
+        """Evaluate the connection and every category or item that changed."""
+        now = dt_util.utcnow()
+        self._apply(_CONNECTION, self._connection_checks(), now)
+
+        data = self.coordinator.data or {}
+        for key, evaluate in CATEGORY_CHECKS.items():
+            value = data.get(key) or {}
+            if key in self._seen and _unchanged(self._seen[key], value):
+                continue
+            self._seen[key] = value
+            self._apply((key,), evaluate(self.entry_id, value, self.thresholds), now)
+
+        for key in ITEM_CHECKS:
+            seen = self._seen_items.get(key, {})
+            current = {_item_id(key, item): item for item in data.get(key) or []}
+            for item_id, item in current.items():
+                if item_id in seen and _unchanged(seen[item_id], item):
+                    continue
+                self._apply((key, item_id), self._item_checks(key, item_id, item), now)
+            for item_id in seen.keys() - current.keys():
+                self._apply((key, item_id), {}, now)
+            self._seen_items[key] = current
+
+    @callback
+    def async_set_thresholds(self, thresholds: Thresholds) -> None:
+        """Evaluate everything again against new thresholds."""
+        if thresholds == self.thresholds:
+            return
+        self.thresholds = thresholds
+        self._seen.clear()
+        self._seen_items.clear()
+        self.async_update()
+
+    @callback
+    def async_clear(self) -> None:
+        """Delete every issue raised by this tracker."""
+        if self._cancel_recheck is not None:
+            self._cancel_recheck()
+            self._cancel_recheck = None
+        for issue_id, condition in self._conditions.items():
+            if condition.active:
+                ir.async_delete_issue(self.hass, DOMAIN, issue_id)
+        self._groups.clear()
+        self._conditions.clear()
+        self._seen.clear()
+        self._seen_items.clear()
+        self._recheck.clear()
+
+    def _connection_checks(self) -> dict[str, Check]:
+        """Return the connection check, failing while refreshes fail."""
+        entry_data = self.coordinator.config_entry.data
+        error = self.coordinator.last_exception
+        return {
+            f"connection_{self.entry_id}": Check(
+                not self.coordinator.last_update_success,
+                Issue(
+                    ir.IssueSeverity.ERROR,
+                    "connection_failed",
+                    {
+                        "host": entry_data.get("host", "Unknown"),
+                        "port": str(entry_data.get("port", "Unknown")),
+                        "error": str(error) if error else "Unknown error",
+                    },
+                ),
+                dwell=0,
+            )
+        }
+
+    def _apply(
+        self, group: tuple[str, ...], checks: dict[str, Check], now: datetime
+    ) -> None:
+        """Move the issues of a group towards the outcome of its checks."""
+        recheck: datetime | None = None
+        for issue_id in self._groups.get(group, set()) - checks.keys():
+            # The item or check is gone, and so is its issue
+            if self._conditions.pop(issue_id).active:
+                self._set_issue(issue_id, None)
+
+        for issue_id, check in checks.items():
+            condition = self._conditions.setdefault(
+                issue_id, _Condition(marker=check.marker)
+            )
+            if check.marker != condition.marker:
+                condition.marker = check.marker
+                condition.pending_since = None
+                if condition.active:
+                    condition.active = False
+                    self._set_issue(issue_id, None)
+
+            if check.active is None or check.active == condition.active:
+                condition.pending_since = None
+                continue
+            if condition.pending_since is None:
+                condition.pending_since = now
+            due = condition.pending_since + timedelta(seconds=check.dwell)
+            if due > now:
+                recheck = due if recheck is None else min(recheck, due)
+                continue
+            condition.active = check.active
+            condition.pending_since = None
+            self._set_issue(issue_id, check.issue if check.active else None)
+
+        self._groups[group] = set(checks)
+        if recheck is None:
+            self._recheck.pop(group, None)
+        else:
+            self._recheck[group] = recheck
+        self._schedule_recheck()
+
+    def _set_issue(self, issue_id: str, issue: Issue | None) -> None:
+        """Create the issue, or delete it when None."""
+        if issue is None:
+            _LOGGER.debug("Clearing repair issue %s", issue_id)
+            ir.async_delete_issue(self.hass, DOMAIN, issue_id)
+            return
+        _LOGGER.debug("Raising repair issue %s", issue_id)
         ir.async_create_issue(
-            hass,
+            self.hass,
             DOMAIN,
-            f"parity_check_stuck_{coordinator.config_entry.entry_id}",
+            issue_id,
             is_fixable=True,
-            severity=ir.IssueSeverity.WARNING,
-            translation_key="parity_check_stuck",
-            translation_placeholders={
-                "sync_percent": str(sync_percent),
-            },
+            severity=issue.severity,
+            translation_key=issue.translation_key,
+            translation_placeholders=issue.placeholders,
         )
+
+    def _schedule_recheck(self) -> None:
+        """Wake up when the earliest dwell time is over."""
+        if self._cancel_recheck is not None:
+            self._cancel_recheck()
+            self._cancel_recheck = None
+        if self._recheck:
+            self._cancel_recheck = async_track_point_in_utc_time(
+                self.hass, self._async_recheck, min(self._recheck.values())
+            )
+
+    @callback
+    def _async_recheck(self, now: datetime) -> None:
+        """Evaluate the groups whose dwell time is over with their last data."""
+        self._cancel_recheck = None
+        for group, due in list(self._recheck.items()):
+            if due > now:
+                continue
+            key = group[0]
+            if len(group) == 1:
+                value = self._seen.get(key, {})
+                checks = CATEGORY_CHECKS[key](self.entry_id, value, self.thresholds)
+            elif (item := self._seen_items.get(key, {}).get(group[1])) is not None:
+                checks = self._item_checks(key, group[1], item)
+            else:
+                checks = {}
+            self._apply(group, checks, now)
+        self._schedule_recheck()
+
+
+def _unchanged(old: Any, new: Any) -> bool:
+    """Return True if data is the same object or equal."""
+    return old is new or old == new
+
+
+def health_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the storage of what the health checks of an entry remember."""
+    return Store(hass, HEALTH_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.health")
+
+
+async def async_track_issues(hass: HomeAssistant, coordinator) -> CALLBACK_TYPE:
+    """Raise and clear repair issues on every poll and push; return the stop."""
+    tracker = UnraidIssueTracker(
+        hass, coordinator, health_store(hass, coordinator.config_entry.entry_id)
+    )
+    await tracker.async_load()
+    tracker.async_update()
+    remove_listener = coordinator.async_add_listener(tracker.async_update)
+
+    async def async_options_updated(_hass: HomeAssistant, entry: ConfigEntry) -> None:
+        tracker.async_set_thresholds(Thresholds.from_options(entry.options))
+
+    remove_options_listener = coordinator.config_entry.add_update_listener(
+        async_options_updated
+    )
+
+    @callback
+    def async_stop() -> None:
+        remove_listener()
+        remove_options_listener()
+        tracker.async_clear()
+
+    return async_stop
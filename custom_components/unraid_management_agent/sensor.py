@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
 import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from operator import methodcaller
 from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -17,11 +22,15 @@ from homeassistant.const import (
     UnitOfDataRate,
     UnitOfPower,
     UnitOfTemperature,
+    UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from . import UnraidDataUpdateCoordinator
 from .const import (
@@ -46,22 +55,27 @@ from .const import (
     ICON_ARRAY,
     ICON_CONTAINER,
     ICON_CPU,
+    ICON_ERROR_RATE,
     ICON_GPU,
     ICON_MEMORY,
     ICON_NETWORK,
     ICON_PARITY,
     ICON_POWER,
+    ICON_REFRESH_TIME,
+    ICON_SHARE,
     ICON_TEMPERATURE,
     ICON_UPS,
     ICON_UPTIME,
+    ICON_WEBSOCKET,
+    ITEM_ID_FIELDS,
     KEY_ARRAY,
     KEY_DISKS,
     KEY_GPU,
     KEY_NETWORK,
+    KEY_SHARES,
     KEY_SYSTEM,
     KEY_UPS,
-    MANUFACTURER,
-    MODEL,
+    SHARE_SUMMARY_TOP_N,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -91,6 +105,59 @@ def _is_physical_network_interface(interface_name: str) -> bool:
     return False
 
 
+def _fullest_shares(shares: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return the SHARE_SUMMARY_TOP_N shares with the highest usage."""
+    return heapq.nlargest(
+        SHARE_SUMMARY_TOP_N,
+        (share for share in shares if share.get("usage_percent") is not None),
+        key=lambda share: share["usage_percent"],
+    )
+
+
+def _network_attributes(
+    interface: dict[str, Any], interface_name: str
+) -> dict[str, Any]:
+    """Build the attributes shared by the network traffic sensors."""
+    # Format network speed
+    speed_mbps = interface.get("speed_mbps")
+    if speed_mbps is not None and speed_mbps > 0:
+        if speed_mbps >= 1000:
+            network_speed = f"{speed_mbps / 1000:.0f} Gbps"
+        else:
+            network_speed = f"{speed_mbps} Mbps"
+    else:
+        network_speed = "Unknown"
+
+    # Get IP address or show "N/A" if empty
+    ip_address = interface.get("ip_address") or "N/A"
+
+    # Get status (API uses "state" field)
+    status = interface.get("state", "unknown")
+
+    return {
+        ATTR_NETWORK_MAC: interface.get("mac_address"),
+        ATTR_NETWORK_IP: ip_address,
+        ATTR_NETWORK_SPEED: network_speed,
+        "status": status,
+        "interface": interface_name,
+    }
+
+
+def _sample_time(item: dict[str, Any], received_at: float | None) -> float | None:
+    """Return when the agent sampled an item, or when it was received."""
+    timestamp = item.get("timestamp")
+    if isinstance(timestamp, str) and (sampled_at := dt_util.parse_datetime(timestamp)):
+        return sampled_at.timestamp()
+    return received_at
+
+
+def _format_gb(size_bytes: float | None) -> str:
+    """Format a byte count as gigabytes for state attributes."""
+    if size_bytes is None or size_bytes <= 0:
+        return "Unknown"
+    return f"{size_bytes / (1024**3):.2f} GB"
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -103,92 +170,20 @@ async def async_setup_entry(
         "Setting up Unraid sensors, coordinator data keys: %s", coordinator.data.keys()
     )
 
-    entities: list[SensorEntity] = []
-
-    # System sensors
-    entities.extend(
-        [
-            UnraidCPUUsageSensor(coordinator, entry),
-            UnraidRAMUsageSensor(coordinator, entry),
-            UnraidCPUTemperatureSensor(coordinator, entry),
-            UnraidUptimeSensor(coordinator, entry),
-        ]
-    )
-
-    # Motherboard temperature sensor (if available)
-    system_data = coordinator.data.get(KEY_SYSTEM, {})
-    if system_data.get("motherboard_temp_celsius"):
-        entities.append(UnraidMotherboardTemperatureSensor(coordinator, entry))
-
-    # Fan sensors (dynamic, one per fan)
-    fans = system_data.get("fans", [])
-    for fan in fans:
-        fan_name = fan.get("name", "unknown")
-        entities.append(UnraidFanSensor(coordinator, entry, fan_name))
-
-    # Array sensors
-    entities.extend(
-        [
-            UnraidArrayUsageSensor(coordinator, entry),
-            UnraidParityProgressSensor(coordinator, entry),
-        ]
-    )
-
-    # Disk sensors (dynamic, one per disk)
-    disks = coordinator.data.get(KEY_DISKS, [])
-    for disk in disks:
-        disk_id = disk.get("id", disk.get("name", "unknown"))
-        disk_name = disk.get("name", disk_id)
-        disk_role = disk.get("role", "")
-
-        # Create health sensor for physical disks only (skip virtual filesystems)
-        # Virtual filesystems like docker_vdisk and log don't have SMART data
-        if disk_role not in ("docker_vdisk", "log"):
-            entities.append(
-                UnraidDiskHealthSensor(coordinator, entry, disk_id, disk_name)
-            )
-
-        # Skip parity disks for usage sensors - they don't have usage data
-        # Check the disk name, not the ID (ID is the device ID, name is "parity", "disk1", etc.)
-        if disk_name not in ("parity", "parity2"):
-            # Create usage sensor for each non-parity disk
-            entities.append(
-                UnraidDiskUsageSensor(coordinator, entry, disk_id, disk_name)
-            )
-
-    # Docker vDisk usage sensor (if available)
-    docker_vdisk = next((d for d in disks if d.get("role") == "docker_vdisk"), None)
-    _LOGGER.debug("Docker vDisk found: %s", docker_vdisk is not None)
-    if docker_vdisk:
-        _LOGGER.debug("Creating Docker vDisk usage sensor")
-        entities.append(UnraidDockerVDiskUsageSensor(coordinator, entry))
-
-    # Log filesystem usage sensor (if available)
-    log_filesystem = next((d for d in disks if d.get("role") == "log"), None)
-    _LOGGER.debug("Log filesystem found: %s", log_filesystem is not None)
-    if log_filesystem:
-        _LOGGER.debug("Creating Log filesystem usage sensor")
-        entities.append(UnraidLogFilesystemUsageSensor(coordinator, entry))
-
-    # GPU sensors (if GPU available)
-    if coordinator.data.get(KEY_GPU):
-        entities.extend(
-            [
-                UnraidGPUUtilizationSensor(coordinator, entry),
-                UnraidGPUCPUTemperatureSensor(coordinator, entry),
-                UnraidGPUPowerSensor(coordinator, entry),
-            ]
-        )
+    entities: list[SensorEntity] = [
+        UnraidSensor(coordinator, entry, description)
+        for description in SENSOR_DESCRIPTIONS
+        if description.exists_fn(coordinator.data)
+    ]
 
-    # UPS sensors (if UPS connected)
-    if coordinator.data.get(KEY_UPS, {}).get("connected"):
+    # Dynamic sensors (one per fan, disk or GPU)
+    for description in ITEM_SENSOR_DESCRIPTIONS:
+        items = description.items_fn(coordinator.data)
+        if items and description.legacy_key is not None:
+            _migrate_legacy_unique_id(hass, entry, description, items[0][0])
         entities.extend(
-            [
-                UnraidUPSBatterySensor(coordinator, entry),
-                UnraidUPSLoadSensor(coordinator, entry),
-                UnraidUPSRuntimeSensor(coordinator, entry),
-                UnraidUPSPowerSensor(coordinator, entry),
-            ]
+            UnraidItemSensor(coordinator, entry, description, item_id, item_name)
+            for item_id, item_name in items
         )
 
     # Network sensors (only physical interfaces that are connected)
@@ -198,1126 +193,1387 @@ async def async_setup_entry(
         # Only create sensors for physical network interfaces that are up/connected
         if _is_physical_network_interface(interface_name) and interface_state == "up":
             entities.extend(
-                [
-                    UnraidNetworkRXSensor(coordinator, entry, interface_name),
-                    UnraidNetworkTXSensor(coordinator, entry, interface_name),
-                ]
+                UnraidNetworkRateSensor(coordinator, entry, interface_name, direction)
+                for direction in NETWORK_DIRECTIONS
             )
 
+    # Share sensors (one per share, only the fullest enabled by default)
+    shares = [
+        share for share in coordinator.data.get(KEY_SHARES, []) if share.get("name")
+    ]
+    if shares:
+        fullest = {share["name"] for share in _fullest_shares(shares)}
+        entities.extend(
+            UnraidShareUsageSensor(
+                coordinator,
+                entry,
+                share["name"],
+                enabled_default=share["name"] in fullest,
+            )
+            for share in shares
+        )
+        entities.append(UnraidTopSharesSensor(coordinator, entry))
+
+    # WebSocket diagnostic sensors (disabled by default)
+    if coordinator.enable_websocket:
+        entities.extend(
+            [
+                UnraidWebSocketMessagesSensor(coordinator, entry),
+                UnraidWebSocketLatencySensor(coordinator, entry),
+                UnraidWebSocketReconnectsSensor(coordinator, entry),
+            ]
+        )
+
+    # Agent responsiveness diagnostic sensors (disabled by default)
+    entities.extend(
+        [
+            UnraidRefreshTimeSensor(coordinator, entry, 50),
+            UnraidRefreshTimeSensor(coordinator, entry, 95),
+            UnraidApiErrorRateSensor(coordinator, entry),
+        ]
+    )
+
     _LOGGER.debug("Adding %d Unraid sensor entities", len(entities))
     async_add_entities(entities)
 
 
+def _migrate_legacy_unique_id(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    description: UnraidItemSensorEntityDescription,
+    item_id: str,
+) -> None:
+    """Move a sensor registered by an older single-item version to its item."""
+    registry = er.async_get(hass)
+    old_unique_id = f"{entry.entry_id}_{description.legacy_key}"
+    new_unique_id = f"{entry.entry_id}_{description.key.format(_slug(item_id))}"
+    entity_id = registry.async_get_entity_id("sensor", DOMAIN, old_unique_id)
+    if entity_id is None or registry.async_get_entity_id(
+        "sensor", DOMAIN, new_unique_id
+    ):
+        return
+    _LOGGER.debug("Migrating %s to unique ID %s", entity_id, new_unique_id)
+    registry.async_update_entity(entity_id, new_unique_id=new_unique_id)
+
+
 class UnraidSensorBase(CoordinatorEntity, SensorEntity):
     """Base class for Unraid sensors."""
 
+    # Coordinator category the sensor reads, None to follow every update
+    _category: str | None = None
+    # Unique ID suffix of sensors with a fixed one, after the entry ID
+    _unique_key: str | None = None
+    _attrs_key: Any = None
+    _attrs_cache: dict[str, Any] | None = None
+
     def __init__(
         self,
         coordinator: UnraidDataUpdateCoordinator,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, self._category)
         self._attr_has_entity_name = True
         self._entry = entry
+        if self._unique_key is not None:
+            self._attr_unique_id = f"{entry.entry_id}_{self._unique_key}"
 
     @property
-    def device_info(self) -> dict[str, Any]:
+    def device_info(self) -> DeviceInfo:
         """Return device information."""
-        system_data = self.coordinator.data.get(KEY_SYSTEM, {})
-        hostname = system_data.get("hostname", "Unraid")
-
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": f"Unraid ({hostname})",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": system_data.get("version", "Unknown"),
-        }
-
-
-# System Sensors
-
-
-class UnraidCPUUsageSensor(UnraidSensorBase):
-    """CPU usage sensor."""
-
-    _attr_name = "CPU Usage"
-    _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_device_class = SensorDeviceClass.POWER_FACTOR
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = ICON_CPU
-    _attr_suggested_display_precision = 1
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_cpu_usage"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        cpu_usage = self.coordinator.data.get(KEY_SYSTEM, {}).get("cpu_usage_percent")
-        if cpu_usage is not None:
-            return round(cpu_usage, 1)
-        return None
+        return self.coordinator.device_info(self._entry.entry_id)
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra attributes."""
-        system_data = self.coordinator.data.get(KEY_SYSTEM, {})
-
-        # Note: cpu_cores from API is incorrect (shows 1 instead of actual core count)
-        # cpu_threads is correct, so we can infer cores if needed
-        cpu_cores = system_data.get("cpu_cores", 0)
-        cpu_threads = system_data.get("cpu_threads", 0)
-
-        # If cores seems wrong (1 core with 12 threads is impossible),
-        # assume hyperthreading and divide threads by 2
-        if cpu_cores == 1 and cpu_threads > 2:
-            cpu_cores = cpu_threads // 2
-
-        attrs = {
-            ATTR_CPU_MODEL: system_data.get("cpu_model"),
-            ATTR_CPU_CORES: cpu_cores,
-            ATTR_CPU_THREADS: cpu_threads,
-        }
-
-        # Add CPU frequency if available
-        cpu_mhz = system_data.get("cpu_mhz")
-        if cpu_mhz:
-            attrs["cpu_frequency"] = f"{cpu_mhz:.0f} MHz"
-
-        return attrs
-
-
-class UnraidRAMUsageSensor(UnraidSensorBase):
-    """RAM usage sensor."""
-
-    _attr_name = "RAM Usage"
-    _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_device_class = SensorDeviceClass.POWER_FACTOR
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = ICON_MEMORY
-    _attr_suggested_display_precision = 1
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_ram_usage"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        ram_usage = self.coordinator.data.get(KEY_SYSTEM, {}).get("ram_usage_percent")
-        if ram_usage is not None:
-            return round(ram_usage, 1)
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra attributes."""
-        system_data = self.coordinator.data.get(KEY_SYSTEM, {})
-        ram_total = system_data.get("ram_total_bytes", 0)
-        ram_used = system_data.get("ram_used_bytes", 0)
-        ram_free = system_data.get("ram_free_bytes", 0)
-        ram_cached = system_data.get("ram_cached_bytes", 0)
-        ram_buffers = system_data.get("ram_buffers_bytes", 0)
-
-        attrs = {
-            ATTR_RAM_TOTAL: (
-                f"{ram_total / (1024**3):.2f} GB" if ram_total else "Unknown"
-            ),
-            ATTR_SERVER_MODEL: system_data.get("server_model"),
-        }
-
-        # Add detailed memory breakdown if available
-        if ram_used:
-            attrs["ram_used"] = f"{ram_used / (1024**3):.2f} GB"
-        if ram_free:
-            attrs["ram_free"] = f"{ram_free / (1024**3):.2f} GB"
-        if ram_cached:
-            attrs["ram_cached"] = f"{ram_cached / (1024**3):.2f} GB"
-        if ram_buffers:
-            attrs["ram_buffers"] = f"{ram_buffers / (1024**3):.2f} GB"
-
-        # Calculate available memory (free + cached + buffers)
-        if ram_free and ram_cached and ram_buffers:
-            ram_available = ram_free + ram_cached + ram_buffers
-            attrs["ram_available"] = f"{ram_available / (1024**3):.2f} GB"
+    def assumed_state(self) -> bool:
+        """Return True while the state comes from the stored snapshot."""
+        return self.coordinator.stale
 
-        return attrs
-
-
-class UnraidCPUTemperatureSensor(UnraidSensorBase):
-    """CPU temperature sensor."""
-
-    _attr_name = "CPU Temperature"
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = ICON_TEMPERATURE
-    _attr_suggested_display_precision = 1
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_cpu_temperature"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        return self.coordinator.data.get(KEY_SYSTEM, {}).get("cpu_temp_celsius")
-
-
-class UnraidMotherboardTemperatureSensor(UnraidSensorBase):
-    """Motherboard temperature sensor."""
-
-    _attr_name = "Motherboard Temperature"
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = ICON_TEMPERATURE
-    _attr_suggested_display_precision = 1
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_motherboard_temperature"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        return self.coordinator.data.get(KEY_SYSTEM, {}).get("motherboard_temp_celsius")
-
-
-class UnraidFanSensor(UnraidSensorBase):
-    """Fan speed sensor."""
-
-    _attr_native_unit_of_measurement = "RPM"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = "mdi:fan"
-    _attr_suggested_display_precision = 0
-
-    def __init__(
-        self,
-        coordinator: UnraidDataUpdateCoordinator,
-        entry: ConfigEntry,
-        fan_name: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, entry)
-        self._fan_name = fan_name
-        # Clean up fan name: remove hwmon prefixes and make user-friendly
-        friendly_name = self._clean_fan_name(fan_name)
-        self._attr_name = f"Fan {friendly_name}"
-
-    @staticmethod
-    def _clean_fan_name(fan_name: str) -> str:
-        """Clean up fan name to be user-friendly."""
-        import re
-
-        # Remove hwmon prefixes (e.g., "hwmon4_fan1" -> "1")
-        cleaned = re.sub(r"^hwmon\d+_fan", "", fan_name)
-        # If we got a number, return it as is
-        if cleaned.isdigit():
-            return cleaned
-        # Otherwise return the original name
-        return fan_name
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        # Sanitize fan name for unique ID
-        safe_name = self._fan_name.replace(" ", "_").replace("/", "_").lower()
-        return f"{self._entry.entry_id}_fan_{safe_name}"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the state."""
-        fans = self.coordinator.data.get(KEY_SYSTEM, {}).get("fans", [])
-        for fan in fans:
-            if fan.get("name") == self._fan_name:
-                return fan.get("rpm")
-        return None
-
-
-class UnraidUptimeSensor(UnraidSensorBase):
-    """Uptime sensor."""
-
-    _attr_name = "Uptime"
-    _attr_icon = ICON_UPTIME
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_uptime"
-
-    @staticmethod
-    def _format_uptime(seconds: int) -> str:
+    def _memoized_attributes(
+        self, key: Any, build: Callable[[], dict[str, Any]]
+    ) -> dict[str, Any]:
         """
-        Format uptime seconds into human-readable string.
+        Return the attributes built for key, rebuilding only when key changed.
 
-        Returns format like: "42 days, 21 hours, 31 minutes, 49 seconds"
-        Matches the Unraid web UI display format.
+        Key is either the coordinator item the attributes come from, which
+        keeps its identity while unchanged, or a tuple of the fields used.
         """
-        if seconds is None:
-            return "Unknown"
-
-        # Calculate time components
-        years, remainder = divmod(seconds, 31536000)  # 365 days
-        months, remainder = divmod(remainder, 2592000)  # 30 days
-        days, remainder = divmod(remainder, 86400)
-        hours, remainder = divmod(remainder, 3600)
-        minutes, seconds_remaining = divmod(remainder, 60)
-
-        # Build the formatted string
-        parts = []
-        if years > 0:
-            parts.append(f"{years} year{'s' if years != 1 else ''}")
-        if months > 0:
-            parts.append(f"{months} month{'s' if months != 1 else ''}")
-        if days > 0:
-            parts.append(f"{days} day{'s' if days != 1 else ''}")
-        if hours > 0:
-            parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
-        if minutes > 0:
-            parts.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
-        if seconds_remaining > 0 or not parts:  # Always show seconds if nothing else
-            parts.append(
-                f"{seconds_remaining} second{'s' if seconds_remaining != 1 else ''}"
-            )
-
-        return ", ".join(parts)
+        if self._attrs_cache is None or (
+            key is not self._attrs_key and key != self._attrs_key
+        ):
+            self._attrs_cache = build()
+            self._attrs_key = key
+        return self._attrs_cache
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the state as human-readable uptime."""
-        uptime_seconds = self.coordinator.data.get(KEY_SYSTEM, {}).get("uptime_seconds")
-        if uptime_seconds is not None:
-            return self._format_uptime(uptime_seconds)
-        return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra attributes."""
-        system_data = self.coordinator.data.get(KEY_SYSTEM, {})
-        uptime_seconds = system_data.get("uptime_seconds")
+# Sensor Descriptions
 
-        attributes = {
-            ATTR_HOSTNAME: system_data.get("hostname"),
-        }
 
-        # Include raw seconds value for use in automations/templates
-        if uptime_seconds is not None:
-            attributes["uptime_seconds"] = uptime_seconds
+def _field(name: str) -> Callable[[dict[str, Any]], Any]:
+    """Return an accessor for one field of the sensor's source data."""
+    return methodcaller("get", name)
 
-        return attributes
 
+def _rounded_field(name: str) -> Callable[[dict[str, Any]], float | None]:
+    """Return an accessor for one numeric field rounded to one decimal."""
 
-# Array Sensors
+    def value(source: dict[str, Any]) -> float | None:
+        raw = source.get(name)
+        return round(raw, 1) if raw is not None else None
 
+    return value
 
-class UnraidArrayUsageSensor(UnraidSensorBase):
-    """Array usage sensor."""
 
-    _attr_name = "Array Usage"
-    _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_device_class = SensorDeviceClass.POWER_FACTOR
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = ICON_ARRAY
-    _attr_suggested_display_precision = 1  # Already set - Fix #2 complete
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_array_usage"
+def _category(key: str) -> Callable[[dict[str, Any]], Any]:
+    """Return a source accessor for a whole coordinator category."""
+    return lambda data: data.get(key, {})
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        return self.coordinator.data.get(KEY_ARRAY, {}).get("used_percent")
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra attributes."""
-        array_data = self.coordinator.data.get(KEY_ARRAY, {})
-        return {
-            ATTR_ARRAY_STATE: array_data.get("state"),
-            ATTR_NUM_DISKS: array_data.get("num_disks"),
-            ATTR_NUM_DATA_DISKS: array_data.get("num_data_disks"),
-            ATTR_NUM_PARITY_DISKS: array_data.get("num_parity_disks"),
-        }
-
-
-class UnraidParityProgressSensor(UnraidSensorBase):
-    """Parity check progress sensor."""
-
-    _attr_name = "Parity Check Progress"
-    _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_device_class = SensorDeviceClass.POWER_FACTOR
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = ICON_PARITY
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_suggested_display_precision = 1
+def _gpu_id(gpu: dict[str, Any]) -> str | None:
+    """Return the stable ID the coordinator indexes a GPU under."""
+    return next(
+        (
+            str(gpu[field])
+            for field in ITEM_ID_FIELDS[KEY_GPU]
+            if gpu.get(field) is not None
+        ),
+        None,
+    )
 
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_parity_progress"
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        return self.coordinator.data.get(KEY_ARRAY, {}).get("parity_check_progress")
+def _disk_with_role(role: str) -> Callable[[dict[str, Any]], dict[str, Any] | None]:
+    """Return a source accessor for the disk with the given role."""
+    return lambda data: next(
+        (disk for disk in data.get(KEY_DISKS, []) if disk.get("role") == role), None
+    )
 
 
-# GPU Sensors
+def _slug(value: str) -> str:
+    """Sanitize an item identifier for use in a unique ID."""
+    return value.replace(" ", "_").replace("/", "_").lower()
 
 
-class UnraidGPUUtilizationSensor(UnraidSensorBase):
-    """GPU utilization sensor."""
+def _clean_fan_name(fan_name: str) -> str:
+    """Clean up fan name to be user-friendly."""
+    # Remove hwmon prefixes (e.g., "hwmon4_fan1" -> "1")
+    cleaned = re.sub(r"^hwmon\d+_fan", "", fan_name)
+    # If we got a number, return it as is
+    if cleaned.isdigit():
+        return cleaned
+    # Otherwise return the original name
+    return fan_name
 
-    _attr_name = "GPU Utilization"
-    _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_device_class = SensorDeviceClass.POWER_FACTOR
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = ICON_GPU
-    _attr_suggested_display_precision = 1
 
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_gpu_utilization"
+def _format_uptime(seconds: int | None) -> str | None:
+    """
+    Format uptime seconds into human-readable string.
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        gpu_list = self.coordinator.data.get(KEY_GPU, [])
-        if gpu_list and len(gpu_list) > 0:
-            return gpu_list[0].get("utilization_gpu_percent")
+    Returns format like: "42 days, 21 hours, 31 minutes, 49 seconds"
+    Matches the Unraid web UI display format.
+    """
+    if seconds is None:
         return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra attributes."""
-        gpu_list = self.coordinator.data.get(KEY_GPU, [])
-        if gpu_list and len(gpu_list) > 0:
-            return {
-                ATTR_GPU_NAME: gpu_list[0].get("name"),
-                ATTR_GPU_DRIVER_VERSION: gpu_list[0].get("driver_version"),
-            }
-        return {}
-
+    # Calculate time components
+    years, remainder = divmod(seconds, 31536000)  # 365 days
+    months, remainder = divmod(remainder, 2592000)  # 30 days
+    days, remainder = divmod(remainder, 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes, seconds_remaining = divmod(remainder, 60)
+
+    # Build the formatted string
+    parts = []
+    if years > 0:
+        parts.append(f"{years} year{'s' if years != 1 else ''}")
+    if months > 0:
+        parts.append(f"{months} month{'s' if months != 1 else ''}")
+    if days > 0:
+        parts.append(f"{days} day{'s' if days != 1 else ''}")
+    if hours > 0:
+        parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
+    if minutes > 0:
+        parts.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
+    if seconds_remaining > 0 or not parts:  # Always show seconds if nothing else
+        parts.append(
+            f"{seconds_remaining} second{'s' if seconds_remaining != 1 else ''}"
+        )
 
-class UnraidGPUCPUTemperatureSensor(UnraidSensorBase):
-    """GPU CPU temperature sensor (for iGPUs)."""
+    return ", ".join(parts)
 
-    _attr_name = "GPU CPU Temperature"
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = ICON_TEMPERATURE
-    _attr_suggested_display_precision = 1
 
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_gpu_cpu_temperature"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        gpu_list = self.coordinator.data.get(KEY_GPU, [])
-        if gpu_list and len(gpu_list) > 0:
-            return gpu_list[0].get("cpu_temperature_celsius")
+def _format_runtime(ups_data: dict[str, Any]) -> str | None:
+    """Return the UPS runtime in human-readable format."""
+    runtime_seconds = ups_data.get("runtime_left_seconds")
+    if runtime_seconds is None:
         return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra attributes."""
-        gpu_list = self.coordinator.data.get(KEY_GPU, [])
-        if gpu_list and len(gpu_list) > 0:
-            return {
-                ATTR_GPU_NAME: gpu_list[0].get("name"),
-                ATTR_GPU_DRIVER_VERSION: gpu_list[0].get("driver_version"),
-            }
-        return {}
-
-
-class UnraidGPUPowerSensor(UnraidSensorBase):
-    """GPU power consumption sensor."""
-
-    _attr_name = "GPU Power"
-    _attr_native_unit_of_measurement = UnitOfPower.WATT
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = ICON_POWER
-    _attr_suggested_display_precision = 1
+    # Convert to hours and minutes for better readability
+    if runtime_seconds >= 3600:
+        hours = runtime_seconds / 3600
+        return f"{hours:.1f} hours"
+    minutes = runtime_seconds / 60
+    return f"{minutes:.0f} minutes"
+
+
+def _cpu_attributes(system_data: dict[str, Any]) -> dict[str, Any]:
+    """Build the CPU attributes."""
+    # Note: cpu_cores from API is incorrect (shows 1 instead of actual core count)
+    # cpu_threads is correct, so we can infer cores if needed
+    cpu_cores = system_data.get("cpu_cores", 0)
+    cpu_threads = system_data.get("cpu_threads", 0)
+
+    # If cores seems wrong (1 core with 12 threads is impossible),
+    # assume hyperthreading and divide threads by 2
+    if cpu_cores == 1 and cpu_threads > 2:
+        cpu_cores = cpu_threads // 2
+
+    attrs = {
+        ATTR_CPU_MODEL: system_data.get("cpu_model"),
+        ATTR_CPU_CORES: cpu_cores,
+        ATTR_CPU_THREADS: cpu_threads,
+    }
+
+    # Add CPU frequency if available
+    cpu_mhz = system_data.get("cpu_mhz")
+    if cpu_mhz:
+        attrs["cpu_frequency"] = f"{cpu_mhz:.0f} MHz"
+
+    return attrs
+
+
+def _ram_attributes(system_data: dict[str, Any]) -> dict[str, Any]:
+    """Build the memory breakdown attributes."""
+    ram_total = system_data.get("ram_total_bytes", 0)
+    ram_used = system_data.get("ram_used_bytes", 0)
+    ram_free = system_data.get("ram_free_bytes", 0)
+    ram_cached = system_data.get("ram_cached_bytes", 0)
+    ram_buffers = system_data.get("ram_buffers_bytes", 0)
+
+    attrs = {
+        ATTR_RAM_TOTAL: _format_gb(ram_total),
+        ATTR_SERVER_MODEL: system_data.get("server_model"),
+    }
+
+    # Add detailed memory breakdown if available
+    if ram_used:
+        attrs["ram_used"] = _format_gb(ram_used)
+    if ram_free:
+        attrs["ram_free"] = _format_gb(ram_free)
+    if ram_cached:
+        attrs["ram_cached"] = _format_gb(ram_cached)
+    if ram_buffers:
+        attrs["ram_buffers"] = _format_gb(ram_buffers)
+
+    # Calculate available memory (free + cached + buffers)
+    if ram_free and ram_cached and ram_buffers:
+        attrs["ram_available"] = _format_gb(ram_free + ram_cached + ram_buffers)
+
+    return attrs
+
+
+def _uptime_attributes(system_data: dict[str, Any]) -> dict[str, Any]:
+    """Build the uptime attributes."""
+    attributes = {ATTR_HOSTNAME: system_data.get("hostname")}
+
+    # Include raw seconds value for use in automations/templates
+    uptime_seconds = system_data.get("uptime_seconds")
+    if uptime_seconds is not None:
+        attributes["uptime_seconds"] = uptime_seconds
+
+    return attributes
+
+
+def _array_attributes(array_data: dict[str, Any]) -> dict[str, Any]:
+    """Build the array attributes."""
+    return {
+        ATTR_ARRAY_STATE: array_data.get("state"),
+        ATTR_NUM_DISKS: array_data.get("num_disks"),
+        ATTR_NUM_DATA_DISKS: array_data.get("num_data_disks"),
+        ATTR_NUM_PARITY_DISKS: array_data.get("num_parity_disks"),
+    }
+
+
+def _gpu_attributes(gpu: dict[str, Any]) -> dict[str, Any]:
+    """Build the attributes shared by the GPU sensors."""
+    return {
+        ATTR_GPU_NAME: gpu.get("name"),
+        ATTR_GPU_DRIVER_VERSION: gpu.get("driver_version"),
+    }
+
+
+def _ups_runtime_attributes(ups_data: dict[str, Any]) -> dict[str, Any]:
+    """Build the UPS runtime attributes."""
+    runtime_seconds = ups_data.get("runtime_left_seconds")
+    if runtime_seconds is not None:
+        return {"runtime_seconds": runtime_seconds}
+    return {}
+
+
+def _ups_power_attributes(ups_data: dict[str, Any]) -> dict[str, Any]:
+    """Build the UPS power attributes."""
+    attributes = {
+        ATTR_UPS_STATUS: ups_data.get("status"),
+        ATTR_UPS_MODEL: ups_data.get("model"),
+    }
+
+    # Add load percentage and input/output voltage if available
+    for field in ("load_percent", "input_voltage", "output_voltage"):
+        value = ups_data.get(field)
+        if value is not None:
+            attributes[field] = value
+
+    return attributes
+
+
+def _disk_usage(disk: dict[str, Any]) -> float | None:
+    """Return disk usage, calculated from sizes if not provided by API."""
+    usage_percent = disk.get("usage_percent")
+    if usage_percent is None:
+        size_bytes = disk.get("size_bytes", 0)
+        used_bytes = disk.get("used_bytes", 0)
+        if size_bytes > 0 and used_bytes > 0:
+            usage_percent = (used_bytes / size_bytes) * 100
+    return round(usage_percent, 1) if usage_percent is not None else None
+
+
+def _disk_attributes(disk: dict[str, Any]) -> dict[str, Any]:
+    """Build the disk usage attributes."""
+    size_bytes = disk.get("size_bytes", 0)
+    used_bytes = disk.get("used_bytes", 0)
+    free_bytes = disk.get("free_bytes", 0)
+    spin_state = disk.get("spin_state", "active")
+    temperature = disk.get("temperature_celsius")
+
+    # Validate disk size calculation (Fix #5)
+    # Note: Some API data may have inconsistent size/used/free values
+    # This is an API issue, not a sensor issue
+    if size_bytes and free_bytes and size_bytes < free_bytes:
+        # If size < free, use free as the actual size (API data issue)
+        actual_size = free_bytes
+    else:
+        actual_size = size_bytes
+
+    attrs = {
+        "device": disk.get("device"),
+        "status": disk.get("status"),
+        "filesystem": disk.get("filesystem"),
+        "mount_point": disk.get("mount_point"),
+        "spin_state": spin_state,
+        "size": _format_gb(actual_size),
+        "used": _format_gb(used_bytes),
+        "free": _format_gb(free_bytes),
+        "smart_status": disk.get("smart_status"),
+        "smart_errors": disk.get("smart_errors", 0),
+    }
+
+    # Add temperature if available (will be 0 or None when spun down)
+    if temperature is not None and temperature > 0:
+        attrs["temperature_celsius"] = temperature
+    elif spin_state in ("standby", "idle"):
+        attrs["temperature_celsius"] = "Disk in standby"
+
+    return attrs
+
+
+def _smart_status(disk: dict[str, Any]) -> str:
+    """Return the SMART status, inferring health for UNKNOWN without errors."""
+    smart_status = disk.get("smart_status", "").upper()
+    if smart_status == "UNKNOWN":
+        # For NVMe drives, UNKNOWN status with no errors means healthy
+        # Check if disk is active and has no SMART errors
+        if disk.get("status", "") == "DISK_OK" and disk.get("smart_errors", 0) == 0:
+            return "PASSED (inferred)"
+        return "UNKNOWN"
+    return smart_status or "UNKNOWN"
+
+
+def _disk_health(disk: dict[str, Any]) -> str:
+    """Map the SMART status to a user-friendly display value."""
+    smart_status = _smart_status(disk)
+    if smart_status in ("PASSED", "PASSED (inferred)"):
+        return "Healthy"
+    if smart_status == "FAILED":
+        return "Failed"
+    if smart_status == "UNKNOWN":
+        return "Unknown"
+    return smart_status.capitalize()
+
+
+def _health_attributes(disk: dict[str, Any]) -> dict[str, Any]:
+    """Build the SMART attributes."""
+    return {
+        "smart_status": _smart_status(disk),
+        "smart_errors": disk.get("smart_errors", 0),
+        "device": disk.get("device"),
+    }
+
+
+def _filesystem_attributes(disk: dict[str, Any]) -> dict[str, Any]:
+    """Build the Docker vDisk attributes."""
+    return {
+        "mount_point": disk.get("mount_point"),
+        "size": _format_gb(disk.get("size_bytes", 0)),
+        "used": _format_gb(disk.get("used_bytes", 0)),
+        "free": _format_gb(disk.get("free_bytes", 0)),
+    }
+
+
+def _log_attributes(disk: dict[str, Any]) -> dict[str, Any]:
+    """Build the log filesystem attributes."""
+    size_bytes = disk.get("size_bytes", 0)
+    used_bytes = disk.get("used_bytes", 0)
+    free_bytes = disk.get("free_bytes", 0)
+
+    # Log filesystem is typically small (MB range), so format accordingly
+    # If size is less than 1 GB, show in MB
+    if size_bytes and size_bytes < 1024**3:
+        size_str = f"{size_bytes / (1024**2):.2f} MB"
+        used_str = f"{used_bytes / (1024**2):.2f} MB"
+        free_str = f"{free_bytes / (1024**2):.2f} MB"
+    else:
+        size_str = f"{size_bytes / (1024**3):.2f} GB"
+        used_str = f"{used_bytes / (1024**3):.2f} GB"
+        free_str = f"{free_bytes / (1024**3):.2f} GB"
+
+    return {
+        "mount_point": disk.get("mount_point"),
+        "size": size_str if size_bytes > 0 else "Unknown",
+        "used": used_str if used_bytes > 0 else "Unknown",
+        "free": free_str if free_bytes > 0 else "Unknown",
+    }
+
+
+def _disk_items(
+    include: Callable[[dict[str, Any], str], bool],
+) -> Callable[[dict[str, Any]], list[tuple[str, str]]]:
+    """Return an enumerator of (disk ID, disk name) for the matching disks."""
+
+    def items(data: dict[str, Any]) -> list[tuple[str, str]]:
+        result = []
+        for disk in data.get(KEY_DISKS, []):
+            disk_id = str(disk.get("id", disk.get("name", "unknown")))
+            disk_name = disk.get("name", disk_id)
+            if include(disk, disk_name):
+                result.append((disk_id, disk_name))
+        return result
+
+    return items
+
+
+def _gpu_items(
+    required_field: str | None = None,
+) -> Callable[[dict[str, Any]], list[tuple[str, str]]]:
+    """
+    Return an enumerator of (GPU ID, GPU number) for the reported GPUs.
 
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_gpu_power"
+    With required_field, only GPUs that report that metric are included.
+    """
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        gpu_list = self.coordinator.data.get(KEY_GPU, [])
-        if gpu_list and len(gpu_list) > 0:
-            return gpu_list[0].get("power_draw_watts")
-        return None
+    def items(data: dict[str, Any]) -> list[tuple[str, str]]:
+        result = []
+        for position, gpu in enumerate(data.get(KEY_GPU, [])):
+            gpu_id = _gpu_id(gpu)
+            if gpu_id is None:
+                continue
+            if required_field is not None and gpu.get(required_field) is None:
+                continue
+            result.append((gpu_id, str(gpu.get("index", position))))
+        return result
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra attributes."""
-        gpu_list = self.coordinator.data.get(KEY_GPU, [])
-        if gpu_list and len(gpu_list) > 0:
-            return {
-                ATTR_GPU_NAME: gpu_list[0].get("name"),
-                ATTR_GPU_DRIVER_VERSION: gpu_list[0].get("driver_version"),
-            }
-        return {}
+    return items
 
 
-# UPS Sensors
+def _fan_items(data: dict[str, Any]) -> list[tuple[str, str]]:
+    """Return (fan name, friendly name) for every fan."""
+    items = []
+    for fan in data.get(KEY_SYSTEM, {}).get("fans", []):
+        fan_name = fan.get("name", "unknown")
+        items.append((fan_name, _clean_fan_name(fan_name)))
+    return items
 
 
-class UnraidUPSBatterySensor(UnraidSensorBase):
-    """UPS battery sensor."""
+def _lookup_fan(
+    coordinator: UnraidDataUpdateCoordinator, fan_name: str
+) -> dict[str, Any] | None:
+    """Return a fan from the system data."""
+    for fan in coordinator.data.get(KEY_SYSTEM, {}).get("fans", []):
+        if fan.get("name") == fan_name:
+            return fan
+    return None
 
-    _attr_name = "UPS Battery"
-    _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_device_class = SensorDeviceClass.BATTERY
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = ICON_UPS
-    _attr_suggested_display_precision = 1
 
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_ups_battery"
+def _lookup_disk(
+    coordinator: UnraidDataUpdateCoordinator, disk_id: str
+) -> dict[str, Any] | None:
+    """Return a disk from the coordinator's item index."""
+    return coordinator.get_item(KEY_DISKS, disk_id)
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        return self.coordinator.data.get(KEY_UPS, {}).get("battery_charge_percent")
 
+def _lookup_gpu(
+    coordinator: UnraidDataUpdateCoordinator, gpu_id: str
+) -> dict[str, Any] | None:
+    """Return a GPU from the coordinator's item index."""
+    return coordinator.get_item(KEY_GPU, gpu_id)
 
-class UnraidUPSLoadSensor(UnraidSensorBase):
-    """UPS load sensor."""
 
-    _attr_name = "UPS Load"
-    _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_device_class = SensorDeviceClass.POWER_FACTOR
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = ICON_UPS
-    _attr_suggested_display_precision = 1
+@dataclass(frozen=True, kw_only=True)
+class UnraidSensorEntityDescription(SensorEntityDescription):
+    """
+    Describes an Unraid sensor.
+
+    The key is also the unique ID suffix. ``source_fn`` picks the sensor's
+    data out of the coordinator data, ``value_fn`` and ``attrs_fn`` read the
+    state and attributes from it. Attributes are rebuilt only when the source
+    object, or the ``attrs_fields`` of it when given, change. ``category``
+    is the coordinator category the data comes from; the sensor is only
+    updated when that category was refreshed.
+    """
 
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_ups_load"
+    category: str | None = None
+    source_fn: Callable[[dict[str, Any]], Any]
+    value_fn: Callable[[Any], Any]
+    attrs_fn: Callable[[Any], dict[str, Any]] | None = None
+    attrs_fields: tuple[str, ...] | None = None
+    exists_fn: Callable[[dict[str, Any]], bool] = lambda _data: True
+    keep_last_value: bool = False
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        return self.coordinator.data.get(KEY_UPS, {}).get("load_percent")
 
+@dataclass(frozen=True, kw_only=True)
+class UnraidItemSensorEntityDescription(UnraidSensorEntityDescription):
+    """
+    Describes a sensor created once per item, such as a disk or fan.
 
-class UnraidUPSRuntimeSensor(UnraidSensorBase):
-    """UPS runtime sensor."""
+    ``items_fn`` lists (item ID, display name) pairs at setup. The key and
+    name are format strings that receive the sanitized item ID and the
+    display name, and ``lookup_fn`` finds the item again on each update.
+    ``legacy_key`` is the unique ID suffix an older single-item version of
+    the sensor used; it is migrated to the first item.
+    """
 
-    _attr_name = "UPS Runtime"
-    _attr_native_unit_of_measurement = None
-    _attr_device_class = None
-    _attr_state_class = None
-    _attr_icon = ICON_UPS
+    source_fn: Callable[[dict[str, Any]], Any] = lambda _data: None
+    items_fn: Callable[[dict[str, Any]], list[tuple[str, str]]]
+    lookup_fn: Callable[[UnraidDataUpdateCoordinator, str], Any]
+    legacy_key: str | None = None
 
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_ups_runtime"
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the state in human-readable format."""
-        runtime_seconds = self.coordinator.data.get(KEY_UPS, {}).get(
-            "runtime_left_seconds"
-        )
-        if runtime_seconds is None:
-            return None
+SENSOR_DESCRIPTIONS: tuple[UnraidSensorEntityDescription, ...] = (
+    # System sensors
+    UnraidSensorEntityDescription(
+        key="cpu_usage",
+        name="CPU Usage",
+        native_unit_of_measurement=PERCENTAGE,
+        device_class=SensorDeviceClass.POWER_FACTOR,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon=ICON_CPU,
+        suggested_display_precision=1,
+        category=KEY_SYSTEM,
+        source_fn=_category(KEY_SYSTEM),
+        value_fn=_rounded_field("cpu_usage_percent"),
+        attrs_fn=_cpu_attributes,
+        attrs_fields=("cpu_model", "cpu_cores", "cpu_threads", "cpu_mhz"),
+    ),
+    UnraidSensorEntityDescription(
+        key="ram_usage",
+        name="RAM Usage",
+        native_unit_of_measurement=PERCENTAGE,
+        device_class=SensorDeviceClass.POWER_FACTOR,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon=ICON_MEMORY,
+        suggested_display_precision=1,
+        category=KEY_SYSTEM,
+        source_fn=_category(KEY_SYSTEM),
+        value_fn=_rounded_field("ram_usage_percent"),
+        attrs_fn=_ram_attributes,
+        attrs_fields=(
+            "ram_total_bytes",
+            "ram_used_bytes",
+            "ram_free_bytes",
+            "ram_cached_bytes",
+            "ram_buffers_bytes",
+            "server_model",
+        ),
+    ),
+    UnraidSensorEntityDescription(
+        key="cpu_temperature",
+        name="CPU Temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon=ICON_TEMPERATURE,
+        suggested_display_precision=1,
+        category=KEY_SYSTEM,
+        source_fn=_category(KEY_SYSTEM),
+        value_fn=_field("cpu_temp_celsius"),
+    ),
+    UnraidSensorEntityDescription(
+        key="uptime",
+        name="Uptime",
+        icon=ICON_UPTIME,
+        category=KEY_SYSTEM,
+        source_fn=_category(KEY_SYSTEM),
+        value_fn=lambda system_data: _format_uptime(system_data.get("uptime_seconds")),
+        attrs_fn=_uptime_attributes,
+        attrs_fields=("hostname", "uptime_seconds"),
+    ),
+    UnraidSensorEntityDescription(
+        key="motherboard_temperature",
+        name="Motherboard Temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon=ICON_TEMPERATURE,
+        suggested_display_precision=1,
+        category=KEY_SYSTEM,
+        source_fn=_category(KEY_SYSTEM),
+        value_fn=_field("motherboard_temp_celsius"),
+        exists_fn=lambda data: bool(
+            data.get(KEY_SYSTEM, {}).get("motherboard_temp_celsius")
+        ),
+    ),
+    # Array sensors
+    UnraidSensorEntityDescription(
+        key="array_usage",
+        name="Array Usage",
+        native_unit_of_measurement=PERCENTAGE,
+        device_class=SensorDeviceClass.POWER_FACTOR,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon=ICON_ARRAY,
+        suggested_display_precision=1,
+        category=KEY_ARRAY,
+        source_fn=_category(KEY_ARRAY),
+        value_fn=_field("used_percent"),
+        attrs_fn=_array_attributes,
+        attrs_fields=("state", "num_disks", "num_data_disks", "num_parity_disks"),
+    ),
+    UnraidSensorEntityDescription(
+        key="parity_progress",
+        name="Parity Check Progress",
+        native_unit_of_measurement=PERCENTAGE,
+        device_class=SensorDeviceClass.POWER_FACTOR,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon=ICON_PARITY,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        suggested_display_precision=1,
+        category=KEY_ARRAY,
+        source_fn=_category(KEY_ARRAY),
+        value_fn=_field("parity_check_progress"),
+    ),
+    # Docker vDisk and log filesystem (if available)
+    UnraidSensorEntityDescription(
+        key="docker_vdisk_usage",
+        name="Docker vDisk Usage",
+        native_unit_of_measurement=PERCENTAGE,
+        device_class=SensorDeviceClass.POWER_FACTOR,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon=ICON_CONTAINER,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        suggested_display_precision=1,
+        category=KEY_DISKS,
+        source_fn=_disk_with_role("docker_vdisk"),
+        value_fn=_rounded_field("usage_percent"),
+        attrs_fn=_filesystem_attributes,
+        exists_fn=lambda data: _disk_with_role("docker_vdisk")(data) is not None,
+    ),
+    UnraidSensorEntityDescription(
+        key="log_filesystem_usage",
+        name="Log Filesystem Usage",
+        native_unit_of_measurement=PERCENTAGE,
+        device_class=SensorDeviceClass.POWER_FACTOR,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:file-document-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        suggested_display_precision=1,
+        category=KEY_DISKS,
+        source_fn=_disk_with_role("log"),
+        value_fn=_rounded_field("usage_percent"),
+        attrs_fn=_log_attributes,
+        exists_fn=lambda data: _disk_with_role("log")(data) is not None,
+    ),
+    # UPS sensors (if UPS connected)
+    UnraidSensorEntityDescription(
+        key="ups_battery",
+        name="UPS Battery",
+        native_unit_of_measurement=PERCENTAGE,
+        device_class=SensorDeviceClass.BATTERY,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon=ICON_UPS,
+        suggested_display_precision=1,
+        category=KEY_UPS,
+        source_fn=_category(KEY_UPS),
+        value_fn=_field("battery_charge_percent"),
+        exists_fn=lambda data: bool(data.get(KEY_UPS, {}).get("connected")),
+    ),
+    UnraidSensorEntityDescription(
+        key="ups_load",
+        name="UPS Load",
+        native_unit_of_measurement=PERCENTAGE,
+        device_class=SensorDeviceClass.POWER_FACTOR,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon=ICON_UPS,
+        suggested_display_precision=1,
+        category=KEY_UPS,
+        source_fn=_category(KEY_UPS),
+        value_fn=_field("load_percent"),
+        exists_fn=lambda data: bool(data.get(KEY_UPS, {}).get("connected")),
+    ),
+    UnraidSensorEntityDescription(
+        key="ups_runtime",
+        name="UPS Runtime",
+        icon=ICON_UPS,
+        category=KEY_UPS,
+        source_fn=_category(KEY_UPS),
+        value_fn=_format_runtime,
+        attrs_fn=_ups_runtime_attributes,
+        attrs_fields=("runtime_left_seconds",),
+        exists_fn=lambda data: bool(data.get(KEY_UPS, {}).get("connected")),
+    ),
+    UnraidSensorEntityDescription(
+        key="ups_power",
+        name="UPS Power",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon=ICON_POWER,
+        suggested_display_precision=1,
+        category=KEY_UPS,
+        source_fn=_category(KEY_UPS),
+        value_fn=_rounded_field("power_watts"),
+        attrs_fn=_ups_power_attributes,
+        attrs_fields=(
+            "status",
+            "model",
+            "load_percent",
+            "input_voltage",
+            "output_voltage",
+        ),
+        exists_fn=lambda data: bool(data.get(KEY_UPS, {}).get("connected")),
+    ),
+)
 
-        # Convert to hours and minutes for better readability
-        if runtime_seconds >= 3600:
-            hours = runtime_seconds / 3600
-            return f"{hours:.1f} hours"
-        minutes = runtime_seconds / 60
-        return f"{minutes:.0f} minutes"
+ITEM_SENSOR_DESCRIPTIONS: tuple[UnraidItemSensorEntityDescription, ...] = (
+    # Fan sensors (one per fan)
+    UnraidItemSensorEntityDescription(
+        key="fan_{}",
+        name="Fan {}",
+        native_unit_of_measurement="RPM",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:fan",
+        suggested_display_precision=0,
+        category=KEY_SYSTEM,
+        items_fn=_fan_items,
+        lookup_fn=_lookup_fan,
+        value_fn=_field("rpm"),
+    ),
+    # Disk health for physical disks only; virtual filesystems like
+    # docker_vdisk and log don't have SMART data
+    UnraidItemSensorEntityDescription(
+        key="disk_{}_health",
+        name="Disk {} Health",
+        icon="mdi:heart-pulse",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        category=KEY_DISKS,
+        items_fn=_disk_items(
+            lambda disk, _name: disk.get("role", "") not in ("docker_vdisk", "log")
+        ),
+        lookup_fn=_lookup_disk,
+        value_fn=_disk_health,
+        attrs_fn=_health_attributes,
+    ),
+    # Disk usage, skipping parity disks which don't have usage data
+    UnraidItemSensorEntityDescription(
+        key="disk_{}_usage",
+        name="Disk {} Usage",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:harddisk",
+        suggested_display_precision=1,
+        category=KEY_DISKS,
+        items_fn=_disk_items(lambda _disk, name: name not in ("parity", "parity2")),
+        lookup_fn=_lookup_disk,
+        value_fn=_disk_usage,
+        attrs_fn=_disk_attributes,
+        # API provides usage_percent even for standby disks, keep the last
+        # known value when a disk temporarily reports none
+        keep_last_value=True,
+    ),
+    # GPU sensors (one set per GPU, optional metrics only when reported)
+    UnraidItemSensorEntityDescription(
+        key="gpu_{}_utilization",
+        name="GPU {} Utilization",
+        native_unit_of_measurement=PERCENTAGE,
+        device_class=SensorDeviceClass.POWER_FACTOR,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon=ICON_GPU,
+        suggested_display_precision=1,
+        category=KEY_GPU,
+        items_fn=_gpu_items(),
+        lookup_fn=_lookup_gpu,
+        value_fn=_field("utilization_gpu_percent"),
+        attrs_fn=_gpu_attributes,
+        attrs_fields=("name", "driver_version"),
+        legacy_key="gpu_utilization",
+    ),
+    UnraidItemSensorEntityDescription(
+        key="gpu_{}_cpu_temperature",
+        name="GPU {} CPU Temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon=ICON_TEMPERATURE,
+        suggested_display_precision=1,
+        category=KEY_GPU,
+        items_fn=_gpu_items(),
+        lookup_fn=_lookup_gpu,
+        value_fn=_field("cpu_temperature_celsius"),
+        attrs_fn=_gpu_attributes,
+        attrs_fields=("name", "driver_version"),
+        legacy_key="gpu_cpu_temperature",
+    ),
+    UnraidItemSensorEntityDescription(
+        key="gpu_{}_power",
+        name="GPU {} Power",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon=ICON_POWER,
+        suggested_display_precision=1,
+        category=KEY_GPU,
+        items_fn=_gpu_items(),
+        lookup_fn=_lookup_gpu,
+        value_fn=_field("power_draw_watts"),
+        attrs_fn=_gpu_attributes,
+        attrs_fields=("name", "driver_version"),
+        legacy_key="gpu_power",
+    ),
+    UnraidItemSensorEntityDescription(
+        key="gpu_{}_memory_utilization",
+        name="GPU {} Memory Utilization",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon=ICON_MEMORY,
+        suggested_display_precision=1,
+        category=KEY_GPU,
+        items_fn=_gpu_items("utilization_memory_percent"),
+        lookup_fn=_lookup_gpu,
+        value_fn=_field("utilization_memory_percent"),
+        attrs_fn=_gpu_attributes,
+        attrs_fields=("name", "driver_version"),
+    ),
+    UnraidItemSensorEntityDescription(
+        key="gpu_{}_encoder_utilization",
+        name="GPU {} Encoder Utilization",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon=ICON_GPU,
+        suggested_display_precision=1,
+        category=KEY_GPU,
+        items_fn=_gpu_items("utilization_encoder_percent"),
+        lookup_fn=_lookup_gpu,
+        value_fn=_field("utilization_encoder_percent"),
+        attrs_fn=_gpu_attributes,
+        attrs_fields=("name", "driver_version"),
+    ),
+    UnraidItemSensorEntityDescription(
+        key="gpu_{}_decoder_utilization",
+        name="GPU {} Decoder Utilization",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon=ICON_GPU,
+        suggested_display_precision=1,
+        category=KEY_GPU,
+        items_fn=_gpu_items("utilization_decoder_percent"),
+        lookup_fn=_lookup_gpu,
+        value_fn=_field("utilization_decoder_percent"),
+        attrs_fn=_gpu_attributes,
+        attrs_fields=("name", "driver_version"),
+    ),
+)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra attributes."""
-        runtime_seconds = self.coordinator.data.get(KEY_UPS, {}).get(
-            "runtime_left_seconds"
-        )
-        if runtime_seconds is not None:
-            return {"runtime_seconds": runtime_seconds}
-        return {}
 
+class UnraidSensor(UnraidSensorBase):
+    """Sensor evaluated from an UnraidSensorEntityDescription."""
 
-class UnraidUPSPowerSensor(UnraidSensorBase):
-    """UPS power consumption sensor for Energy Dashboard."""
+    entity_description: UnraidSensorEntityDescription
 
-    _attr_name = "UPS Power"
-    _attr_native_unit_of_measurement = UnitOfPower.WATT
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = ICON_POWER
-    _attr_suggested_display_precision = 1
+    def __init__(
+        self,
+        coordinator: UnraidDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: UnraidSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self._category = description.category
+        super().__init__(coordinator, entry)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._last_value: Any = None
 
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_ups_power"
+    def _source(self) -> Any:
+        """Return the data this sensor reads its state from."""
+        return self.entity_description.source_fn(self.coordinator.data)
 
     @property
-    def native_value(self) -> float | None:
+    def native_value(self) -> Any:
         """Return the state."""
-        ups_data = self.coordinator.data.get(KEY_UPS, {})
-        power_watts = ups_data.get("power_watts")
-
-        # Return power_watts if available
-        if power_watts is not None:
-            return round(power_watts, 1)
-
-        return None
+        source = self._source()
+        value = self.entity_description.value_fn(source) if source is not None else None
+        if not self.entity_description.keep_last_value:
+            return value
+        if value is not None:
+            self._last_value = value
+        return self._last_value
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return extra attributes."""
-        ups_data = self.coordinator.data.get(KEY_UPS, {})
+        description = self.entity_description
+        if description.attrs_fn is None:
+            return None
+        source = self._source()
+        if source is None:
+            return {}
+        if description.attrs_fields is None:
+            key = source
+        else:
+            key = tuple(source.get(field) for field in description.attrs_fields)
+        return self._memoized_attributes(key, lambda: description.attrs_fn(source))
 
-        attributes = {
-            ATTR_UPS_STATUS: ups_data.get("status"),
-            ATTR_UPS_MODEL: ups_data.get("model"),
-        }
 
-        # Add load percentage
-        load_percent = ups_data.get("load_percent")
-        if load_percent is not None:
-            attributes["load_percent"] = load_percent
+class UnraidItemSensor(UnraidSensor):
+    """Sensor for one item, evaluated from an UnraidItemSensorEntityDescription."""
 
-        # Add input/output voltage if available
-        input_voltage = ups_data.get("input_voltage")
-        if input_voltage is not None:
-            attributes["input_voltage"] = input_voltage
+    entity_description: UnraidItemSensorEntityDescription
 
-        output_voltage = ups_data.get("output_voltage")
-        if output_voltage is not None:
-            attributes["output_voltage"] = output_voltage
+    def __init__(
+        self,
+        coordinator: UnraidDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: UnraidItemSensorEntityDescription,
+        item_id: str,
+        item_name: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, description)
+        self._item_id = item_id
+        self._attr_name = description.name.format(item_name)
+        self._attr_unique_id = (
+            f"{entry.entry_id}_{description.key.format(_slug(item_id))}"
+        )
 
-        return attributes
+    def _source(self) -> Any:
+        """Return the item this sensor reads its state from."""
+        return self.entity_description.lookup_fn(self.coordinator, self._item_id)
 
 
 # Network Sensors
 
 
-class UnraidNetworkRXSensor(UnraidSensorBase):
-    """Network inbound traffic sensor."""
+# Counter field and name suffix of each traffic direction
+NETWORK_DIRECTIONS: dict[str, tuple[str, str]] = {
+    "rx": ("bytes_received", "Inbound"),
+    "tx": ("bytes_sent", "Outbound"),
+}
+
+
+class UnraidNetworkRateSensor(UnraidSensorBase):
+    """Network traffic sensor for one direction of an interface."""
 
     _attr_native_unit_of_measurement = UnitOfDataRate.BITS_PER_SECOND
     _attr_device_class = SensorDeviceClass.DATA_RATE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_suggested_display_precision = 2
+    _attr_icon = ICON_NETWORK
+    _category = KEY_NETWORK
 
     def __init__(
         self,
         coordinator: UnraidDataUpdateCoordinator,
         entry: ConfigEntry,
         interface_name: str,
+        direction: str,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
         self._interface_name = interface_name
-        self._attr_name = f"Network {interface_name} Inbound"
-        self._attr_icon = ICON_NETWORK
-        self._last_bytes = None
-        self._last_update = None
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_network_{self._interface_name}_rx"
+        self._counter, label = NETWORK_DIRECTIONS[direction]
+        self._attr_name = f"Network {interface_name} {label}"
+        # Interface names were never slugged; keep the existing unique IDs
+        self._attr_unique_id = f"{entry.entry_id}_network_{interface_name}_{direction}"
+        # Counter and sample time the rate is measured from, and the sample
+        # the current rate was computed for
+        self._last_bytes: int | None = None
+        self._last_sampled_at: float | None = None
+        self._rate_sample: float | None = None
+        self._rate: float | None = None
+
+    def _interface(self) -> dict[str, Any] | None:
+        """Return the data of this sensor's interface."""
+        for interface in self.coordinator.data.get(KEY_NETWORK, []):
+            if interface.get("name") == self._interface_name:
+                return interface
+        return None
 
     @property
     def native_value(self) -> float | None:
         """Return the state in bits per second."""
-        from datetime import datetime
-
-        for interface in self.coordinator.data.get(KEY_NETWORK, []):
-            if interface.get("name") == self._interface_name:
-                bytes_received = interface.get("bytes_received")
-                if bytes_received is None:
-                    return None
-
-                # Get current time
-                now = datetime.now()
-
-                # If we have previous data, calculate rate
-                if self._last_bytes is not None and self._last_update is not None:
-                    time_diff = (now - self._last_update).total_seconds()
-                    if time_diff > 0:
-                        bytes_diff = bytes_received - self._last_bytes
-                        # Calculate bytes per second, then convert to bits per second
-                        bytes_per_second = bytes_diff / time_diff
-                        bits_per_second = bytes_per_second * 8
-
-                        # Update tracking variables
-                        self._last_bytes = bytes_received
-                        self._last_update = now
-
-                        # Return rate (can be negative if counter reset, return 0 in that case)
-                        return max(0.0, bits_per_second)
-
-                # First run or after reset - store values and return 0
-                self._last_bytes = bytes_received
-                self._last_update = now
-                return 0.0
+        interface = self._interface()
+        if interface is None:
+            return None
+        byte_count = interface.get(self._counter)
+        if byte_count is None:
+            return None
 
-        return None
+        # States can be written again without a new sample, e.g. when
+        # availability changes; only a new sample moves the rate
+        received_at = self.coordinator.received_at.get(KEY_NETWORK)
+        if received_at == self._rate_sample and self._rate is not None:
+            return self._rate
+        self._rate_sample = received_at
+
+        # Measure against the agent's sample time, not when it arrived here
+        sampled_at = _sample_time(interface, received_at)
+        if (
+            self._last_bytes is None
+            or self._last_sampled_at is None
+            or sampled_at is None
+            or byte_count < self._last_bytes
+        ):
+            # First sample or counter reset, nothing to measure against yet
+            self._rate = 0.0
+        elif sampled_at > self._last_sampled_at:
+            bytes_diff = byte_count - self._last_bytes
+            self._rate = bytes_diff / (sampled_at - self._last_sampled_at) * 8
+        elif byte_count == self._last_bytes:
+            # The agent reported the same sample again
+            self._rate = 0.0
+        else:
+            return self._rate
+        self._last_bytes = byte_count
+        self._last_sampled_at = sampled_at
+        return self._rate
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        for interface in self.coordinator.data.get(KEY_NETWORK, []):
-            if interface.get("name") == self._interface_name:
-                # Format network speed
-                speed_mbps = interface.get("speed_mbps")
-                if speed_mbps is not None and speed_mbps > 0:
-                    if speed_mbps >= 1000:
-                        network_speed = f"{speed_mbps / 1000:.0f} Gbps"
-                    else:
-                        network_speed = f"{speed_mbps} Mbps"
-                else:
-                    network_speed = "Unknown"
-
-                # Get IP address or show "N/A" if empty
-                ip_address = interface.get("ip_address") or "N/A"
-
-                # Get status (API uses "state" field)
-                status = interface.get("state", "unknown")
-
-                return {
-                    ATTR_NETWORK_MAC: interface.get("mac_address"),
-                    ATTR_NETWORK_IP: ip_address,
-                    ATTR_NETWORK_SPEED: network_speed,
-                    "status": status,
-                    "interface": self._interface_name,
-                }
-        return {}
+        interface = self._interface()
+        if interface is None:
+            return {}
+        # Traffic counters change on every update, the attributes do not
+        return self._memoized_attributes(
+            (
+                interface.get("mac_address"),
+                interface.get("ip_address"),
+                interface.get("speed_mbps"),
+                interface.get("state"),
+            ),
+            lambda: _network_attributes(interface, self._interface_name),
+        )
 
 
-class UnraidNetworkTXSensor(UnraidSensorBase):
-    """Network outbound traffic sensor."""
+# Share Sensors
 
-    _attr_native_unit_of_measurement = UnitOfDataRate.BITS_PER_SECOND
-    _attr_device_class = SensorDeviceClass.DATA_RATE
+
+class UnraidShareUsageSensor(UnraidSensorBase):
+    """
+    Share usage sensor.
+
+    Looks its share up in the coordinator's item index and only writes state
+    when that share changed, so a large number of shares stays cheap.
+    """
+
+    _attr_native_unit_of_measurement = PERCENTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_suggested_display_precision = 2
+    _attr_icon = ICON_SHARE
+    _attr_suggested_display_precision = 1
+    _category = KEY_SHARES
 
     def __init__(
         self,
         coordinator: UnraidDataUpdateCoordinator,
         entry: ConfigEntry,
-        interface_name: str,
+        share_name: str,
+        *,
+        enabled_default: bool,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
-        self._interface_name = interface_name
-        self._attr_name = f"Network {interface_name} Outbound"
-        self._attr_icon = ICON_NETWORK
-        self._last_bytes = None
-        self._last_update = None
+        self._share_name = share_name
+        self._attr_name = f"Share {share_name} Usage"
+        self._attr_unique_id = f"{entry.entry_id}_share_{_slug(share_name)}_usage"
+        self._attr_entity_registry_enabled_default = enabled_default
+        self._share = coordinator.get_item(KEY_SHARES, share_name)
+        self._health = (coordinator.last_update_success, coordinator.stale)
 
     @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_network_{self._interface_name}_tx"
+    def available(self) -> bool:
+        """Return True if the share is still reported by the server."""
+        return super().available and self._share is not None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when this share, availability or staleness changed."""
+        share = self.coordinator.get_item(KEY_SHARES, self._share_name)
+        health = (self.coordinator.last_update_success, self.coordinator.stale)
+        if share is self._share and health == self._health:
+            return
+        self._share = share
+        self._health = health
+        self.async_write_ha_state()
 
     @property
     def native_value(self) -> float | None:
-        """Return the state in bits per second."""
-        from datetime import datetime
-
-        for interface in self.coordinator.data.get(KEY_NETWORK, []):
-            if interface.get("name") == self._interface_name:
-                bytes_sent = interface.get("bytes_sent")
-                if bytes_sent is None:
-                    return None
-
-                # Get current time
-                now = datetime.now()
-
-                # If we have previous data, calculate rate
-                if self._last_bytes is not None and self._last_update is not None:
-                    time_diff = (now - self._last_update).total_seconds()
-                    if time_diff > 0:
-                        bytes_diff = bytes_sent - self._last_bytes
-                        # Calculate bytes per second, then convert to bits per second
-                        bytes_per_second = bytes_diff / time_diff
-                        bits_per_second = bytes_per_second * 8
-
-                        # Update tracking variables
-                        self._last_bytes = bytes_sent
-                        self._last_update = now
-
-                        # Return rate (can be negative if counter reset, return 0 in that case)
-                        return max(0.0, bits_per_second)
-
-                # First run or after reset - store values and return 0
-                self._last_bytes = bytes_sent
-                self._last_update = now
-                return 0.0
-
-        return None
+        """Return the state."""
+        if self._share is None:
+            return None
+        usage_percent = self._share.get("usage_percent")
+        if usage_percent is None:
+            return None
+        return round(usage_percent, 1)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        for interface in self.coordinator.data.get(KEY_NETWORK, []):
-            if interface.get("name") == self._interface_name:
-                # Format network speed
-                speed_mbps = interface.get("speed_mbps")
-                if speed_mbps is not None and speed_mbps > 0:
-                    if speed_mbps >= 1000:
-                        network_speed = f"{speed_mbps / 1000:.0f} Gbps"
-                    else:
-                        network_speed = f"{speed_mbps} Mbps"
-                else:
-                    network_speed = "Unknown"
-
-                # Get IP address or show "N/A" if empty
-                ip_address = interface.get("ip_address") or "N/A"
-
-                # Get status (API uses "state" field)
-                status = interface.get("state", "unknown")
-
-                return {
-                    ATTR_NETWORK_MAC: interface.get("mac_address"),
-                    ATTR_NETWORK_IP: ip_address,
-                    ATTR_NETWORK_SPEED: network_speed,
-                    "status": status,
-                    "interface": self._interface_name,
-                }
-        return {}
+        share = self._share
+        if share is None:
+            return {}
+        return self._memoized_attributes(
+            share,
+            lambda: {
+                "size": _format_gb(share.get("size_bytes")),
+                "used": _format_gb(share.get("used_bytes")),
+                "free": _format_gb(share.get("free_bytes")),
+            },
+        )
 
 
-class UnraidDiskUsageSensor(UnraidSensorBase):
-    """Disk usage sensor."""
+class UnraidTopSharesSensor(UnraidSensorBase):
+    """Usage of the fullest share, with the top shares as attributes."""
 
+    _attr_name = "Top Share Usage"
+    _unique_key = "shares_top"
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = "mdi:harddisk"
+    _attr_icon = ICON_SHARE
     _attr_suggested_display_precision = 1
+    _category = KEY_SHARES
 
     def __init__(
         self,
         coordinator: UnraidDataUpdateCoordinator,
         entry: ConfigEntry,
-        disk_id: str,
-        disk_name: str,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
-        self._disk_id = disk_id
-        self._disk_name = disk_name
-        self._attr_name = f"Disk {disk_name} Usage"
-        self._last_known_value = None
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        # Sanitize disk ID for unique ID
-        safe_id = self._disk_id.replace(" ", "_").replace("/", "_").lower()
-        return f"{self._entry.entry_id}_disk_{safe_id}_usage"
+        self._shares: list[dict[str, Any]] | None = None
+        self._top: list[dict[str, Any]] = []
+        self._refresh_top()
+        self._health = (coordinator.last_update_success, coordinator.stale)
+
+    def _refresh_top(self) -> bool:
+        """Recompute the ranking if the share list changed, return True if so."""
+        shares = self.coordinator.data.get(KEY_SHARES)
+        # The coordinator keeps the same list object while no share changed
+        if shares is self._shares:
+            return False
+        self._shares = shares
+        self._top = _fullest_shares(shares or [])
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the share list, availability or staleness changed."""
+        health = (self.coordinator.last_update_success, self.coordinator.stale)
+        if not self._refresh_top() and health == self._health:
+            return
+        self._health = health
+        self.async_write_ha_state()
 
     @property
     def native_value(self) -> float | None:
         """Return the state."""
-        for disk in self.coordinator.data.get(KEY_DISKS, []):
-            disk_id = disk.get("id", disk.get("name"))
-            if disk_id == self._disk_id:
-                spin_state = disk.get("spin_state", "active")
-                usage_percent = disk.get("usage_percent")
+        if not self._top:
+            return None
+        return round(self._top[0]["usage_percent"], 1)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra attributes."""
+        return {
+            "shares": [
+                {
+                    "name": share.get("name"),
+                    "usage_percent": round(share["usage_percent"], 1),
+                    "free": _format_gb(share.get("free_bytes")),
+                }
+                for share in self._top
+            ]
+        }
 
-                # Calculate usage_percent if not provided by API
-                if usage_percent is None:
-                    size_bytes = disk.get("size_bytes", 0)
-                    used_bytes = disk.get("used_bytes", 0)
-                    if size_bytes > 0 and used_bytes > 0:
-                        usage_percent = (used_bytes / size_bytes) * 100
 
-                # Update last known value if we have a valid percentage
-                # (API provides usage_percent even for standby disks)
-                if usage_percent is not None:
-                    self._last_known_value = round(usage_percent, 1)
+# WebSocket Diagnostic Sensors
 
-                # Return the last known value (works for both active and standby)
-                return self._last_known_value
 
-        return self._last_known_value
+class UnraidWebSocketMessagesSensor(UnraidSensorBase):
+    """WebSocket message throughput diagnostic sensor."""
+
+    _attr_name = "WebSocket Messages"
+    _unique_key = "websocket_messages"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_icon = ICON_WEBSOCKET
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of messages received."""
+        return self.coordinator.websocket_stats.total_messages
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        for disk in self.coordinator.data.get(KEY_DISKS, []):
-            disk_id = disk.get("id", disk.get("name"))
-            if disk_id == self._disk_id:
-                size_bytes = disk.get("size_bytes", 0)
-                used_bytes = disk.get("used_bytes", 0)
-                free_bytes = disk.get("free_bytes", 0)
-                spin_state = disk.get("spin_state", "active")
-                temperature = disk.get("temperature_celsius")
-
-                # Validate disk size calculation (Fix #5)
-                # Note: Some API data may have inconsistent size/used/free values
-                # This is an API issue, not a sensor issue
-                if size_bytes and free_bytes and size_bytes < free_bytes:
-                    # If size < free, use free as the actual size (API data issue)
-                    actual_size = free_bytes
-                else:
-                    actual_size = size_bytes
-
-                attrs = {
-                    "device": disk.get("device"),
-                    "status": disk.get("status"),
-                    "filesystem": disk.get("filesystem"),
-                    "mount_point": disk.get("mount_point"),
-                    "spin_state": spin_state,
-                    "size": (
-                        f"{actual_size / (1024**3):.2f} GB"
-                        if actual_size is not None and actual_size > 0
-                        else "Unknown"
-                    ),
-                    "used": (
-                        f"{used_bytes / (1024**3):.2f} GB"
-                        if used_bytes is not None and used_bytes > 0
-                        else "Unknown"
-                    ),
-                    "free": (
-                        f"{free_bytes / (1024**3):.2f} GB"
-                        if free_bytes is not None and free_bytes > 0
-                        else "Unknown"
-                    ),
-                    "smart_status": disk.get("smart_status"),
-                    "smart_errors": disk.get("smart_errors", 0),
-                }
-
-                # Add temperature if available (will be 0 or None when spun down)
-                if temperature is not None and temperature > 0:
-                    attrs["temperature_celsius"] = temperature
-                elif spin_state in ("standby", "idle"):
-                    attrs["temperature_celsius"] = "Disk in standby"
-
-                return attrs
-        return {}
+        stats = self.coordinator.websocket_stats
+        return {
+            "total_bytes": stats.total_bytes,
+            "decode_errors": stats.decode_errors,
+            "last_message_at": stats.last_message_at,
+            "topics": {
+                topic: {"messages": summary["messages"], "bytes": summary["bytes"]}
+                for topic, summary in stats.topic_summary().items()
+            },
+        }
 
 
-class UnraidDiskHealthSensor(UnraidSensorBase):
-    """Disk health diagnostic sensor."""
+class UnraidWebSocketLatencySensor(UnraidSensorBase):
+    """WebSocket server-to-HA latency diagnostic sensor."""
 
-    _attr_native_unit_of_measurement = None
-    _attr_state_class = None
-    _attr_icon = "mdi:heart-pulse"
+    _attr_name = "WebSocket Latency"
+    _unique_key = "websocket_latency"
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = ICON_WEBSOCKET
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_suggested_display_precision = 0
 
-    def __init__(
-        self,
-        coordinator: UnraidDataUpdateCoordinator,
-        entry: ConfigEntry,
-        disk_id: str,
-        disk_name: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, entry)
-        self._disk_id = disk_id
-        self._disk_name = disk_name
-        self._attr_name = f"Disk {disk_name} Health"
+    @property
+    def native_value(self) -> float | None:
+        """Return the average latency of timestamped frames in milliseconds."""
+        latency = self.coordinator.websocket_stats.average_latency
+        if latency is not None:
+            return round(latency * 1000, 1)
+        return None
 
     @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        # Sanitize disk ID for unique ID
-        safe_id = self._disk_id.replace(" ", "_").replace("/", "_").lower()
-        return f"{self._entry.entry_id}_disk_{safe_id}_health"
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra attributes."""
+        topics = self.coordinator.websocket_stats.topic_summary()
+        return {
+            topic: {
+                "avg_latency_ms": summary["avg_latency_ms"],
+                "max_latency_ms": summary["max_latency_ms"],
+                "avg_decode_ms": summary["avg_decode_ms"],
+                "avg_apply_ms": summary["avg_apply_ms"],
+            }
+            for topic, summary in topics.items()
+        }
+
+
+class UnraidWebSocketReconnectsSensor(UnraidSensorBase):
+    """WebSocket reconnect count diagnostic sensor."""
+
+    _attr_name = "WebSocket Reconnects"
+    _unique_key = "websocket_reconnects"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_icon = ICON_WEBSOCKET
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
 
     @property
-    def native_value(self) -> str | None:
-        """Return the state."""
-        for disk in self.coordinator.data.get(KEY_DISKS, []):
-            disk_id = disk.get("id", disk.get("name"))
-            if disk_id == self._disk_id:
-                smart_status = disk.get("smart_status", "").upper()
-                # Map API values to user-friendly display
-                if smart_status == "PASSED":
-                    return "Healthy"
-                if smart_status == "FAILED":
-                    return "Failed"
-                if smart_status == "UNKNOWN":
-                    # For NVMe drives, UNKNOWN status with no errors means healthy
-                    # Check if disk is active and has no SMART errors
-                    disk_status = disk.get("status", "")
-                    smart_errors = disk.get("smart_errors", 0)
-                    if disk_status == "DISK_OK" and smart_errors == 0:
-                        return "Healthy"
-                    return "Unknown"
-                if smart_status:
-                    return smart_status.capitalize()
-                return "Unknown"
-        return "Unknown"
+    def native_value(self) -> int:
+        """Return the number of reconnects since startup."""
+        return self.coordinator.websocket_stats.reconnect_count
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        for disk in self.coordinator.data.get(KEY_DISKS, []):
-            disk_id = disk.get("id", disk.get("name"))
-            if disk_id == self._disk_id:
-                smart_status = disk.get("smart_status", "").upper()
-                smart_errors = disk.get("smart_errors", 0)
-                disk_status = disk.get("status", "")
-
-                # Provide user-friendly SMART status in attributes
-                # Match the logic used in native_value for consistency
-                if smart_status == "PASSED":
-                    friendly_status = "PASSED"
-                elif smart_status == "FAILED":
-                    friendly_status = "FAILED"
-                elif smart_status == "UNKNOWN":
-                    # For disks with UNKNOWN status, check if they're healthy
-                    if disk_status == "DISK_OK" and smart_errors == 0:
-                        friendly_status = "PASSED (inferred)"
-                    else:
-                        friendly_status = "UNKNOWN"
-                elif smart_status:
-                    friendly_status = smart_status
-                else:
-                    friendly_status = "UNKNOWN"
-
-                return {
-                    "smart_status": friendly_status,
-                    "smart_errors": smart_errors,
-                    "device": disk.get("device"),
-                }
-        return {}
+        stats = self.coordinator.websocket_stats
+        return {
+            "connected_since": stats.connected_since,
+            "history": list(stats.history),
+        }
 
 
-class UnraidDockerVDiskUsageSensor(UnraidSensorBase):
-    """Docker vDisk usage sensor."""
+# Agent Responsiveness Diagnostic Sensors
 
-    _attr_name = "Docker vDisk Usage"
-    _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_device_class = SensorDeviceClass.POWER_FACTOR
+
+class UnraidRefreshTimeSensor(UnraidSensorBase):
+    """Refresh duration percentile diagnostic sensor."""
+
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_device_class = SensorDeviceClass.DURATION
     _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = ICON_CONTAINER
+    _attr_icon = ICON_REFRESH_TIME
     _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_suggested_display_precision = 1
+    _attr_entity_registry_enabled_default = False
+    _attr_suggested_display_precision = 0
 
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_docker_vdisk_usage"
+    def __init__(
+        self,
+        coordinator: UnraidDataUpdateCoordinator,
+        entry: ConfigEntry,
+        percentile: int,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self._percentile = percentile
+        self._attr_name = f"Refresh Time P{percentile}"
+        self._attr_unique_id = f"{entry.entry_id}_refresh_time_p{percentile}"
 
     @property
     def native_value(self) -> float | None:
-        """Return the state."""
-        for disk in self.coordinator.data.get(KEY_DISKS, []):
-            if disk.get("role") == "docker_vdisk":
-                usage_percent = disk.get("usage_percent")
-                if usage_percent is not None:
-                    return round(usage_percent, 1)
+        """Return the refresh duration percentile in milliseconds."""
+        duration = self.coordinator.refresh_durations.percentile(self._percentile / 100)
+        if duration is not None:
+            return round(duration * 1000, 1)
         return None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        for disk in self.coordinator.data.get(KEY_DISKS, []):
-            if disk.get("role") == "docker_vdisk":
-                size_bytes = disk.get("size_bytes", 0)
-                used_bytes = disk.get("used_bytes", 0)
-                free_bytes = disk.get("free_bytes", 0)
-
-                return {
-                    "mount_point": disk.get("mount_point"),
-                    "size": (
-                        f"{size_bytes / (1024**3):.2f} GB"
-                        if size_bytes is not None and size_bytes > 0
-                        else "Unknown"
-                    ),
-                    "used": (
-                        f"{used_bytes / (1024**3):.2f} GB"
-                        if used_bytes is not None and used_bytes > 0
-                        else "Unknown"
-                    ),
-                    "free": (
-                        f"{free_bytes / (1024**3):.2f} GB"
-                        if free_bytes is not None and free_bytes > 0
-                        else "Unknown"
-                    ),
-                }
-        return {}
+        key = f"p{self._percentile}_ms"
+        return {
+            "refreshes": len(self.coordinator.refresh_durations),
+            "endpoints": {
+                endpoint: summary[key]
+                for endpoint, summary in (
+                    self.coordinator.client.request_stats.as_dict().items()
+                )
+            },
+        }
 
 
-class UnraidLogFilesystemUsageSensor(UnraidSensorBase):
-    """Log filesystem usage sensor."""
+class UnraidApiErrorRateSensor(UnraidSensorBase):
+    """Rolling API request error rate diagnostic sensor."""
 
-    _attr_name = "Log Filesystem Usage"
+    _attr_name = "API Error Rate"
+    _unique_key = "api_error_rate"
     _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_device_class = SensorDeviceClass.POWER_FACTOR
     _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = "mdi:file-document-outline"
+    _attr_icon = ICON_ERROR_RATE
     _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_suggested_display_precision = 1
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_log_filesystem_usage"
+    _attr_entity_registry_enabled_default = False
 
     @property
     def native_value(self) -> float | None:
-        """Return the state."""
-        for disk in self.coordinator.data.get(KEY_DISKS, []):
-            if disk.get("role") == "log":
-                usage_percent = disk.get("usage_percent")
-                if usage_percent is not None:
-                    return round(usage_percent, 1)
-        return None
+        """Return the percentage of recent requests that failed."""
+        return self.coordinator.client.request_stats.error_rate
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        for disk in self.coordinator.data.get(KEY_DISKS, []):
-            if disk.get("role") == "log":
-                size_bytes = disk.get("size_bytes", 0)
-                used_bytes = disk.get("used_bytes", 0)
-                free_bytes = disk.get("free_bytes", 0)
-
-                # Log filesystem is typically small (MB range), so format accordingly
-                # If size is less than 1 GB, show in MB
-                if size_bytes and size_bytes < 1024**3:
-                    size_str = f"{size_bytes / (1024**2):.2f} MB"
-                    used_str = f"{used_bytes / (1024**2):.2f} MB"
-                    free_str = f"{free_bytes / (1024**2):.2f} MB"
-                else:
-                    size_str = f"{size_bytes / (1024**3):.2f} GB"
-                    used_str = f"{used_bytes / (1024**3):.2f} GB"
-                    free_str = f"{free_bytes / (1024**3):.2f} GB"
-
-                return {
-                    "mount_point": disk.get("mount_point"),
-                    "size": size_str if size_bytes > 0 else "Unknown",
-                    "used": used_str if used_bytes > 0 else "Unknown",
-                    "free": free_str if free_bytes > 0 else "Unknown",
-                }
-        return {}
+        return {
+            endpoint: summary["error_rate"]
+            for endpoint, summary in (
+                self.coordinator.client.request_stats.as_dict().items()
+            )
+        }
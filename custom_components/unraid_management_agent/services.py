@@ -0,0 +1,359 @@
+"""Services for Unraid Management Agent."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import voluptuous as vol
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID, ATTR_DEVICE_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+
+from .const import (
+    ATTR_CONTAINER_ID,
+    ATTR_TIMEOUT,
+    ATTR_VM_ID,
+    ATTR_WAIT_FOR_STATE,
+    DEFAULT_WAIT_TIMEOUT,
+    DOMAIN,
+    ITEM_ID_FIELDS,
+    KEY_ARRAY,
+    KEY_CONTAINERS,
+    KEY_VMS,
+)
+
+if TYPE_CHECKING:
+    from . import UnraidDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _ServiceAction(NamedTuple):
+    """A control service, the client method behind it and the state it leads to."""
+
+    method: str
+    key: str
+    # Field of the category (or of the item) holding the state to confirm
+    state_field: str
+    reached: Callable[[str], bool]
+    # Completes "Failed to ..." in errors
+    failure: str
+    # Service field with the container or VM to act on
+    id_field: str | None = None
+
+
+def _state_in(*states: str) -> Callable[[str], bool]:
+    """Return a check for a lower-cased state being one of states."""
+    return lambda state: state in states
+
+
+def _state_not_in(*states: str) -> Callable[[str], bool]:
+    """Return a check for a lower-cased state being none of states."""
+    return lambda state: state not in states
+
+
+_CONTAINER_UP = ("running", "paused", "restarting")
+_VM_UP = ("running", "paused", "idle", "in shutdown")
+
+SERVICE_ACTIONS: dict[str, _ServiceAction] = {
+    "container_start": _ServiceAction(
+        "start_container",
+        KEY_CONTAINERS,
+        "state",
+        _state_in("running"),
+        "start container",
+        ATTR_CONTAINER_ID,
+    ),
+    "container_stop": _ServiceAction(
+        "stop_container",
+        KEY_CONTAINERS,
+        "state",
+        _state_not_in(*_CONTAINER_UP),
+        "stop container",
+        ATTR_CONTAINER_ID,
+    ),
+    "container_restart": _ServiceAction(
+        "restart_container",
+        KEY_CONTAINERS,
+        "state",
+        _state_in("running"),
+        "restart container",
+        ATTR_CONTAINER_ID,
+    ),
+    "container_pause": _ServiceAction(
+        "pause_container",
+        KEY_CONTAINERS,
+        "state",
+        _state_in("paused"),
+        "pause container",
+        ATTR_CONTAINER_ID,
+    ),
+    "container_resume": _ServiceAction(
+        "unpause_container",
+        KEY_CONTAINERS,
+        "state",
+        _state_in("running"),
+        "resume container",
+        ATTR_CONTAINER_ID,
+    ),
+    "vm_start": _ServiceAction(
+        "start_vm", KEY_VMS, "state", _state_in("running"), "start VM", ATTR_VM_ID
+    ),
+    "vm_stop": _ServiceAction(
+        "stop_vm", KEY_VMS, "state", _state_not_in(*_VM_UP), "stop VM", ATTR_VM_ID
+    ),
+    "vm_restart": _ServiceAction(
+        "restart_vm", KEY_VMS, "state", _state_in("running"), "restart VM", ATTR_VM_ID
+    ),
+    "vm_pause": _ServiceAction(
+        "pause_vm", KEY_VMS, "state", _state_in("paused"), "pause VM", ATTR_VM_ID
+    ),
+    "vm_resume": _ServiceAction(
+        "resume_vm", KEY_VMS, "state", _state_in("running"), "resume VM", ATTR_VM_ID
+    ),
+    "vm_hibernate": _ServiceAction(
+        "hibernate_vm",
+        KEY_VMS,
+        "state",
+        _state_not_in(*_VM_UP),
+        "hibernate VM",
+        ATTR_VM_ID,
+    ),
+    "vm_force_stop": _ServiceAction(
+        "force_stop_vm",
+        KEY_VMS,
+        "state",
+        _state_not_in(*_VM_UP),
+        "force stop VM",
+        ATTR_VM_ID,
+    ),
+    "array_start": _ServiceAction(
+        "start_array", KEY_ARRAY, "state", _state_in("started"), "start array"
+    ),
+    "array_stop": _ServiceAction(
+        "stop_array", KEY_ARRAY, "state", _state_in("stopped"), "stop array"
+    ),
+    "parity_check_start": _ServiceAction(
+        "start_parity_check",
+        KEY_ARRAY,
+        "parity_check_status",
+        _state_in("running"),
+        "start parity check",
+    ),
+    "parity_check_stop": _ServiceAction(
+        "stop_parity_check",
+        KEY_ARRAY,
+        "parity_check_status",
+        _state_not_in("running", "paused"),
+        "stop parity check",
+    ),
+    "parity_check_pause": _ServiceAction(
+        "pause_parity_check",
+        KEY_ARRAY,
+        "parity_check_status",
+        _state_in("paused"),
+        "pause parity check",
+    ),
+    "parity_check_resume": _ServiceAction(
+        "resume_parity_check",
+        KEY_ARRAY,
+        "parity_check_status",
+        _state_in("running"),
+        "resume parity check",
+    ),
+}
+
+_COMMON_FIELDS = {
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Optional(ATTR_DEVICE_ID): cv.string,
+    vol.Optional(ATTR_WAIT_FOR_STATE, default=False): cv.boolean,
+    vol.Optional(ATTR_TIMEOUT, default=DEFAULT_WAIT_TIMEOUT): vol.All(
+        vol.Coerce(float), vol.Range(min=1, max=3600)
+    ),
+}
+
+
+def _action_state(
+    coordinator: UnraidDataUpdateCoordinator,
+    action: _ServiceAction,
+    target_id: str | None,
+    value: Any = None,
+) -> str | None:
+    """Return the lower-cased state an action acts on, from value or current data."""
+    if target_id is None:
+        data = value if value is not None else coordinator.data.get(action.key)
+    elif (data := coordinator.get_item(action.key, target_id)) is None:
+        # Services also accept a name where the item is indexed by id
+        data = next(
+            (
+                item
+                for item in coordinator.data.get(action.key, [])
+                if target_id
+                in (item.get(field) for field in ITEM_ID_FIELDS[action.key])
+            ),
+            None,
+        )
+    if not isinstance(data, dict) or data.get(action.state_field) is None:
+        return None
+    return str(data[action.state_field]).lower()
+
+
+async def _async_confirm_state(
+    coordinator: UnraidDataUpdateCoordinator,
+    action: _ServiceAction,
+    target_id: str | None,
+    wait_time: float,
+    sent_at: float,
+) -> bool:
+    """
+    Wait for a push or poll to show the state an action leads to.
+
+    Only data received after the action was sent at (a time.time()
+    timestamp) counts; a restart, or an action on an item already in its
+    target state, would otherwise be confirmed by the state from before.
+    """
+
+    def reached(value: Any) -> bool:
+        state = _action_state(coordinator, action, target_id, value)
+        return state is not None and action.reached(state)
+
+    # A push may have arrived while the agent was still answering
+    if coordinator.received_at.get(action.key, 0.0) > sent_at and reached(None):
+        return True
+    try:
+        await coordinator.async_wait_for_state(action.key, reached, wait_time)
+    except TimeoutError:
+        return False
+    return True
+
+
+@callback
+def _async_get_coordinator(
+    hass: HomeAssistant, call: ServiceCall
+) -> UnraidDataUpdateCoordinator:
+    """
+    Return the coordinator of the server a service call targets.
+
+    A device (the server or one of its containers or VMs) or a config entry
+    picks the server; without either, the only server set up is used.
+    """
+    coordinators: dict[str, UnraidDataUpdateCoordinator] = hass.data.get(DOMAIN, {})
+    entry_id: str | None = call.data.get(ATTR_CONFIG_ENTRY_ID)
+
+    if (device_id := call.data.get(ATTR_DEVICE_ID)) is not None:
+        device = dr.async_get(hass).async_get(device_id)
+        if device is None:
+            raise ServiceValidationError(f"Unknown device: {device_id}")
+        device_entry_id = next(
+            (
+                config_entry_id
+                for config_entry_id in device.config_entries
+                if config_entry_id in coordinators
+            ),
+            None,
+        )
+        if device_entry_id is None:
+            raise ServiceValidationError(
+                f"Device {device.name} does not belong to a loaded Unraid server"
+            )
+        if entry_id is not None and entry_id != device_entry_id:
+            raise ServiceValidationError(
+                f"Device {device.name} does not belong to config entry {entry_id}"
+            )
+        entry_id = device_entry_id
+
+    if entry_id is not None:
+        if (coordinator := coordinators.get(entry_id)) is None:
+            raise ServiceValidationError(
+                f"Config entry {entry_id} is not a loaded Unraid server"
+            )
+        return coordinator
+
+    if len(coordinators) != 1:
+        raise ServiceValidationError(
+            f"{len(coordinators)} Unraid servers are loaded; "
+            f"pass {ATTR_DEVICE_ID} or {ATTR_CONFIG_ENTRY_ID} to pick one"
+        )
+    return next(iter(coordinators.values()))
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Set up services for Unraid Management Agent, once for all servers."""
+    if hass.services.has_service(DOMAIN, next(iter(SERVICE_ACTIONS))):
+        return
+
+    async def handle_action(call: ServiceCall) -> ServiceResponse:
+        """
+        Send a control action and report its outcome.
+
+        With wait_for_state the call returns once a push (or the fast poll
+        that stands in for a missing one) shows the new state, or when the
+        timeout passes; the response tells which.
+        """
+        coordinator = _async_get_coordinator(hass, call)
+        action = SERVICE_ACTIONS[call.service]
+        target_id = call.data[action.id_field] if action.id_field else None
+        method = getattr(coordinator.client, action.method)
+        started = time.monotonic()
+        sent_at = time.time()
+        try:
+            result = await (method() if target_id is None else method(target_id))
+        except Exception as err:
+            _LOGGER.error(
+                "Failed to %s%s: %s",
+                action.failure,
+                "" if target_id is None else f" {target_id}",
+                err,
+            )
+            raise HomeAssistantError(f"Failed to {action.failure}: {err}") from err
+
+        confirmed: bool | None = None
+        if call.data[ATTR_WAIT_FOR_STATE]:
+            confirmed = await _async_confirm_state(
+                coordinator, action, target_id, call.data[ATTR_TIMEOUT], sent_at
+            )
+        else:
+            await coordinator.async_request_category_refresh(action.key)
+
+        if not call.return_response:
+            return None
+        return {
+            "result": result,
+            "state": _action_state(coordinator, action, target_id),
+            "confirmed": confirmed,
+            "elapsed": round(time.monotonic() - started, 3),
+        }
+
+    for service, action in SERVICE_ACTIONS.items():
+        fields = dict(_COMMON_FIELDS)
+        if action.id_field is not None:
+            fields[vol.Required(action.id_field)] = cv.string
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            handle_action,
+            schema=vol.Schema(fields),
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+    _LOGGER.info(
+        "Registered %d services for Unraid Management Agent", len(SERVICE_ACTIONS)
+    )
+
+
+@callback
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the services once the last server is unloaded."""
+    for service in SERVICE_ACTIONS:
+        hass.services.async_remove(DOMAIN, service)
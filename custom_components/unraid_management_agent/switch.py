@@ -9,10 +9,12 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import UnraidDataUpdateCoordinator
+from .api_client import UnraidActionSupersededError
 from .const import (
     ATTR_CONTAINER_IMAGE,
     ATTR_CONTAINER_PORTS,
@@ -22,10 +24,7 @@ from .const import (
     ICON_CONTAINER,
     ICON_VM,
     KEY_CONTAINERS,
-    KEY_SYSTEM,
     KEY_VMS,
-    MANUFACTURER,
-    MODEL,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -47,7 +46,9 @@ async def async_setup_entry(
         container_name = container.get("name", "unknown")
         if container_id:
             entities.append(
-                UnraidContainerSwitch(coordinator, entry, container_id, container_name)
+                UnraidContainerSwitch(
+                    coordinator, entry, str(container_id), container_name
+                )
             )
 
     # VM switches
@@ -55,7 +56,7 @@ async def async_setup_entry(
         vm_id = vm.get("id") or vm.get("name")
         vm_name = vm.get("name", "unknown")
         if vm_id:
-            entities.append(UnraidVMSwitch(coordinator, entry, vm_id, vm_name))
+            entities.append(UnraidVMSwitch(coordinator, entry, str(vm_id), vm_name))
 
     async_add_entities(entities)
 
@@ -63,29 +64,28 @@ async def async_setup_entry(
 class UnraidSwitchBase(CoordinatorEntity, SwitchEntity):
     """Base class for Unraid switches."""
 
+    # Coordinator category the switch reads
+    _category: str | None = None
+
     def __init__(
         self,
         coordinator: UnraidDataUpdateCoordinator,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, self._category)
         self._attr_has_entity_name = True
         self._entry = entry
 
     @property
-    def device_info(self) -> dict[str, Any]:
+    def device_info(self) -> DeviceInfo:
         """Return device information."""
-        system_data = self.coordinator.data.get(KEY_SYSTEM, {})
-        hostname = system_data.get("hostname", "Unraid")
+        return self.coordinator.device_info(self._entry.entry_id)
 
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": f"Unraid ({hostname})",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": system_data.get("version", "Unknown"),
-        }
+    @property
+    def assumed_state(self) -> bool:
+        """Return True while the state comes from the stored snapshot."""
+        return self.coordinator.stale
 
 
 # Container Switches
@@ -94,6 +94,8 @@ class UnraidSwitchBase(CoordinatorEntity, SwitchEntity):
 class UnraidContainerSwitch(UnraidSwitchBase):
     """Container control switch."""
 
+    _category = KEY_CONTAINERS
+
     def __init__(
         self,
         coordinator: UnraidDataUpdateCoordinator,
@@ -105,65 +107,67 @@ class UnraidContainerSwitch(UnraidSwitchBase):
         super().__init__(coordinator, entry)
         self._container_id = container_id
         self._container_name = container_name
-        self._attr_name = f"Container {container_name}"
+        # The container device name already identifies the switch
+        self._attr_name = None
         self._attr_icon = ICON_CONTAINER
-        # Enable optimistic mode to prevent UI state jumping
-        self._attr_assumed_state = False
-        self._optimistic_state: bool | None = None
 
     @property
     def unique_id(self) -> str:
         """Return unique ID."""
         return f"{self._entry.entry_id}_container_switch_{self._container_id}"
 
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return the container device."""
+        return self.coordinator.child_device_info(
+            self._entry.entry_id, "container", self._container_id, self._container_name
+        )
+
     @property
     def is_on(self) -> bool:
         """Return true if container is running."""
-        # Use optimistic state if set (during state transitions)
-        if self._optimistic_state is not None:
-            return self._optimistic_state
-
-        # Otherwise use actual state from coordinator
-        for container in self.coordinator.data.get(KEY_CONTAINERS, []):
-            cid = container.get("id") or container.get("container_id")
-            if cid == self._container_id:
-                state = container.get("state", "").lower()
-                return state == "running"
-        return False
+        # A container being switched shows its target state until confirmed
+        target = self.coordinator.transition_target(KEY_CONTAINERS, self._container_id)
+        if target is not None:
+            return target
+
+        container = self.coordinator.get_item(KEY_CONTAINERS, self._container_id)
+        if container is None:
+            return False
+        return container.get("state", "").lower() == "running"
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        for container in self.coordinator.data.get(KEY_CONTAINERS, []):
-            cid = container.get("id") or container.get("container_id")
-            if cid == self._container_id:
-                state = container.get("state", "").lower()
-                return {
-                    "status": "running" if state == "running" else "stopped",
-                    ATTR_CONTAINER_IMAGE: container.get("image"),
-                    ATTR_CONTAINER_PORTS: container.get("ports"),
-                }
-        return {}
+        container = self.coordinator.get_item(KEY_CONTAINERS, self._container_id)
+        if container is None:
+            return {}
+        state = container.get("state", "").lower()
+        return {
+            "status": "running" if state == "running" else "stopped",
+            ATTR_CONTAINER_IMAGE: container.get("image"),
+            ATTR_CONTAINER_PORTS: container.get("ports"),
+        }
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the container."""
+        # Show the target state right away; push or poll confirms it
+        self.coordinator.async_start_transition(
+            KEY_CONTAINERS, self._container_id, running=True
+        )
+        self.async_write_ha_state()
         try:
-            # Set optimistic state immediately to prevent UI jumping
-            self._optimistic_state = True
-            self.async_write_ha_state()
-
             await self.coordinator.client.start_container(self._container_id)
             _LOGGER.info("Started container: %s", self._container_name)
-
-            # Request immediate update
-            await self.coordinator.async_request_refresh()
-
-            # Clear optimistic state after refresh completes
-            self._optimistic_state = None
-            self.async_write_ha_state()
+        except UnraidActionSupersededError:
+            # A later switch of the same container replaced this one and owns
+            # the transition now
+            _LOGGER.info(
+                "Did not start container %s, replaced before it was sent",
+                self._container_name,
+            )
         except Exception as err:
-            # Clear optimistic state on error
-            self._optimistic_state = None
+            self.coordinator.async_cancel_transition(KEY_CONTAINERS, self._container_id)
             self.async_write_ha_state()
 
             _LOGGER.error("Failed to start container %s: %s", self._container_name, err)
@@ -173,23 +177,23 @@ class UnraidContainerSwitch(UnraidSwitchBase):
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the container."""
+        # Show the target state right away; push or poll confirms it
+        self.coordinator.async_start_transition(
+            KEY_CONTAINERS, self._container_id, running=False
+        )
+        self.async_write_ha_state()
         try:
-            # Set optimistic state immediately to prevent UI jumping
-            self._optimistic_state = False
-            self.async_write_ha_state()
-
             await self.coordinator.client.stop_container(self._container_id)
             _LOGGER.info("Stopped container: %s", self._container_name)
-
-            # Request immediate update
-            await self.coordinator.async_request_refresh()
-
-            # Clear optimistic state after refresh completes
-            self._optimistic_state = None
-            self.async_write_ha_state()
+        except UnraidActionSupersededError:
+            # A later switch of the same container replaced this one and owns
+            # the transition now
+            _LOGGER.info(
+                "Did not stop container %s, replaced before it was sent",
+                self._container_name,
+            )
         except Exception as err:
-            # Clear optimistic state on error
-            self._optimistic_state = None
+            self.coordinator.async_cancel_transition(KEY_CONTAINERS, self._container_id)
             self.async_write_ha_state()
 
             _LOGGER.error("Failed to stop container %s: %s", self._container_name, err)
@@ -204,6 +208,8 @@ class UnraidContainerSwitch(UnraidSwitchBase):
 class UnraidVMSwitch(UnraidSwitchBase):
     """VM control switch."""
 
+    _category = KEY_VMS
+
     def __init__(
         self,
         coordinator: UnraidDataUpdateCoordinator,
@@ -215,64 +221,63 @@ class UnraidVMSwitch(UnraidSwitchBase):
         super().__init__(coordinator, entry)
         self._vm_id = vm_id
         self._vm_name = vm_name
-        self._attr_name = f"VM {vm_name}"
+        # The VM device name already identifies the switch
+        self._attr_name = None
         self._attr_icon = ICON_VM
-        # Enable optimistic mode to prevent UI state jumping
-        self._attr_assumed_state = False
-        self._optimistic_state: bool | None = None
 
     @property
     def unique_id(self) -> str:
         """Return unique ID."""
         return f"{self._entry.entry_id}_vm_switch_{self._vm_id}"
 
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return the VM device."""
+        return self.coordinator.child_device_info(
+            self._entry.entry_id, "vm", self._vm_id, self._vm_name
+        )
+
     @property
     def is_on(self) -> bool:
         """Return true if VM is running."""
-        # Use optimistic state if set (during state transitions)
-        if self._optimistic_state is not None:
-            return self._optimistic_state
-
-        # Otherwise use actual state from coordinator
-        for vm in self.coordinator.data.get(KEY_VMS, []):
-            vid = vm.get("id") or vm.get("name")
-            if vid == self._vm_id:
-                state = vm.get("state", "").lower()
-                return state == "running"
-        return False
+        # A VM being switched shows its target state until confirmed
+        target = self.coordinator.transition_target(KEY_VMS, self._vm_id)
+        if target is not None:
+            return target
+
+        vm = self.coordinator.get_item(KEY_VMS, self._vm_id)
+        if vm is None:
+            return False
+        return vm.get("state", "").lower() == "running"
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        for vm in self.coordinator.data.get(KEY_VMS, []):
-            vid = vm.get("id") or vm.get("name")
-            if vid == self._vm_id:
-                state = vm.get("state", "").lower()
-                return {
-                    "status": "running" if state == "running" else "stopped",
-                    ATTR_VM_VCPUS: vm.get("vcpus"),
-                }
-        return {}
+        vm = self.coordinator.get_item(KEY_VMS, self._vm_id)
+        if vm is None:
+            return {}
+        state = vm.get("state", "").lower()
+        return {
+            "status": "running" if state == "running" else "stopped",
+            ATTR_VM_VCPUS: vm.get("vcpus"),
+        }
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the VM."""
+        # Show the target state right away; push or poll confirms it
+        self.coordinator.async_start_transition(KEY_VMS, self._vm_id, running=True)
+        self.async_write_ha_state()
         try:
-            # Set optimistic state immediately to prevent UI jumping
-            self._optimistic_state = True
-            self.async_write_ha_state()
-
             await self.coordinator.client.start_vm(self._vm_id)
             _LOGGER.info("Started VM: %s", self._vm_name)
-
-            # Request immediate update
-            await self.coordinator.async_request_refresh()
-
-            # Clear optimistic state after refresh completes
-            self._optimistic_state = None
-            self.async_write_ha_state()
+        except UnraidActionSupersededError:
+            # A later switch of the same VM replaced this one and owns
+            # the transition now
+            _LOGGER.info(
+                "Did not start VM %s, replaced before it was sent", self._vm_name
+            )
         except Exception as err:
-            # Clear optimistic state on error
-            self._optimistic_state = None
+            self.coordinator.async_cancel_transition(KEY_VMS, self._vm_id)
             self.async_write_ha_state()
 
             _LOGGER.error("Failed to start VM %s: %s", self._vm_name, err)
@@ -282,23 +287,20 @@ class UnraidVMSwitch(UnraidSwitchBase):
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the VM."""
+        # Show the target state right away; push or poll confirms it
+        self.coordinator.async_start_transition(KEY_VMS, self._vm_id, running=False)
+        self.async_write_ha_state()
         try:
-            # Set optimistic state immediately to prevent UI jumping
-            self._optimistic_state = False
-            self.async_write_ha_state()
-
             await self.coordinator.client.stop_vm(self._vm_id)
             _LOGGER.info("Stopped VM: %s", self._vm_name)
-
-            # Request immediate update
-            await self.coordinator.async_request_refresh()
-
-            # Clear optimistic state after refresh completes
-            self._optimistic_state = None
-            self.async_write_ha_state()
+        except UnraidActionSupersededError:
+            # A later switch of the same VM replaced this one and owns
+            # the transition now
+            _LOGGER.info(
+                "Did not stop VM %s, replaced before it was sent", self._vm_name
+            )
         except Exception as err:
-            # Clear optimistic state on error
-            self._optimistic_state = None
+            self.coordinator.async_cancel_transition(KEY_VMS, self._vm_id)
             self.async_write_ha_state()
 
             _LOGGER.error("Failed to stop VM %s: %s", self._vm_name, err)
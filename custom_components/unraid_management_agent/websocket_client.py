@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import gzip
 import json
 import logging
-from collections.abc import Callable
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from pathlib import Path
 from typing import Any
 
 import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 
 from .const import (
     API_WEBSOCKET,
@@ -21,8 +27,11 @@ from .const import (
     EVENT_SYSTEM_UPDATE,
     EVENT_UPS_STATUS_UPDATE,
     EVENT_VM_LIST_UPDATE,
+    WEBSOCKET_CAPTURE_BATCH,
+    WEBSOCKET_CAPTURE_MAX_BYTES,
     WEBSOCKET_MAX_RETRIES,
     WEBSOCKET_RECONNECT_DELAY,
+    WEBSOCKET_RECONNECT_HISTORY,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -100,6 +109,215 @@ def identify_event_type(data: Any) -> str:
     return "unknown"
 
 
+class UnraidWebSocketStats:
+    """
+    Throughput and latency statistics for the WebSocket stream.
+
+    Counters are kept per topic (event type) so we can tell which categories
+    are actually pushed, how large the frames are and how long it takes to
+    decode and apply them. Server-to-HA latency is only recorded when the
+    agent includes a timestamp in the frame.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.topics: dict[str, dict[str, float]] = {}
+        self.total_messages = 0
+        self.total_bytes = 0
+        self.decode_errors = 0
+        self.reconnect_count = 0
+        self._connected_once = False
+        self.connected_since: str | None = None
+        self.last_message_at: str | None = None
+        self.history: deque[dict[str, Any]] = deque(maxlen=WEBSOCKET_RECONNECT_HISTORY)
+
+    def record_message(
+        self,
+        topic: str,
+        size: int,
+        decode_time: float,
+        apply_time: float,
+        latency: float | None,
+    ) -> None:
+        """Record a received frame of size UTF-8 bytes for the given topic."""
+        stats = self.topics.get(topic)
+        if stats is None:
+            stats = self.topics[topic] = {
+                "messages": 0,
+                "bytes": 0,
+                "decode_time": 0.0,
+                "apply_time": 0.0,
+                "latency_total": 0.0,
+                "latency_samples": 0,
+                "latency_last": None,
+                "latency_max": None,
+            }
+
+        stats["messages"] += 1
+        stats["bytes"] += size
+        stats["decode_time"] += decode_time
+        stats["apply_time"] += apply_time
+
+        if latency is not None:
+            stats["latency_total"] += latency
+            stats["latency_samples"] += 1
+            stats["latency_last"] = latency
+            if stats["latency_max"] is None or latency > stats["latency_max"]:
+                stats["latency_max"] = latency
+
+        self.total_messages += 1
+        self.total_bytes += size
+        self.last_message_at = dt_util.utcnow().isoformat()
+
+    def record_connected(self) -> None:
+        """Record a successful (re)connection."""
+        now = dt_util.utcnow().isoformat()
+        if self._connected_once:
+            self.reconnect_count += 1
+        self._connected_once = True
+        self.connected_since = now
+        self.history.append({"time": now, "event": "connected"})
+
+    def record_disconnected(self, reason: str, *, was_connected: bool = True) -> None:
+        """Record a lost connection or a failed connection attempt."""
+        self.connected_since = None
+        self.history.append(
+            {
+                "time": dt_util.utcnow().isoformat(),
+                "event": "disconnected" if was_connected else "connect_failed",
+                "reason": reason,
+            }
+        )
+
+    @property
+    def average_latency(self) -> float | None:
+        """Return the average server-to-HA latency in seconds across topics."""
+        total = 0.0
+        samples = 0
+        for stats in self.topics.values():
+            total += stats["latency_total"]
+            samples += stats["latency_samples"]
+        if not samples:
+            return None
+        return total / samples
+
+    def topic_summary(self) -> dict[str, dict[str, Any]]:
+        """Return per-topic averages suitable for attributes and diagnostics."""
+        summary: dict[str, dict[str, Any]] = {}
+        for topic, stats in self.topics.items():
+            messages = stats["messages"]
+            latency_samples = stats["latency_samples"]
+            summary[topic] = {
+                "messages": messages,
+                "bytes": stats["bytes"],
+                "avg_decode_ms": round(stats["decode_time"] / messages * 1000, 3),
+                "avg_apply_ms": round(stats["apply_time"] / messages * 1000, 3),
+                "avg_latency_ms": (
+                    round(stats["latency_total"] / latency_samples * 1000, 1)
+                    if latency_samples
+                    else None
+                ),
+                "max_latency_ms": (
+                    round(stats["latency_max"] * 1000, 1)
+                    if stats["latency_max"] is not None
+                    else None
+                ),
+            }
+        return summary
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all statistics as a dictionary."""
+        return {
+            "total_messages": self.total_messages,
+            "total_bytes": self.total_bytes,
+            "decode_errors": self.decode_errors,
+            "reconnect_count": self.reconnect_count,
+            "connected_since": self.connected_since,
+            "last_message_at": self.last_message_at,
+            "topics": self.topic_summary(),
+            "history": list(self.history),
+        }
+
+
+def _frame_latency(timestamp: Any) -> float | None:
+    """Return seconds elapsed since the agent stamped a frame, if stamped."""
+    if not isinstance(timestamp, str):
+        return None
+    sent_at = dt_util.parse_datetime(timestamp)
+    if sent_at is None:
+        return None
+    return (dt_util.utcnow() - sent_at).total_seconds()
+
+
+class UnraidWebSocketCapture:
+    """
+    Record raw WebSocket frames with their receive time to a gzip file.
+
+    Each line of the file is a JSON object with the receive time ("time",
+    seconds since the epoch) and the frame as received ("frame"). Frames are
+    written in batches from the executor, each batch as its own gzip member,
+    so a capture survives a restart and can be appended to. Once the file
+    reaches max_bytes it is moved aside to "<path>.1" and a new one started,
+    so a capture left on keeps at most two files' worth of frames on disk.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        path: str,
+        max_bytes: int = WEBSOCKET_CAPTURE_MAX_BYTES,
+    ) -> None:
+        """Initialize the capture."""
+        self.hass = hass
+        self.path = path
+        self.max_bytes = max_bytes
+        self.frames = 0
+        self.rotations = 0
+        self._batch: list[str] = []
+
+    async def async_record(self, data: str) -> None:
+        """Record a frame received now."""
+        self._batch.append(json.dumps({"time": time.time(), "frame": data}))
+        self.frames += 1
+        if len(self._batch) >= WEBSOCKET_CAPTURE_BATCH:
+            await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Write the recorded frames not written yet."""
+        if not self._batch:
+            return
+        lines, self._batch = self._batch, []
+        if await self.hass.async_add_executor_job(self._write, lines):
+            self.rotations += 1
+
+    def _write(self, lines: list[str]) -> bool:
+        """Append lines to the capture file and return if it was moved aside."""
+        with gzip.open(self.path, "at", encoding="utf-8") as file:
+            file.writelines(f"{line}\n" for line in lines)
+        path = Path(self.path)
+        if path.stat().st_size < self.max_bytes:
+            return False
+        path.replace(f"{self.path}.1")
+        return True
+
+
+def read_capture(path: str) -> list[tuple[float, str]]:
+    """
+    Return the (receive time, frame) pairs of a capture file.
+
+    A batch cut short by a crash ends the capture instead of failing it.
+    """
+    frames: list[tuple[float, str]] = []
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        try:
+            for line in file:
+                record = json.loads(line)
+                frames.append((record["time"], record["frame"]))
+        except (EOFError, json.JSONDecodeError) as err:
+            _LOGGER.warning("Capture %s ends early: %s", path, err)
+    return frames
+
+
 class UnraidWebSocketClient:
     """WebSocket client for real-time updates from Unraid Management Agent."""
 
@@ -109,12 +327,19 @@ class UnraidWebSocketClient:
         port: int,
         session: aiohttp.ClientSession,
         callback: Callable[[str, Any], None],
+        stats: UnraidWebSocketStats | None = None,
+        on_connection_change: Callable[[bool], None] | None = None,
+        capture: UnraidWebSocketCapture | None = None,
     ) -> None:
         """Initialize the WebSocket client."""
         self.host = host
         self.port = port
         self.session = session
         self.callback = callback
+        self.on_connection_change = on_connection_change
+        self.stats = stats or UnraidWebSocketStats()
+        # Raw frames are recorded here when capturing is turned on
+        self.capture = capture
         self.ws_url = f"ws://{host}:{port}{API_WEBSOCKET}"
 
         self._ws: aiohttp.ClientWebSocketResponse | None = None
@@ -141,7 +366,9 @@ class UnraidWebSocketClient:
             )
             self._connected = True
             self._reconnect_count = 0
+            self.stats.record_connected()
             _LOGGER.info("WebSocket connected successfully")
+            self._notify_connection(connected=True)
         except Exception as err:
             _LOGGER.error("Failed to connect to WebSocket: %s", err)
             self._connected = False
@@ -156,6 +383,9 @@ class UnraidWebSocketClient:
             await self._ws.close()
             _LOGGER.info("WebSocket disconnected")
 
+        if self.capture is not None:
+            await self.capture.async_flush()
+
     async def listen(self) -> None:
         """Listen for WebSocket messages with automatic reconnection."""
         while not self._stop_requested:
@@ -165,19 +395,24 @@ class UnraidWebSocketClient:
                     await self.connect()
 
                 # Listen for messages
+                reason = "closed"
                 async for msg in self._ws:
                     if msg.type == aiohttp.WSMsgType.TEXT:
+                        if self.capture is not None:
+                            await self.capture.async_record(msg.data)
                         await self._handle_message(msg.data)
                     elif msg.type == aiohttp.WSMsgType.ERROR:
                         _LOGGER.error("WebSocket error: %s", self._ws.exception())
+                        reason = f"error: {type(self._ws.exception()).__name__}"
                         break
                     elif msg.type == aiohttp.WSMsgType.CLOSED:
                         _LOGGER.warning("WebSocket closed by server")
+                        reason = "closed by server"
                         break
 
                 # Connection closed, attempt reconnection
                 if not self._stop_requested:
-                    await self._reconnect()
+                    await self._reconnect(reason)
 
             except asyncio.CancelledError:
                 _LOGGER.debug("WebSocket listen task cancelled")
@@ -185,11 +420,31 @@ class UnraidWebSocketClient:
             except Exception as err:
                 _LOGGER.error("WebSocket error: %s", err)
                 if not self._stop_requested:
-                    await self._reconnect()
+                    # Only the type: connection errors name the server's address
+                    await self._reconnect(f"error: {type(err).__name__}")
+
+    async def async_replay(
+        self, frames: Iterable[tuple[float, str]], speed: float | None = 1.0
+    ) -> None:
+        """
+        Handle captured frames as if they were received again.
+
+        Frames are spaced as they were received, divided by speed; without a
+        speed they are handled back to back.
+        """
+        previous: float | None = None
+        for received, data in frames:
+            if speed and previous is not None and received > previous:
+                await asyncio.sleep((received - previous) / speed)
+            previous = received
+            await self._handle_message(data)
 
     async def _handle_message(self, data: str) -> None:
         """Handle incoming WebSocket message."""
+        started = time.perf_counter()
         try:
+            # Size on the wire; only frames with non-ASCII text need encoding
+            size = len(data) if data.isascii() else len(data.encode())
             message = json.loads(data)
 
             # Extract event data
@@ -200,6 +455,7 @@ class UnraidWebSocketClient:
 
             # Identify event type
             event_type = identify_event_type(event_data)
+            decoded = time.perf_counter()
 
             # Handle empty lists silently (normal occurrence)
             if event_type == "empty_list":
@@ -223,20 +479,43 @@ class UnraidWebSocketClient:
                     )
                 else:
                     _LOGGER.debug("Received unknown event type: %s", type(event_data))
+                self.stats.record_message(
+                    event_type, size, decoded - started, 0.0, None
+                )
                 return
 
             # Call callback with event type and data
             if self.callback:
                 self.callback(event_type, event_data)
 
+            self.stats.record_message(
+                event_type,
+                size,
+                decoded - started,
+                time.perf_counter() - decoded,
+                _frame_latency(message.get("timestamp")),
+            )
+
         except json.JSONDecodeError as err:
+            self.stats.decode_errors += 1
             _LOGGER.error("Failed to decode WebSocket message: %s", err)
         except Exception as err:
             _LOGGER.error("Error handling WebSocket message: %s", err)
 
-    async def _reconnect(self) -> None:
+    def _notify_connection(self, *, connected: bool) -> None:
+        """Tell the owner that the push channel came up or went down."""
+        if self.on_connection_change is None:
+            return
+        try:
+            self.on_connection_change(connected)
+        except Exception as err:
+            _LOGGER.error("Error in WebSocket connection callback: %s", err)
+
+    async def _reconnect(self, reason: str) -> None:
         """Attempt to reconnect with exponential backoff."""
+        self.stats.record_disconnected(reason, was_connected=self._connected)
         self._connected = False
+        self._notify_connection(connected=False)
 
         if self._reconnect_count >= WEBSOCKET_MAX_RETRIES:
             _LOGGER.error(
@@ -0,0 +1 @@
+"""Benchmarks for the Unraid Management Agent integration."""
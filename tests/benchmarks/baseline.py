@@ -0,0 +1,64 @@
+"""
+Baselines the Unraid Management Agent benchmarks are compared with.
+
+Each benchmark module compares its results with
+tests/benchmarks/baselines/<module>.json, where <module> is the file name
+without "test_". Run with UNRAID_UPDATE_BASELINES=1 to record new baselines
+after an intended change. Results are also attached to the test report as
+user properties, so --junitxml keeps them.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+UPDATE_BASELINES = os.environ.get("UNRAID_UPDATE_BASELINES") == "1"
+# Timings may be this many times the baseline, plus a little slack for the
+# sub-millisecond ones, before the benchmark fails; this catches gross
+# regressions on slower machines. Counts must not grow at all
+TIME_TOLERANCE = 5.0
+TIME_SLACK_MS = 10.0
+MEMORY_TOLERANCE = 1.5
+
+
+class BenchmarkBaseline:
+    """Compare the results of a benchmark with its recorded baseline."""
+
+    def __init__(
+        self, path: Path, record_property: Callable[[str, object], None]
+    ) -> None:
+        """Initialize the baseline of one benchmark module."""
+        self.path = path
+        self._record_property = record_property
+
+    def record(self, results: dict[str, float]) -> None:
+        """Attach results to the test report without comparing them."""
+        for metric, value in results.items():
+            self._record_property(metric, round(value, 3))
+
+    def check(self, results: dict[str, float], scale: str = "default") -> None:
+        """Record results as the baseline of scale, or compare them with it."""
+        self.record(results)
+        baselines = json.loads(self.path.read_text()) if self.path.exists() else {}
+        if UPDATE_BASELINES:
+            baselines[scale] = {
+                metric: round(value, 3) for metric, value in results.items()
+            }
+            self.path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+            return
+
+        baseline = baselines.get(scale)
+        assert baseline is not None, f"No baseline for {scale} in {self.path.name}"
+        for metric, value in results.items():
+            expected = baseline[metric]
+            message = f"{scale} {metric}: {value:.4g} (baseline {expected:.4g})"
+            if metric.endswith("_ms"):
+                assert value <= expected * TIME_TOLERANCE + TIME_SLACK_MS, message
+            elif metric.startswith("bytes_"):
+                assert value <= expected * MEMORY_TOLERANCE, message
+            else:
+                assert value <= expected, message
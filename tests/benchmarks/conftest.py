@@ -0,0 +1,18 @@
+"""Fixtures for the Unraid Management Agent benchmarks."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import pytest
+
+from .baseline import BASELINE_DIR, BenchmarkBaseline
+
+
+@pytest.fixture
+def benchmark_baseline(
+    request: pytest.FixtureRequest, record_property: Callable[[str, object], None]
+) -> BenchmarkBaseline:
+    """Return the baseline of the requesting benchmark module."""
+    name = request.path.stem.removeprefix("test_")
+    return BenchmarkBaseline(BASELINE_DIR / f"{name}.json", record_property)
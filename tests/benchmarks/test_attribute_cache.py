@@ -0,0 +1,95 @@
+"""Benchmark memoized sensor attributes under a steady push load."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.unraid_management_agent import UnraidDataUpdateCoordinator
+from custom_components.unraid_management_agent.const import KEY_DISKS
+from custom_components.unraid_management_agent.sensor import (
+    ITEM_SENSOR_DESCRIPTIONS,
+    UnraidItemSensor,
+    _disk_attributes,
+)
+
+from .baseline import BenchmarkBaseline
+
+ENTITIES = 400
+PUSHES = 60  # one minute of 1 Hz pushes
+CHANGED_PER_PUSH = 8  # disks whose usage moves between two pushes
+
+
+def _disk(index: int, push: int) -> dict:
+    """Return one disk as the agent reports it in a given push."""
+    stride = ENTITIES // CHANGED_PER_PUSH
+    used = 4_000_000_000_000 + (push if index % stride == push % stride else 0)
+    return {
+        "id": f"disk{index}",
+        "name": f"disk{index}",
+        "device": f"sd{index}",
+        "status": "DISK_OK",
+        "filesystem": "xfs",
+        "mount_point": f"/mnt/disk{index}",
+        "spin_state": "active",
+        "size_bytes": 8_000_000_000_000,
+        "used_bytes": used,
+        "free_bytes": 8_000_000_000_000 - used,
+        "usage_percent": used / 80_000_000_000,
+        "temperature_celsius": 35,
+        "smart_status": "PASSED",
+        "smart_errors": 0,
+        "timestamp": f"2025-10-03T13:41:{push % 60:02d}+10:00",
+    }
+
+
+@pytest.mark.benchmark
+async def test_disk_attributes_memoized(
+    hass: HomeAssistant, benchmark_baseline: BenchmarkBaseline
+) -> None:
+    """Compare cached and rebuilt attributes for 400 disks at 1 Hz."""
+    coordinator = UnraidDataUpdateCoordinator(
+        hass, client=MagicMock(), update_interval=30, enable_websocket=True
+    )
+    entry = MagicMock(entry_id="benchmark")
+    coordinator.data = {
+        KEY_DISKS: coordinator._index_items(
+            KEY_DISKS, [_disk(index, 0) for index in range(ENTITIES)]
+        )
+    }
+    description = next(
+        description
+        for description in ITEM_SENSOR_DESCRIPTIONS
+        if description.key == "disk_{}_usage"
+    )
+    sensors = [
+        UnraidItemSensor(coordinator, entry, description, f"disk{index}", "disk")
+        for index in range(ENTITIES)
+    ]
+
+    cached = rebuilt = 0.0
+    for push in range(1, PUSHES + 1):
+        coordinator.data[KEY_DISKS] = coordinator._index_items(
+            KEY_DISKS, [_disk(index, push) for index in range(ENTITIES)]
+        )
+
+        started = time.perf_counter()
+        cached_attrs = [sensor.extra_state_attributes for sensor in sensors]
+        cached += time.perf_counter() - started
+
+        started = time.perf_counter()
+        rebuilt_attrs = [
+            _disk_attributes(coordinator.get_item(KEY_DISKS, sensor._item_id))
+            for sensor in sensors
+        ]
+        rebuilt += time.perf_counter() - started
+
+        assert cached_attrs == rebuilt_attrs
+
+    assert cached < rebuilt
+    benchmark_baseline.check(
+        {"memoized_ms": cached * 1000, "rebuilt_ms": rebuilt * 1000}
+    )
@@ -0,0 +1,159 @@
+"""
+Benchmark coordinator refreshes and entity fan-out at several server sizes.
+
+The real coordinator and all four platforms run against payloads of the
+stand-in agent. Results are compared with
+tests/benchmarks/baselines/refresh_fanout.json.
+"""
+
+from __future__ import annotations
+
+import copy
+import statistics
+import time
+import tracemalloc
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+
+from custom_components.unraid_management_agent import (
+    CATEGORY_ENDPOINTS,
+    UnraidDataUpdateCoordinator,
+)
+from custom_components.unraid_management_agent.const import (
+    DOMAIN,
+    EVENT_CONTAINER_LIST_UPDATE,
+    EVENT_DISK_LIST_UPDATE,
+    KEY_CONTAINERS,
+    KEY_DISKS,
+    KEY_NETWORK,
+    KEY_SYSTEM,
+)
+
+from ..fake_agent import FakeAgentConfig, build_payloads
+from .baseline import BenchmarkBaseline
+
+REFRESHES = 5
+EVENTS = 20
+
+# (containers, disks) of a small, a mid-size and a large server
+SCALES = [(10, 8), (100, 30), (500, 60)]
+
+
+def _vary(payloads: dict[str, Any], turn: int) -> dict[str, Any]:
+    """Return payloads with the values that move between two polls changed."""
+    varied = copy.deepcopy(payloads)
+    varied[KEY_SYSTEM]["cpu_usage_percent"] = 10.0 + turn
+    for disk in varied[KEY_DISKS]:
+        disk["temperature_celsius"] = 30 + turn % 10
+    for interface in varied[KEY_NETWORK]:
+        interface["bytes_received"] += turn * 1000
+    return varied
+
+
+def _serve(client: MagicMock, payloads: dict[str, Any]) -> None:
+    """Make the mocked client return the payloads."""
+    for key, (method, _default) in CATEGORY_ENDPOINTS.items():
+        getattr(client, method).return_value = payloads[key]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    ("containers", "disks"), SCALES, ids=[f"{c}c-{d}d" for c, d in SCALES]
+)
+async def test_refresh_fanout_benchmark(
+    hass: HomeAssistant,
+    mock_config_entry,
+    mock_api_client,
+    mock_websocket_client,
+    benchmark_baseline: BenchmarkBaseline,
+    containers: int,
+    disks: int,
+) -> None:
+    """Measure refreshes, state writes, push handling and memory per entity."""
+    payloads = build_payloads(FakeAgentConfig(containers=containers, disks=disks))
+    _serve(mock_api_client, payloads)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    coordinator: UnraidDataUpdateCoordinator = hass.data[DOMAIN][
+        mock_config_entry.entry_id
+    ]
+    entities = len(
+        er.async_entries_for_config_entry(
+            er.async_get(hass), mock_config_entry.entry_id
+        )
+    )
+
+    writes = 0
+    write_state = Entity._async_write_ha_state
+
+    def count_write(entity: Entity) -> None:
+        nonlocal writes
+        writes += 1
+        write_state(entity)
+
+    wall: list[float] = []
+    cpu: list[float] = []
+    with patch.object(Entity, "_async_write_ha_state", count_write):
+        # Full refreshes of every category with moving values
+        for turn in range(1, REFRESHES + 1):
+            _serve(mock_api_client, _vary(payloads, turn))
+            coordinator._last_polled.clear()
+            started, started_cpu = time.perf_counter(), time.process_time()
+            await coordinator.async_refresh()
+            wall.append(time.perf_counter() - started)
+            cpu.append(time.process_time() - started_cpu)
+        writes_per_refresh = writes / REFRESHES
+
+        # Pushes of one changed container, and of all disk temperatures
+        container_events: list[float] = []
+        disk_events: list[float] = []
+        for turn in range(EVENTS):
+            changed = copy.deepcopy(payloads[KEY_CONTAINERS])
+            changed[turn % containers]["state"] = "paused"
+            started = time.perf_counter()
+            coordinator._handle_websocket_event(EVENT_CONTAINER_LIST_UPDATE, changed)
+            container_events.append(time.perf_counter() - started)
+
+            varied = _vary(payloads, turn)[KEY_DISKS]
+            started = time.perf_counter()
+            coordinator._handle_websocket_event(EVENT_DISK_LIST_UPDATE, varied)
+            disk_events.append(time.perf_counter() - started)
+
+    results = {
+        "entities": entities,
+        "refresh_wall_ms": statistics.median(wall) * 1000,
+        "refresh_cpu_ms": statistics.median(cpu) * 1000,
+        "state_writes_per_refresh": writes_per_refresh,
+        "container_event_ms": statistics.median(container_events) * 1000,
+        "disk_event_ms": statistics.median(disk_events) * 1000,
+        "bytes_per_entity": allocated / entities,
+    }
+    benchmark_baseline.check(results, f"{containers}c-{disks}d")
+
+    await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,140 @@
+"""
+Replay captured WebSocket traffic into a coordinator and profile it.
+
+Set UNRAID_REPLAY_CAPTURE to a capture file recorded with the "Record
+WebSocket traffic" option to replay production traffic; without it, a
+synthetic capture of a mid-size server is replayed. UNRAID_REPLAY_SPEED
+replays at that multiple of the recorded pace instead of back to back.
+Only the synthetic capture replayed back to back is compared with
+tests/benchmarks/baselines/replay.json; the results of other replays are
+attached to the test report. Set UNRAID_REPLAY_PROFILE to a file to write a
+profile of the replay there for pstats or snakeviz.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import json
+import os
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.unraid_management_agent import (
+    CATEGORY_ENDPOINTS,
+    UnraidDataUpdateCoordinator,
+)
+from custom_components.unraid_management_agent.const import (
+    DOMAIN,
+    KEY_CONTAINERS,
+    KEY_DISKS,
+    KEY_NETWORK,
+    KEY_SYSTEM,
+)
+from custom_components.unraid_management_agent.websocket_client import (
+    UnraidWebSocketClient,
+    read_capture,
+)
+
+from ..fake_agent import FakeAgentConfig, build_payloads
+from .baseline import BenchmarkBaseline
+
+CAPTURE_FILE = os.environ.get("UNRAID_REPLAY_CAPTURE")
+SPEED = (
+    float(os.environ["UNRAID_REPLAY_SPEED"])
+    if "UNRAID_REPLAY_SPEED" in os.environ
+    else None
+)
+PROFILE_FILE = os.environ.get("UNRAID_REPLAY_PROFILE")
+
+# Pushes of the synthetic capture, one second apart, in this order
+SYNTHETIC_PUSHES = 200
+SYNTHETIC_KEYS = (KEY_SYSTEM, KEY_DISKS, KEY_CONTAINERS, KEY_NETWORK)
+
+
+def _synthetic_capture(payloads: dict[str, Any]) -> list[tuple[float, str]]:
+    """Return a capture of the categories pushed in turn with moving values."""
+    frames = []
+    for push in range(SYNTHETIC_PUSHES):
+        key = SYNTHETIC_KEYS[push % len(SYNTHETIC_KEYS)]
+        data = payloads[key]
+        if key == KEY_SYSTEM:
+            data = {**data, "cpu_usage_percent": float(push % 100)}
+        elif key == KEY_DISKS:
+            data = [{**disk, "temperature_celsius": 30 + push % 10} for disk in data]
+        frames.append((float(push), json.dumps({"data": data})))
+    return frames
+
+
+@pytest.mark.benchmark
+async def test_replay_capture(
+    hass: HomeAssistant,
+    mock_config_entry,
+    mock_api_client,
+    mock_websocket_client,
+    benchmark_baseline: BenchmarkBaseline,
+) -> None:
+    """Replay a capture and report decode and apply costs per topic."""
+    payloads = build_payloads(FakeAgentConfig(containers=100, disks=30))
+    for key, (method, _default) in CATEGORY_ENDPOINTS.items():
+        getattr(mock_api_client, method).return_value = payloads[key]
+    frames = (
+        await hass.async_add_executor_job(read_capture, CAPTURE_FILE)
+        if CAPTURE_FILE
+        else _synthetic_capture(payloads)
+    )
+
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+    coordinator: UnraidDataUpdateCoordinator = hass.data[DOMAIN][
+        mock_config_entry.entry_id
+    ]
+    replay = UnraidWebSocketClient(
+        host="replay",
+        port=0,
+        session=MagicMock(),
+        callback=coordinator._handle_websocket_event,
+    )
+
+    profiler = cProfile.Profile()
+    started = time.perf_counter()
+    profiler.enable()
+    await replay.async_replay(frames, speed=SPEED)
+    profiler.disable()
+    elapsed = time.perf_counter() - started
+    await hass.async_block_till_done()
+
+    stats = replay.stats
+    assert stats.total_messages + stats.decode_errors > 0
+    if PROFILE_FILE:
+        await hass.async_add_executor_job(profiler.dump_stats, PROFILE_FILE)
+
+    results = {"frames": len(frames), "replay_ms": elapsed * 1000}
+    for topic, summary in stats.topic_summary().items():
+        results[f"{topic}_messages"] = summary["messages"]
+        results[f"{topic}_decode_ms"] = summary["avg_decode_ms"]
+        results[f"{topic}_apply_ms"] = summary["avg_apply_ms"]
+    if CAPTURE_FILE or SPEED:
+        benchmark_baseline.record(results)
+    else:
+        benchmark_baseline.check(results)
+
+    await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
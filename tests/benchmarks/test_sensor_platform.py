@@ -0,0 +1,110 @@
+"""Benchmark sensor platform setup, import and update dispatch."""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.unraid_management_agent import sensor
+from custom_components.unraid_management_agent.const import DOMAIN
+
+from ..const import MOCK_DISKS_DATA
+from .baseline import BenchmarkBaseline
+
+DISKS = 30
+SETUP_ROUNDS = 200
+UPDATES = 500
+
+IMPORT_SCRIPT = """
+import time
+import custom_components.unraid_management_agent
+import homeassistant.components.sensor
+started = time.perf_counter()
+import custom_components.unraid_management_agent.sensor
+print(time.perf_counter() - started)
+"""
+
+
+def _import_time() -> float:
+    """Return the seconds a fresh interpreter takes to import the sensor platform."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).parents[2],
+        text=True,
+    )
+    return float(result.stdout.strip())
+
+
+def _disks() -> list[dict]:
+    """Return a larger disk list built from the mock disks."""
+    template = MOCK_DISKS_DATA[1]
+    return [
+        {**template, "id": f"disk{index}", "name": f"disk{index}"}
+        for index in range(DISKS)
+    ]
+
+
+@pytest.mark.benchmark
+async def test_sensor_platform_benchmark(
+    hass: HomeAssistant,
+    mock_config_entry,
+    mock_api_client,
+    mock_websocket_client,
+    benchmark_baseline: BenchmarkBaseline,
+) -> None:
+    """Measure entity construction and per-update dispatch for the sensors."""
+    mock_api_client.get_disks.return_value = _disks()
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+
+    timings = []
+    for _ in range(SETUP_ROUNDS):
+        add_entities = MagicMock()
+        started = time.perf_counter()
+        await sensor.async_setup_entry(hass, mock_config_entry, add_entities)
+        timings.append(time.perf_counter() - started)
+    setup = statistics.median(timings)
+    entities = len(add_entities.call_args[0][0])
+
+    timings = []
+    for _ in range(UPDATES):
+        started = time.perf_counter()
+        coordinator.async_set_updated_data(coordinator.data)
+        timings.append(time.perf_counter() - started)
+    dispatch = statistics.median(timings)
+
+    import_time = await hass.async_add_executor_job(_import_time)
+
+    assert entities > DISKS
+    benchmark_baseline.check(
+        {
+            "entities": entities,
+            "setup_ms": setup * 1000,
+            "dispatch_ms": dispatch * 1000,
+            "import_ms": import_time * 1000,
+        }
+    )
@@ -0,0 +1,110 @@
+"""Benchmark cold start of a config entry against a server with request latency."""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.unraid_management_agent import CATEGORY_ENDPOINTS
+from custom_components.unraid_management_agent.const import DATA_FLOW_SYSTEM
+
+from ..const import MOCK_SYSTEM_DATA
+from .baseline import BenchmarkBaseline
+
+LATENCY = 0.05  # seconds per request
+ROUNDS = 5
+
+
+def _slow(mock: AsyncMock) -> None:
+    """Make a mocked client call take LATENCY before returning."""
+    result = mock.return_value
+
+    async def call(*_args: Any) -> Any:
+        await asyncio.sleep(LATENCY)
+        return result
+
+    mock.side_effect = call
+
+
+async def _cold_start(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    entry,
+    mock_api_client: MagicMock,
+    mock_websocket_client: MagicMock,
+    *,
+    after_flow: bool,
+) -> float:
+    """Return the median time to set up the entry from nothing."""
+    timings = []
+    for _ in range(ROUNDS):
+        hass_storage.clear()
+        if after_flow:
+            hass.data.setdefault(DATA_FLOW_SYSTEM, {})[entry.unique_id] = (
+                time.monotonic(),
+                MOCK_SYSTEM_DATA,
+            )
+        with (
+            patch(
+                "custom_components.unraid_management_agent.UnraidAPIClient",
+                return_value=mock_api_client,
+            ),
+            patch(
+                "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+                return_value=mock_websocket_client,
+            ),
+            patch(
+                "custom_components.unraid_management_agent.async_setup_services",
+                new=AsyncMock(),
+            ),
+        ):
+            started = time.perf_counter()
+            await hass.config_entries.async_setup(entry.entry_id)
+            timings.append(time.perf_counter() - started)
+            await hass.async_block_till_done()
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+    return statistics.median(timings)
+
+
+@pytest.mark.benchmark
+async def test_setup_latency_benchmark(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_config_entry,
+    mock_api_client,
+    mock_websocket_client,
+    benchmark_baseline: BenchmarkBaseline,
+) -> None:
+    """Measure config entry setup time with LATENCY on every request."""
+    _slow(mock_api_client.health_check)
+    for method, _default in CATEGORY_ENDPOINTS.values():
+        _slow(getattr(mock_api_client, method))
+
+    cold = await _cold_start(
+        hass,
+        hass_storage,
+        mock_config_entry,
+        mock_api_client,
+        mock_websocket_client,
+        after_flow=False,
+    )
+    after_flow = await _cold_start(
+        hass,
+        hass_storage,
+        mock_config_entry,
+        mock_api_client,
+        mock_websocket_client,
+        after_flow=True,
+    )
+
+    assert cold > LATENCY
+    benchmark_baseline.check(
+        {"cold_ms": cold * 1000, "after_flow_ms": after_flow * 1000}
+    )
@@ -10,6 +10,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.core import HomeAssistant
 
+from custom_components.unraid_management_agent.api_client import (
+    UnraidActionStats,
+    UnraidRequestStats,
+)
 from custom_components.unraid_management_agent.const import DOMAIN
 
 from .const import (
@@ -21,6 +25,7 @@ from .const import (
     MOCK_HEALTH_CHECK,
     MOCK_NETWORK_DATA,
     MOCK_OPTIONS,
+    MOCK_SHARES_DATA,
     MOCK_SYSTEM_DATA,
     MOCK_UPS_DATA,
     MOCK_VMS_DATA,
@@ -58,6 +63,7 @@ def mock_api_client() -> Generator[MagicMock]:
         client.get_ups_status = AsyncMock(return_value=MOCK_UPS_DATA)
         client.get_gpu_metrics = AsyncMock(return_value=MOCK_GPU_DATA)
         client.get_network_interfaces = AsyncMock(return_value=MOCK_NETWORK_DATA)
+        client.get_shares = AsyncMock(return_value=MOCK_SHARES_DATA)
 
         # Mock control methods
         client.start_array = AsyncMock(return_value=True)
@@ -74,6 +80,9 @@ def mock_api_client() -> Generator[MagicMock]:
         # Mock cleanup
         client.close = AsyncMock()
 
+        client.action_stats = UnraidActionStats()
+        client.request_stats = UnraidRequestStats()
+
         yield client
 
 
@@ -138,8 +147,10 @@ def mock_coordinator(hass: HomeAssistant, mock_api_client) -> Generator[MagicMoc
             "ups": MOCK_UPS_DATA,
             "gpu": MOCK_GPU_DATA,
             "network": MOCK_NETWORK_DATA,
+            "shares": MOCK_SHARES_DATA,
         }
         coordinator.last_update_success = True
+        coordinator.stale = False
         coordinator.async_config_entry_first_refresh = AsyncMock()
         coordinator.async_request_refresh = AsyncMock()
         coordinator.async_start_websocket = AsyncMock()
@@ -125,13 +125,29 @@ MOCK_VMS_DATA = [
 
 MOCK_GPU_DATA = [
     {
+        "index": 0,
+        "uuid": "GPU-5f3c9a1e-2b7d-4e8f-9a6b-1c2d3e4f5a6b",
+        "pci_id": "0000:01:00.0",
         "name": "NVIDIA GeForce RTX 3080",
-        "utilization_percent": 45,
+        "driver_version": "535.129.03",
+        "utilization_gpu_percent": 45,
+        "utilization_memory_percent": 40,
+        "utilization_encoder_percent": 12,
+        "utilization_decoder_percent": 8,
         "temperature_celsius": 65,
-        "power_watts": 220,
+        "power_draw_watts": 220,
         "memory_used_mb": 4096,
         "memory_total_mb": 10240,
     },
+    {
+        "index": 1,
+        "pci_id": "0000:00:02.0",
+        "name": "Intel UHD Graphics 770",
+        "driver_version": "i915",
+        "utilization_gpu_percent": 5,
+        "cpu_temperature_celsius": 48,
+        "power_draw_watts": 3.5,
+    },
 ]
 
 MOCK_NETWORK_DATA = [
@@ -155,6 +171,30 @@ MOCK_NETWORK_DATA = [
     },
 ]
 
+MOCK_SHARES_DATA = [
+    {
+        "name": "appdata",
+        "size_bytes": 100000000000,
+        "used_bytes": 50000000000,
+        "free_bytes": 50000000000,
+        "usage_percent": 50.0,
+    },
+    {
+        "name": "media",
+        "size_bytes": 8000000000000,
+        "used_bytes": 7200000000000,
+        "free_bytes": 800000000000,
+        "usage_percent": 90.0,
+    },
+    {
+        "name": "isos",
+        "size_bytes": 500000000000,
+        "used_bytes": 25000000000,
+        "free_bytes": 475000000000,
+        "usage_percent": 5.0,
+    },
+]
+
 # Mock health check response
 MOCK_HEALTH_CHECK = {
     "status": "healthy",
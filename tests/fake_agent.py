@@ -0,0 +1,463 @@
+"""
+A stand-in Unraid Management Agent for tests and benchmarks.
+
+FakeAgent serves every /api/v1 endpoint the integration uses and the /ws
+push stream from an aiohttp server on 127.0.0.1, so the real API and
+WebSocket clients run against it offline. Cardinality, payload size,
+latency, errors and push rate come from FakeAgentConfig; control endpoints
+change the served state and push the changed category.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Self
+
+from aiohttp import WSMsgType, web
+from aiohttp.test_utils import TestServer
+from homeassistant.util import dt as dt_util
+
+from custom_components.unraid_management_agent.const import (
+    API_ARRAY,
+    API_DISKS,
+    API_DOCKER,
+    API_GPU,
+    API_HEALTH,
+    API_NETWORK,
+    API_SHARES,
+    API_SYSTEM,
+    API_UPS,
+    API_VM,
+    API_WEBSOCKET,
+    KEY_ARRAY,
+    KEY_CONTAINERS,
+    KEY_DISKS,
+    KEY_GPU,
+    KEY_NETWORK,
+    KEY_SHARES,
+    KEY_SYSTEM,
+    KEY_UPS,
+    KEY_VMS,
+)
+
+# REST endpoint serving each data category
+CATEGORY_PATHS = {
+    KEY_SYSTEM: API_SYSTEM,
+    KEY_ARRAY: API_ARRAY,
+    KEY_DISKS: API_DISKS,
+    KEY_CONTAINERS: API_DOCKER,
+    KEY_VMS: API_VM,
+    KEY_UPS: API_UPS,
+    KEY_GPU: API_GPU,
+    KEY_NETWORK: API_NETWORK,
+    KEY_SHARES: API_SHARES,
+}
+
+# Seconds the wait_for_* helpers wait before giving up
+WAIT_TIMEOUT = 5
+
+# State a container or VM control action leads to
+CONTAINER_STATES = {
+    "start": "running",
+    "stop": "exited",
+    "restart": "running",
+    "pause": "paused",
+    "unpause": "running",
+}
+VM_STATES = {
+    "start": "running",
+    "stop": "shut off",
+    "restart": "running",
+    "pause": "paused",
+    "resume": "running",
+    "hibernate": "shut off",
+    "force-stop": "shut off",
+}
+
+
+@dataclass
+class FakeAgentConfig:
+    """What the fake agent serves and how it behaves."""
+
+    disks: int = 4
+    containers: int = 8
+    vms: int = 2
+    interfaces: int = 2
+    shares: int = 3
+    gpus: int = 1
+    # Bytes of filler added to every object served, to model large payloads
+    padding: int = 0
+    # Seconds each REST request takes before it is answered
+    latency: float = 0.0
+    # Share of REST requests answered with HTTP 500, drawn from seed
+    error_rate: float = 0.0
+    # Seconds between pushes; each push sends the next category in turn
+    push_interval: float | None = None
+    # Push the changed category after a control action
+    push_on_change: bool = True
+    seed: int = 0
+
+
+def build_payloads(config: FakeAgentConfig) -> dict[str, Any]:
+    """Return the payloads of every category for a configuration."""
+    pad = {"padding": "x" * config.padding} if config.padding else {}
+    disks = [
+        {
+            "id": f"DISK_{index:03d}",
+            "device": f"sd{chr(ord('a') + index % 26)}{index // 26 or ''}",
+            "name": "parity" if index == 0 else f"disk{index}",
+            "role": "parity" if index == 0 else "data",
+            "size_bytes": 8_000_000_000_000,
+            "used_bytes": 4_000_000_000_000,
+            "free_bytes": 4_000_000_000_000,
+            "usage_percent": 50.0,
+            "temperature_celsius": 35,
+            "spin_state": "active",
+            "status": "DISK_OK",
+            "filesystem": "xfs",
+            "mount_point": f"/mnt/disk{index}",
+            "smart_status": "PASSED",
+            "smart_errors": 0,
+            **pad,
+        }
+        for index in range(config.disks)
+    ]
+    return {
+        KEY_SYSTEM: {
+            "hostname": "fake-unraid",
+            "version": "7.0.0",
+            "cpu_usage_percent": 10.0,
+            "ram_usage_percent": 40.0,
+            "cpu_temp_celsius": 45.0,
+            "motherboard_temp_celsius": 38.0,
+            "cpu_model": "Fake CPU",
+            "cpu_cores": 8,
+            "cpu_threads": 16,
+            "ram_total_bytes": 34_359_738_368,
+            "uptime_seconds": 86400,
+            "fans": [{"name": "CPU Fan", "rpm": 1200}],
+            **pad,
+        },
+        KEY_ARRAY: {
+            "state": "STARTED",
+            "size_bytes": 8_000_000_000_000 * config.disks,
+            "used_bytes": 4_000_000_000_000 * config.disks,
+            "free_bytes": 4_000_000_000_000 * config.disks,
+            "used_percent": 50.0,
+            "num_disks": config.disks,
+            "num_data_disks": max(config.disks - 1, 0),
+            "num_parity_disks": min(config.disks, 1),
+            "parity_check_status": "idle",
+            "parity_valid": True,
+            "sync_percent": 0,
+            **pad,
+        },
+        KEY_DISKS: disks,
+        KEY_CONTAINERS: [
+            {
+                "id": f"container{index}",
+                "name": f"container{index}",
+                "image": f"example/app{index}:latest",
+                "ports": [{"private_port": 8000 + index, "type": "tcp"}],
+                "state": "running" if index % 2 == 0 else "exited",
+                "status": "Up 1 day" if index % 2 == 0 else "Exited (0)",
+                **pad,
+            }
+            for index in range(config.containers)
+        ],
+        KEY_VMS: [
+            {
+                "id": f"vm{index}",
+                "name": f"VM {index}",
+                "state": "running" if index % 2 == 0 else "shut off",
+                "vcpus": 2,
+                "memory_mb": 4096,
+                **pad,
+            }
+            for index in range(config.vms)
+        ],
+        KEY_UPS: {
+            "connected": True,
+            "status": "ONLINE",
+            "battery_charge_percent": 100,
+            "runtime_left_seconds": 3600,
+            "power_watts": 150.0,
+            "load_percent": 25,
+            "model": "Fake UPS",
+            **pad,
+        },
+        KEY_GPU: [
+            {
+                "available": True,
+                "index": index,
+                "uuid": f"GPU-{index:08d}",
+                "pci_id": f"0000:0{index + 1}:00.0",
+                "name": f"Fake GPU {index}",
+                "driver_version": "550.00",
+                "utilization_gpu_percent": 20,
+                "utilization_memory_percent": 10,
+                "temperature_celsius": 50,
+                "power_draw_watts": 60,
+                "memory_used_mb": 1024,
+                "memory_total_mb": 8192,
+                **pad,
+            }
+            for index in range(config.gpus)
+        ],
+        KEY_NETWORK: [
+            {
+                "name": f"eth{index}",
+                "mac_address": f"02:00:00:00:00:{index:02x}",
+                "ip_address": f"192.168.1.{10 + index}",
+                "state": "up",
+                "speed_mbps": 1000,
+                "bytes_received": 1_000_000,
+                "bytes_sent": 500_000,
+                **pad,
+            }
+            for index in range(config.interfaces)
+        ],
+        KEY_SHARES: [
+            {
+                "name": f"share{index}",
+                "path": f"/mnt/user/share{index}",
+                "size_bytes": 1_000_000_000_000,
+                "used_bytes": 500_000_000_000,
+                "free_bytes": 500_000_000_000,
+                "usage_percent": 50.0,
+                **pad,
+            }
+            for index in range(config.shares)
+        ],
+    }
+
+
+class FakeAgent:
+    """An aiohttp server behaving like the Unraid Management Agent."""
+
+    def __init__(self, config: FakeAgentConfig | None = None) -> None:
+        """Initialize the agent; call start before use."""
+        self.config = config or FakeAgentConfig()
+        self.data = build_payloads(self.config)
+        # Requests received by path, and the control actions by path
+        self.requests: Counter[str] = Counter()
+        self.actions: list[str] = []
+        self.pushes = 0
+        self._random = random.Random(self.config.seed)  # noqa: S311
+        # Paths answered with a status for the given number of requests
+        self._failures: dict[str, list[int]] = {}
+        self._sockets: set[web.WebSocketResponse] = set()
+        self._server: TestServer | None = None
+        self._push_task: asyncio.Task[None] | None = None
+        # Set whenever connections or pushes change; see _wait_until
+        self._changed = asyncio.Event()
+
+    @property
+    def host(self) -> str:
+        """Return the host the agent listens on."""
+        assert self._server is not None
+        return self._server.host
+
+    @property
+    def port(self) -> int:
+        """Return the port the agent listens on."""
+        assert self._server is not None
+        assert self._server.port is not None
+        return self._server.port
+
+    @property
+    def connections(self) -> int:
+        """Return the number of open push connections."""
+        return len(self._sockets)
+
+    async def start(self) -> None:
+        """Start serving on a free port of 127.0.0.1."""
+        app = web.Application()
+        app.router.add_get(API_HEALTH, self._handle_health)
+        for key, path in CATEGORY_PATHS.items():
+            app.router.add_get(path, self._category_handler(key))
+        app.router.add_post(f"{API_DOCKER}/{{id}}/{{action}}", self._handle_container)
+        app.router.add_post(f"{API_VM}/{{id}}/{{action}}", self._handle_vm)
+        app.router.add_post(f"{API_ARRAY}/{{action}}", self._handle_array)
+        app.router.add_post(
+            f"{API_ARRAY}/parity-check/{{action}}", self._handle_parity_check
+        )
+        app.router.add_get(API_WEBSOCKET, self._handle_websocket)
+
+        self._server = TestServer(app, host="127.0.0.1")
+        await self._server.start_server()
+        if self.config.push_interval is not None:
+            self._push_task = asyncio.get_running_loop().create_task(
+                self._push_loop(self.config.push_interval)
+            )
+
+    async def close(self) -> None:
+        """Close push connections and stop serving."""
+        if self._push_task is not None:
+            self._push_task.cancel()
+            await asyncio.gather(self._push_task, return_exceptions=True)
+            self._push_task = None
+        for socket in list(self._sockets):
+            await socket.close()
+        if self._server is not None:
+            await self._server.close()
+            self._server = None
+
+    async def __aenter__(self) -> Self:
+        """Start the agent for an async with block."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        """Stop the agent at the end of an async with block."""
+        await self.close()
+
+    async def wait_for_connections(self, count: int) -> None:
+        """Wait until the number of open push connections is count."""
+        await self._wait_until(lambda: self.connections == count)
+
+    async def wait_for_pushes(self, count: int) -> None:
+        """Wait until the agent has pushed count frames in total."""
+        await self._wait_until(lambda: self.pushes >= count)
+
+    async def _wait_until(self, condition: Callable[[], bool]) -> None:
+        """Wait for a condition on connections or pushes, for at most WAIT_TIMEOUT."""
+        async with asyncio.timeout(WAIT_TIMEOUT):
+            while not condition():
+                self._changed.clear()
+                await self._changed.wait()
+
+    def fail(self, path: str, status: int = 500, times: int = 1) -> None:
+        """Answer the next times requests to path with an HTTP status."""
+        self._failures[path] = [status] * times
+
+    async def push(self, key: str, data: Any = None) -> None:
+        """Send a category, or the given data, to every push connection."""
+        payload = self.data[key] if data is None else data
+        if key == KEY_GPU and isinstance(payload, list):
+            # The agent pushes GPU metrics one GPU at a time
+            payload = payload[0] if payload else {}
+        frame = json.dumps({"data": payload, "timestamp": dt_util.utcnow().isoformat()})
+        for socket in list(self._sockets):
+            if not socket.closed:
+                await socket.send_str(frame)
+        self.pushes += 1
+        self._changed.set()
+
+    async def _push_loop(self, interval: float) -> None:
+        """Push the categories in turn, one every interval."""
+        keys = list(CATEGORY_PATHS)
+        turn = 0
+        while True:
+            await asyncio.sleep(interval)
+            key = keys[turn % len(keys)]
+            turn += 1
+            if key == KEY_SYSTEM:
+                self.data[KEY_SYSTEM]["cpu_usage_percent"] = round(
+                    self._random.uniform(0, 100), 1
+                )
+            await self.push(key)
+
+    async def _answer(self, request: web.Request, payload: Any) -> web.Response:
+        """Answer a REST request after the configured latency and errors."""
+        self.requests[request.path] += 1
+        if self.config.latency:
+            await asyncio.sleep(self.config.latency)
+        if statuses := self._failures.get(request.path):
+            status = statuses.pop()
+            if not statuses:
+                del self._failures[request.path]
+            return web.json_response({"error": "injected"}, status=status)
+        if self.config.error_rate and self._random.random() < self.config.error_rate:
+            return web.json_response({"error": "injected"}, status=500)
+        return web.json_response(payload)
+
+    async def _handle_health(self, request: web.Request) -> web.Response:
+        """Answer the health check."""
+        return await self._answer(request, {"status": "healthy", "version": "fake"})
+
+    def _category_handler(self, key: str) -> Any:
+        """Return the handler serving a data category."""
+
+        async def handle(request: web.Request) -> web.Response:
+            return await self._answer(request, self.data[key])
+
+        return handle
+
+    async def _control(
+        self, request: web.Request, key: str, item: dict[str, Any] | None
+    ) -> web.Response:
+        """Answer a control action and push the changed category."""
+        self.actions.append(request.path)
+        if item is None:
+            return await self._answer(request, {"success": False})
+        response = await self._answer(request, {"success": True})
+        if response.status == 200 and self.config.push_on_change:
+            await self.push(key)
+        return response
+
+    def _item(self, key: str, item_id: str) -> dict[str, Any] | None:
+        """Return a container or VM by id or name."""
+        return next(
+            (
+                item
+                for item in self.data[key]
+                if item_id in (item.get("id"), item.get("name"))
+            ),
+            None,
+        )
+
+    async def _handle_container(self, request: web.Request) -> web.Response:
+        """Change the state of a container."""
+        item = self._item(KEY_CONTAINERS, request.match_info["id"])
+        state = CONTAINER_STATES.get(request.match_info["action"])
+        if item is not None and state is not None:
+            item["state"] = state
+        return await self._control(request, KEY_CONTAINERS, item)
+
+    async def _handle_vm(self, request: web.Request) -> web.Response:
+        """Change the state of a VM."""
+        item = self._item(KEY_VMS, request.match_info["id"])
+        state = VM_STATES.get(request.match_info["action"])
+        if item is not None and state is not None:
+            item["state"] = state
+        return await self._control(request, KEY_VMS, item)
+
+    async def _handle_array(self, request: web.Request) -> web.Response:
+        """Start or stop the array."""
+        array = self.data[KEY_ARRAY]
+        array["state"] = {"start": "STARTED", "stop": "STOPPED"}.get(
+            request.match_info["action"], array["state"]
+        )
+        return await self._control(request, KEY_ARRAY, array)
+
+    async def _handle_parity_check(self, request: web.Request) -> web.Response:
+        """Start, stop, pause or resume the parity check."""
+        array = self.data[KEY_ARRAY]
+        array["parity_check_status"] = {
+            "start": "running",
+            "stop": "idle",
+            "pause": "paused",
+            "resume": "running",
+        }.get(request.match_info["action"], array["parity_check_status"])
+        return await self._control(request, KEY_ARRAY, array)
+
+    async def _handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
+        """Hold a push connection open until either side closes it."""
+        socket = web.WebSocketResponse()
+        await socket.prepare(request)
+        self._sockets.add(socket)
+        self._changed.set()
+        try:
+            async for message in socket:
+                if message.type == WSMsgType.ERROR:
+                    break
+        finally:
+            self._sockets.discard(socket)
+            self._changed.set()
+        return socket
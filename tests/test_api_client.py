@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import aiohttp
 import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from custom_components.unraid_management_agent.api_client import UnraidAPIClient
+from custom_components.unraid_management_agent.api_client import (
+    UnraidActionSupersededError,
+    UnraidAPIClient,
+    UnraidDurationHistogram,
+)
+from custom_components.unraid_management_agent.const import REQUEST_STATS_WINDOW
 
 from .const import (
     MOCK_ARRAY_DATA,
@@ -139,7 +146,7 @@ async def test_get_gpu_metrics_success(hass: HomeAssistant, aioclient_mock) -> N
     result = await client.get_gpu_metrics()
 
     assert result == MOCK_GPU_DATA
-    assert len(result) == 1
+    assert len(result) == 2
 
 
 async def test_get_network_interfaces_success(
@@ -314,3 +321,154 @@ async def test_stop_vm_success(hass: HomeAssistant, aioclient_mock) -> None:
     result = await client.stop_vm("windows-10")
 
     assert result == {"success": True}
+
+
+async def _settle() -> None:
+    """Let the queued calls and their workers run up to their first wait."""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+async def test_actions_on_one_target_are_serialized(hass: HomeAssistant) -> None:
+    """Test that actions on a target wait for each other and others do not."""
+    api_client = UnraidAPIClient("192.168.1.100", 8043, async_get_clientsession(hass))
+    sent: list[str] = []
+    release = asyncio.Event()
+
+    async def post(endpoint: str, **_kwargs: object) -> dict:
+        sent.append(endpoint)
+        await release.wait()
+        return {"success": True, "endpoint": endpoint}
+
+    api_client._post = post
+    first = asyncio.create_task(api_client.start_container("plex"))
+    second = asyncio.create_task(api_client.restart_container("plex"))
+    other = asyncio.create_task(api_client.start_vm("windows-10"))
+    await _settle()
+
+    # The restart waits for the start, the VM does not
+    assert sent == ["/api/v1/docker/plex/start", "/api/v1/vm/windows-10/start"]
+    assert api_client.action_stats.queued == 1
+
+    release.set()
+    assert (await first)["endpoint"] == "/api/v1/docker/plex/start"
+    assert (await second)["endpoint"] == "/api/v1/docker/plex/restart"
+    await other
+    assert sent[-1] == "/api/v1/docker/plex/restart"
+
+    stats = api_client.action_stats.as_dict()
+    assert stats["queued"] == 0
+    assert stats["max_depth"] == 2
+    assert stats["sent"] == 3
+    assert stats["max_wait_ms"] > 0
+
+
+async def test_contradictory_actions_collapse(hass: HomeAssistant) -> None:
+    """Test that start, stop, start on a container sends a single start."""
+    api_client = UnraidAPIClient("192.168.1.100", 8043, async_get_clientsession(hass))
+    sent: list[str] = []
+    release = asyncio.Event()
+
+    async def post(endpoint: str, **_kwargs: object) -> dict:
+        sent.append(endpoint)
+        await release.wait()
+        return {"success": True}
+
+    api_client._post = post
+    first = asyncio.create_task(api_client.start_container("plex"))
+    await _settle()
+    stop = asyncio.create_task(api_client.stop_container("plex"))
+    second = asyncio.create_task(api_client.start_container("plex"))
+    await _settle()
+    release.set()
+
+    assert await first == {"success": True}
+    assert await second == {"success": True}
+    # The stop was never sent, and its caller is told so
+    with pytest.raises(UnraidActionSupersededError, match="replaced by start"):
+        await stop
+    assert sent == ["/api/v1/docker/plex/start"]
+    assert api_client.action_stats.collapsed == 2
+
+
+async def test_failed_action_reaches_joined_callers(hass: HomeAssistant) -> None:
+    """Test that callers joined to an action get its error."""
+    api_client = UnraidAPIClient("192.168.1.100", 8043, async_get_clientsession(hass))
+    release = asyncio.Event()
+
+    async def post(endpoint: str, **_kwargs: object) -> dict:
+        await release.wait()
+        if endpoint.endswith("/stop"):
+            raise ConnectionError(endpoint)
+        return {"success": True}
+
+    api_client._post = post
+    start = asyncio.create_task(api_client.start_vm("windows-10"))
+    await _settle()
+    stops = [
+        asyncio.create_task(api_client.stop_vm("windows-10")),
+        asyncio.create_task(api_client.hibernate_vm("windows-10")),
+        asyncio.create_task(api_client.stop_vm("windows-10")),
+        asyncio.create_task(api_client.stop_vm("windows-10")),
+    ]
+    await _settle()
+    release.set()
+
+    assert await start == {"success": True}
+    # The first stop is replaced by the hibernate, the hibernate by the
+    # second stop, which the third one joins
+    for task in stops[:2]:
+        with pytest.raises(UnraidActionSupersededError):
+            await task
+    for task in stops[2:]:
+        with pytest.raises(ConnectionError):
+            await task
+    assert api_client.action_stats.failed == 1
+
+
+async def test_request_stats(hass: HomeAssistant, aioclient_mock) -> None:
+    """Test that request durations, sizes and failures are recorded."""
+    aioclient_mock.get("http://192.168.1.100:8043/api/v1/disks", json=MOCK_DISKS_DATA)
+    aioclient_mock.get("http://192.168.1.100:8043/api/v1/ups", exc=TimeoutError())
+    aioclient_mock.post(
+        "http://192.168.1.100:8043/api/v1/docker/abc123/start", json={"success": True}
+    )
+
+    client = UnraidAPIClient("192.168.1.100", 8043, async_get_clientsession(hass))
+    await client.get_disks()
+    await client.get_disks()
+    with pytest.raises(TimeoutError):
+        await client.get_ups_status()
+    await client.start_container("abc123")
+
+    stats = client.request_stats.as_dict()
+    assert stats["/api/v1/disks"]["requests"] == 2
+    assert stats["/api/v1/disks"]["errors"] == 0
+    assert stats["/api/v1/disks"]["p50_ms"] is not None
+    assert stats["/api/v1/disks"]["last_bytes"] > 0
+    assert stats["/api/v1/ups"]["errors"] == 1
+    assert stats["/api/v1/ups"]["p50_ms"] is None
+    assert stats["/api/v1/ups"]["last_success"] is None
+    # Actions are recorded by name, not by the endpoint holding the item id
+    assert stats["start_container"]["requests"] == 1
+
+
+def test_duration_histogram_window() -> None:
+    """Test that the histogram counts recent durations in fixed buckets."""
+    histogram = UnraidDurationHistogram()
+    assert histogram.percentile(0.5) is None
+
+    for _ in range(REQUEST_STATS_WINDOW):
+        histogram.add(0.02)
+    histogram.add(30.0)
+    assert len(histogram) == REQUEST_STATS_WINDOW
+    assert histogram.percentile(0.5) == 0.025
+    assert histogram.percentile(0.999) == 10.0
+    assert histogram.as_dict()["le_25ms"] == REQUEST_STATS_WINDOW - 1
+    assert histogram.as_dict()["le_10000ms"] == 1
+
+    # Slow durations push the fast ones out of the window
+    for _ in range(REQUEST_STATS_WINDOW):
+        histogram.add(0.3)
+    assert histogram.percentile(0.5) == 0.5
+    assert histogram.as_dict()["le_25ms"] == 0
@@ -22,7 +22,7 @@ async def test_binary_sensor_setup(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -65,7 +65,7 @@ async def test_array_started_sensor(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -91,7 +91,7 @@ async def test_parity_check_running_sensor(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -118,7 +118,7 @@ async def test_ups_connected_sensor(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -146,7 +146,7 @@ async def test_container_running_sensor(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -181,7 +181,7 @@ async def test_vm_running_sensor(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
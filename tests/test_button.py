@@ -19,7 +19,7 @@ async def test_button_setup(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -61,7 +61,7 @@ async def test_start_array_button(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -98,7 +98,7 @@ async def test_stop_array_button(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -135,7 +135,7 @@ async def test_start_parity_check_button(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -173,7 +173,7 @@ async def test_stop_parity_check_button(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -213,7 +213,7 @@ async def test_start_array_button_error(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -247,7 +247,7 @@ async def test_stop_array_button_error(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -278,7 +278,7 @@ async def test_button_attributes(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -11,11 +11,22 @@ from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 
 from custom_components.unraid_management_agent.const import (
+    CONF_CAPTURE_WEBSOCKET,
+    CONF_DISABLED_CATEGORIES,
+    CONF_DISK_TEMPERATURE_THRESHOLD,
     CONF_ENABLE_WEBSOCKET,
+    CONF_PARITY_STALL_MINUTES,
+    CONF_SMART_ERROR_DELTA,
     CONF_UPDATE_INTERVAL,
+    CONF_UPS_LOAD_THRESHOLD,
+    DEFAULT_CAPTURE_WEBSOCKET,
+    DEFAULT_DISK_TEMPERATURE_THRESHOLD,
     DEFAULT_ENABLE_WEBSOCKET,
+    DEFAULT_PARITY_STALL_MINUTES,
     DEFAULT_PORT,
+    DEFAULT_SMART_ERROR_DELTA,
     DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_UPS_LOAD_THRESHOLD,
     DOMAIN,
     ERROR_CANNOT_CONNECT,
     ERROR_TIMEOUT,
@@ -182,6 +193,7 @@ async def test_options_flow(hass: HomeAssistant, mock_config_entry) -> None:
         user_input={
             CONF_UPDATE_INTERVAL: 60,
             CONF_ENABLE_WEBSOCKET: False,
+            CONF_DISABLED_CATEGORIES: ["vms", "containers"],
         },
     )
 
@@ -189,6 +201,12 @@ async def test_options_flow(hass: HomeAssistant, mock_config_entry) -> None:
     assert result2["data"] == {
         CONF_UPDATE_INTERVAL: 60,
         CONF_ENABLE_WEBSOCKET: False,
+        CONF_DISABLED_CATEGORIES: ["vms", "containers"],
+        CONF_DISK_TEMPERATURE_THRESHOLD: DEFAULT_DISK_TEMPERATURE_THRESHOLD,
+        CONF_SMART_ERROR_DELTA: DEFAULT_SMART_ERROR_DELTA,
+        CONF_PARITY_STALL_MINUTES: DEFAULT_PARITY_STALL_MINUTES,
+        CONF_UPS_LOAD_THRESHOLD: DEFAULT_UPS_LOAD_THRESHOLD,
+        CONF_CAPTURE_WEBSOCKET: DEFAULT_CAPTURE_WEBSOCKET,
     }
 
 
@@ -208,6 +226,8 @@ async def test_options_flow_default_values(
             assert key.default() == DEFAULT_UPDATE_INTERVAL
         elif key == CONF_ENABLE_WEBSOCKET:
             assert key.default() == DEFAULT_ENABLE_WEBSOCKET
+        elif key == CONF_DISABLED_CATEGORIES:
+            assert key.default() == []
 
 
 async def test_form_user_default_port(hass: HomeAssistant, mock_api_client) -> None:
@@ -0,0 +1,144 @@
+"""Test the Unraid Management Agent diagnostics."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import HomeAssistant
+
+from custom_components.unraid_management_agent.const import (
+    API_DISKS,
+    DOMAIN,
+    KEY_CONTAINERS,
+    KEY_DISKS,
+    KEY_SYSTEM,
+    WEBSOCKET_MAX_RETRIES,
+)
+from custom_components.unraid_management_agent.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.unraid_management_agent.websocket_client import (
+    UnraidWebSocketClient,
+)
+
+from .const import MOCK_CONFIG
+
+
+async def test_entry_diagnostics(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test config entry diagnostics include WebSocket statistics."""
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    coordinator.websocket_stats.record_connected()
+    coordinator.websocket_stats.record_message("system_update", 512, 0.001, 0.002, 0.5)
+    for duration in (0.01, 0.02, 0.03, 0.2):
+        coordinator.client.request_stats.record_success(API_DISKS, duration, 2048)
+    coordinator.client.request_stats.record_error(API_DISKS, TimeoutError())
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
+
+    assert diagnostics["entry"]["data"]["host"] == "**REDACTED**"
+    assert set(diagnostics["setup_timings"]) == {"first_data", "total"}
+    websocket = diagnostics["websocket"]
+    assert websocket["enabled"] is True
+    assert websocket["total_messages"] == 1
+    assert websocket["topics"]["system_update"]["bytes"] == 512
+    assert websocket["topics"]["system_update"]["avg_latency_ms"] == 500.0
+    assert websocket["history"][0]["event"] == "connected"
+    assert diagnostics["actions"]["queued"] == 0
+
+    disks = diagnostics["requests"][API_DISKS]
+    assert disks["requests"] == 5
+    assert disks["errors"] == 1
+    # Percentiles are the bounds of the histogram buckets they fall in
+    assert disks["p50_ms"] == 50.0
+    assert disks["p99_ms"] == 250.0
+    assert disks["histogram"]["le_25ms"] == 1
+    assert disks["error_rate"] == 20.0
+    assert disks["last_bytes"] == 2048
+    assert disks["last_success"] is not None
+    assert disks["last_error"] == "TimeoutError"
+
+    polling = diagnostics["polling"]
+    assert polling["plan"] == coordinator.poll_plan
+    assert set(polling["seconds_since_poll"]) == set(coordinator.poll_plan)
+    assert diagnostics["cardinality"][KEY_CONTAINERS] == len(
+        coordinator.data[KEY_CONTAINERS]
+    )
+    entities = diagnostics["entities"]
+    assert entities["total"] == sum(entities["platforms"].values())
+    assert entities["platforms"]["switch"] > 0
+    categories = entities["categories"]
+    assert categories[KEY_CONTAINERS] >= len(coordinator.data[KEY_CONTAINERS])
+    assert categories[KEY_DISKS] > 0
+    # Every enabled entity follows one category, or all of them
+    assert sum(categories.values()) == entities["total"] - entities["disabled"]
+    assert diagnostics["snapshot"][KEY_SYSTEM]["hostname"] == "**REDACTED**"
+    assert diagnostics["snapshot"][KEY_DISKS] == coordinator.data[KEY_DISKS]
+
+
+async def test_entry_diagnostics_hide_host(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that connection errors do not bring the host into diagnostics."""
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    host, port = MOCK_CONFIG[CONF_HOST], MOCK_CONFIG[CONF_PORT]
+    error = aiohttp.ClientConnectionError(f"Cannot connect to host {host}:{port}")
+    coordinator.client.request_stats.record_error(API_DISKS, error)
+
+    # A push channel that cannot connect, on its last retry
+    client = UnraidWebSocketClient(
+        host=host,
+        port=port,
+        session=MagicMock(),
+        callback=MagicMock(),
+        stats=coordinator.websocket_stats,
+    )
+    client._reconnect_count = WEBSOCKET_MAX_RETRIES
+    with patch.object(client, "connect", side_effect=error):
+        await client.listen()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
+
+    assert diagnostics["requests"][API_DISKS]["last_error"] == "ClientConnectionError"
+    assert diagnostics["websocket"]["history"][-1]["reason"] == (
+        "error: ClientConnectionError"
+    )
+    assert host not in json.dumps(diagnostics, default=str)
@@ -0,0 +1,203 @@
+"""Test the integration end to end against the stand-in agent."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.unraid_management_agent import UnraidDataUpdateCoordinator
+from custom_components.unraid_management_agent.const import (
+    API_DISKS,
+    CONF_CAPTURE_WEBSOCKET,
+    CONF_ENABLE_WEBSOCKET,
+    CONF_UPDATE_INTERVAL,
+    DOMAIN,
+    KEY_CONTAINERS,
+    KEY_DISKS,
+    KEY_SYSTEM,
+)
+from custom_components.unraid_management_agent.websocket_client import (
+    UnraidWebSocketClient,
+    read_capture,
+)
+
+from .fake_agent import CATEGORY_PATHS, FakeAgent, FakeAgentConfig
+
+# The agent listens on 127.0.0.1; connections to other hosts stay blocked
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+
+@pytest.fixture
+async def fake_agent() -> AsyncGenerator[FakeAgent]:
+    """Run a stand-in agent with the default configuration."""
+    async with FakeAgent() as agent:
+        yield agent
+
+
+async def _setup(
+    hass: HomeAssistant,
+    agent: FakeAgent,
+    *,
+    websocket: bool = True,
+    capture: bool = False,
+) -> MockConfigEntry:
+    """Set up a config entry talking to the agent."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Unraid (fake)",
+        data={CONF_HOST: agent.host, CONF_PORT: agent.port},
+        options={
+            CONF_UPDATE_INTERVAL: 30,
+            CONF_ENABLE_WEBSOCKET: websocket,
+            CONF_CAPTURE_WEBSOCKET: capture,
+        },
+        unique_id=f"{agent.host}:{agent.port}",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def _unload(hass: HomeAssistant, entry: MockConfigEntry) -> None:
+    """Unload the entry so its push connection closes."""
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_setup_against_fake_agent(
+    hass: HomeAssistant, fake_agent: FakeAgent
+) -> None:
+    """Test that setup fetches every category over HTTP and opens the stream."""
+    entry = await _setup(hass, fake_agent)
+    coordinator: UnraidDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    assert len(coordinator.data[KEY_DISKS]) == fake_agent.config.disks
+    assert fake_agent.requests[API_DISKS] == 1
+    await fake_agent.wait_for_connections(1)
+
+    await _unload(hass, entry)
+    await fake_agent.wait_for_connections(0)
+
+
+async def test_entities_scale_with_cardinality(hass: HomeAssistant) -> None:
+    """Test that a bigger server gets a switch per container and VM."""
+    config = FakeAgentConfig(containers=40, vms=6, disks=12, padding=256)
+    async with FakeAgent(config) as agent:
+        entry = await _setup(hass, agent)
+        switches = [
+            entity
+            for entity in er.async_entries_for_config_entry(
+                er.async_get(hass), entry.entry_id
+            )
+            if entity.domain == "switch"
+        ]
+        assert len(switches) == config.containers + config.vms
+        await _unload(hass, entry)
+
+
+async def test_push_and_control_round_trip(
+    hass: HomeAssistant, fake_agent: FakeAgent
+) -> None:
+    """Test that a control action is confirmed by the agent's push."""
+    entry = await _setup(hass, fake_agent)
+    coordinator: UnraidDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    fake_agent.data[KEY_SYSTEM]["cpu_usage_percent"] = 99.0
+    await fake_agent.push(KEY_SYSTEM)
+    response = await hass.services.async_call(
+        DOMAIN,
+        "container_start",
+        {"container_id": "container1", "wait_for_state": True, "timeout": 5},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response["confirmed"] is True
+    assert response["state"] == "running"
+    assert coordinator.data[KEY_SYSTEM]["cpu_usage_percent"] == 99.0
+    assert fake_agent.actions == ["/api/v1/docker/container1/start"]
+    # The push, not a poll, confirmed it
+    assert fake_agent.requests["/api/v1/docker"] == 1
+
+    await _unload(hass, entry)
+
+
+async def test_injected_errors(hass: HomeAssistant, fake_agent: FakeAgent) -> None:
+    """Test that a failing endpoint leaves the other categories working."""
+    fake_agent.fail(API_DISKS, status=500)
+    entry = await _setup(hass, fake_agent, websocket=False)
+    coordinator: UnraidDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    assert coordinator.last_update_success
+    assert coordinator.data[KEY_DISKS] == []
+    assert coordinator.data[KEY_CONTAINERS]
+
+    await _unload(hass, entry)
+
+
+async def test_push_rate(hass: HomeAssistant) -> None:
+    """Test that the agent pushes every category in turn at its push rate."""
+    async with FakeAgent(FakeAgentConfig(push_interval=0.01, latency=0.01)) as agent:
+        entry = await _setup(hass, agent)
+        coordinator: UnraidDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+        await agent.wait_for_connections(1)
+
+        await agent.wait_for_pushes(2 * len(CATEGORY_PATHS))
+        await hass.async_block_till_done()
+
+        assert coordinator.websocket_stats.total_messages >= len(CATEGORY_PATHS)
+        assert coordinator.websocket_stats.decode_errors == 0
+        assert "unknown" not in coordinator.websocket_stats.topics
+        await _unload(hass, entry)
+
+
+async def test_capture_and_replay(
+    hass: HomeAssistant, fake_agent: FakeAgent, tmp_path: Path
+) -> None:
+    """Test that captured pushes replay into a coordinator that missed them."""
+    hass.config.config_dir = str(tmp_path)
+    entry = await _setup(hass, fake_agent, capture=True)
+    coordinator: UnraidDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    capture_path = coordinator.capture_path
+    await fake_agent.wait_for_connections(1)
+
+    hot_disks = [
+        {**disk, "temperature_celsius": 70} for disk in fake_agent.data[KEY_DISKS]
+    ]
+    # The disks are pushed last, so both frames are captured once they apply
+    applied = hass.async_create_task(
+        coordinator.async_wait_for_state(
+            KEY_DISKS, lambda disks: disks[0]["temperature_celsius"] == 70, 5
+        )
+    )
+    await fake_agent.push(KEY_SYSTEM)
+    await fake_agent.push(KEY_DISKS, hot_disks)
+    await applied
+    await _unload(hass, entry)
+
+    frames = await hass.async_add_executor_job(read_capture, capture_path)
+    assert len(frames) == 2
+
+    # A new entry without push only has the polled temperatures
+    entry = await _setup(hass, fake_agent, websocket=False)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    assert coordinator.data[KEY_DISKS][0]["temperature_celsius"] != 70
+
+    replay = UnraidWebSocketClient(
+        host=fake_agent.host,
+        port=fake_agent.port,
+        session=MagicMock(),
+        callback=coordinator._handle_websocket_event,
+    )
+    await replay.async_replay(frames, speed=None)
+
+    assert coordinator.data[KEY_DISKS][0]["temperature_celsius"] == 70
+    await _unload(hass, entry)
@@ -0,0 +1,45 @@
+"""Test the import cost of the Unraid Management Agent integration."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+# Modules the integration package may import on top of what Home Assistant
+# has already loaded when it sets up a config entry
+MODULE_BUDGET = 6
+
+IMPORT_SCRIPT = """
+import json
+import sys
+
+import homeassistant.config_entries
+import homeassistant.helpers.aiohttp_client
+import homeassistant.helpers.device_registry
+import homeassistant.helpers.event
+import homeassistant.helpers.importlib
+import homeassistant.helpers.storage
+import homeassistant.helpers.update_coordinator
+
+before = set(sys.modules)
+import custom_components.unraid_management_agent
+print(json.dumps(sorted(set(sys.modules) - before)))
+"""
+
+
+def test_import_budget() -> None:
+    """Test that importing the package loads optional parts lazily."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).parents[1],
+        text=True,
+    )
+    modules = json.loads(result.stdout)
+
+    assert "custom_components.unraid_management_agent.repairs" not in modules
+    assert "custom_components.unraid_management_agent.websocket_client" not in modules
+    assert len(modules) <= MODULE_BUDGET, modules
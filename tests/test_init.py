@@ -2,12 +2,64 @@
 
 from __future__ import annotations
 
+import time
+from datetime import timedelta
+from functools import partial
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant
-
-from custom_components.unraid_management_agent.const import DOMAIN
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    async_capture_events,
+    async_fire_time_changed,
+)
+
+from custom_components.unraid_management_agent import (
+    CATEGORY_ENDPOINTS,
+    UnraidDataUpdateCoordinator,
+)
+from custom_components.unraid_management_agent.const import (
+    ACTIVE_POLL_INTERVAL,
+    CONF_DISABLED_CATEGORIES,
+    DATA_FLOW_SYSTEM,
+    DEGRADED_POLL_INTERVAL,
+    DEGRADED_RECOVERY_DELAY,
+    DOMAIN,
+    EVENT_CONTAINER_LIST_UPDATE,
+    EVENT_UPS_POWER_CHANGED,
+    EVENT_UPS_STATUS_UPDATE,
+    KEY_ARRAY,
+    KEY_CONTAINERS,
+    KEY_DISKS,
+    KEY_SHARES,
+    KEY_SYSTEM,
+    KEY_UPS,
+    KEY_VMS,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_STALE_GRACE,
+    UPS_ON_BATTERY_POLL_INTERVAL,
+    UPS_POLL_INTERVAL,
+)
+
+from .const import (
+    MOCK_ARRAY_DATA,
+    MOCK_DISKS_DATA,
+    MOCK_SHARES_DATA,
+    MOCK_SYSTEM_DATA,
+    MOCK_UPS_DATA,
+)
+
+# Share sensors that skip writes while their share is unchanged
+SHARE_SENSORS = (
+    "sensor.unraid_unraid_test_share_appdata_usage",
+    "sensor.unraid_unraid_test_top_share_usage",
+)
 
 
 async def test_setup_entry_success(
@@ -20,7 +72,7 @@ async def test_setup_entry_success(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -35,18 +87,22 @@ async def test_setup_entry_success(
     assert DOMAIN in hass.data
     assert mock_config_entry.entry_id in hass.data[DOMAIN]
 
-    # Verify health check was called
-    mock_api_client.health_check.assert_called_once()
+    # The first refresh doubles as the connection test
+    mock_api_client.health_check.assert_not_called()
+    mock_api_client.get_system_info.assert_called_once()
 
 
 async def test_setup_entry_connection_error(
     hass: HomeAssistant, mock_config_entry, mock_api_client
 ) -> None:
     """Test setup failure due to connection error."""
-    mock_api_client.health_check.side_effect = ConnectionError("Connection failed")
+    for method, _default in CATEGORY_ENDPOINTS.values():
+        getattr(mock_api_client, method).side_effect = ConnectionError(
+            "Connection failed"
+        )
 
     with patch(
-        "custom_components.unraid_management_agent.api_client.UnraidAPIClient",
+        "custom_components.unraid_management_agent.UnraidAPIClient",
         return_value=mock_api_client,
     ):
         await hass.config_entries.async_setup(mock_config_entry.entry_id)
@@ -59,10 +115,11 @@ async def test_setup_entry_timeout_error(
     hass: HomeAssistant, mock_config_entry, mock_api_client
 ) -> None:
     """Test setup failure due to timeout error."""
-    mock_api_client.health_check.side_effect = TimeoutError("Timeout")
+    for method, _default in CATEGORY_ENDPOINTS.values():
+        getattr(mock_api_client, method).side_effect = TimeoutError("Timeout")
 
     with patch(
-        "custom_components.unraid_management_agent.api_client.UnraidAPIClient",
+        "custom_components.unraid_management_agent.UnraidAPIClient",
         return_value=mock_api_client,
     ):
         await hass.config_entries.async_setup(mock_config_entry.entry_id)
@@ -71,6 +128,70 @@ async def test_setup_entry_timeout_error(
     assert mock_config_entry.state == ConfigEntryState.SETUP_RETRY
 
 
+async def test_setup_entry_partial_failure(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that setup succeeds when only some endpoints fail."""
+    mock_api_client.get_ups_status.side_effect = ConnectionError("No UPS")
+    mock_api_client.get_gpu_metrics.side_effect = TimeoutError("Timeout")
+
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert mock_config_entry.state == ConfigEntryState.LOADED
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    assert coordinator.data[KEY_UPS] == {}
+    assert coordinator.data[KEY_SYSTEM] == MOCK_SYSTEM_DATA
+    assert set(coordinator.setup_timings) == {"first_data", "total"}
+
+
+async def test_setup_entry_reuses_config_flow_data(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that setup does not fetch /system again right after the flow."""
+    hass.data[DATA_FLOW_SYSTEM] = {
+        mock_config_entry.unique_id: (time.monotonic(), MOCK_SYSTEM_DATA)
+    }
+
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert mock_config_entry.state == ConfigEntryState.LOADED
+    mock_api_client.get_system_info.assert_not_called()
+    mock_api_client.get_array_status.assert_called_once()
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    assert coordinator.data[KEY_SYSTEM] == MOCK_SYSTEM_DATA
+    assert hass.data[DATA_FLOW_SYSTEM] == {}
+
+
 async def test_unload_entry(
     hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
 ) -> None:
@@ -81,7 +202,7 @@ async def test_unload_entry(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -111,7 +232,7 @@ async def test_reload_entry(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -130,7 +251,7 @@ async def test_reload_entry(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -154,7 +275,7 @@ async def test_setup_platforms(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -188,7 +309,7 @@ async def test_websocket_enabled(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -219,7 +340,7 @@ async def test_websocket_disabled(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -238,14 +359,14 @@ async def test_websocket_disabled(
 async def test_update_listener(
     hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
 ) -> None:
-    """Test that update listener triggers reload."""
+    """Test that option changes are applied without reloading the entry."""
     with (
         patch(
             "custom_components.unraid_management_agent.UnraidAPIClient",
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -257,15 +378,60 @@ async def test_update_listener(
         await hass.async_block_till_done()
 
     assert mock_config_entry.state == ConfigEntryState.LOADED
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    coordinator.degraded = True
+    cpu_before = hass.states.get("sensor.unraid_unraid_test_cpu_usage")
+
+    hass.config_entries.async_update_entry(
+        mock_config_entry,
+        options={"enable_websocket": False, "update_interval": 60},
+    )
+    await hass.async_block_till_done()
 
-    # Update options and reload
+    # Entry should still be loaded, by the same coordinator and entities
+    assert mock_config_entry.state == ConfigEntryState.LOADED
+    assert hass.data[DOMAIN][mock_config_entry.entry_id] is coordinator
+    assert coordinator.update_interval == timedelta(seconds=60)
+    assert coordinator.enable_websocket is False
+    assert coordinator.degraded is False
+    cpu_after = hass.states.get("sensor.unraid_unraid_test_cpu_usage")
+    assert cpu_after.last_changed == cpu_before.last_changed
+
+    hass.config_entries.async_update_entry(
+        mock_config_entry,
+        options={"enable_websocket": True, "update_interval": 60},
+    )
+    await hass.async_block_till_done()
+    assert hass.data[DOMAIN][mock_config_entry.entry_id] is coordinator
+    assert coordinator.enable_websocket is True
+
+    # Capturing restarts the push connection, not the entry
+    hass.config_entries.async_update_entry(
+        mock_config_entry,
+        options={
+            "enable_websocket": True,
+            "update_interval": 60,
+            "capture_websocket": True,
+        },
+    )
+    await hass.async_block_till_done()
+    assert hass.data[DOMAIN][mock_config_entry.entry_id] is coordinator
+    assert coordinator.capture_path == hass.config.path(
+        f"{DOMAIN}.{mock_config_entry.entry_id}.capture.jsonl.gz"
+    )
+
+
+async def test_update_listener_new_server_reloads(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that changing the host reloads the entry."""
     with (
         patch(
             "custom_components.unraid_management_agent.UnraidAPIClient",
             return_value=mock_api_client,
-        ),
+        ) as client_class,
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -273,14 +439,72 @@ async def test_update_listener(
             new=AsyncMock(),
         ),
     ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+        coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+
         hass.config_entries.async_update_entry(
             mock_config_entry,
-            options={"enable_websocket": False, "update_interval": 60},
+            data={**mock_config_entry.data, "host": "192.168.1.101"},
         )
         await hass.async_block_till_done()
 
-    # Entry should still be loaded
     assert mock_config_entry.state == ConfigEntryState.LOADED
+    assert hass.data[DOMAIN][mock_config_entry.entry_id] is not coordinator
+    assert client_class.call_args.kwargs["host"] == "192.168.1.101"
+
+
+async def test_disabled_categories(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that disabled categories are not polled, pushed or given entities."""
+    hass.config_entries.async_update_entry(
+        mock_config_entry,
+        options={
+            **mock_config_entry.options,
+            CONF_DISABLED_CATEGORIES: [KEY_CONTAINERS, KEY_VMS],
+        },
+    )
+
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+        mock_api_client.get_containers.assert_not_called()
+        mock_api_client.get_vms.assert_not_called()
+        assert KEY_CONTAINERS not in coordinator.poll_plan
+        assert KEY_VMS not in coordinator.data
+        assert hass.states.async_entity_ids("switch") == []
+
+        coordinator._handle_websocket_event(
+            EVENT_CONTAINER_LIST_UPDATE, [{"id": "abc", "name": "plex"}]
+        )
+        assert KEY_CONTAINERS not in coordinator.data
+
+        # Turning a category back on needs new entities, so the entry reloads
+        hass.config_entries.async_update_entry(
+            mock_config_entry,
+            options={**mock_config_entry.options, CONF_DISABLED_CATEGORIES: []},
+        )
+        await hass.async_block_till_done()
+
+    assert hass.data[DOMAIN][mock_config_entry.entry_id] is not coordinator
+    mock_api_client.get_containers.assert_called_once()
+    assert hass.states.async_entity_ids("switch")
 
 
 async def test_multiple_entries(
@@ -305,7 +529,7 @@ async def test_multiple_entries(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -323,3 +547,349 @@ async def test_multiple_entries(
     # Verify that the domain data structure supports multiple entries
     # (it's a dict keyed by entry_id, so it inherently supports multiple entries)
     assert isinstance(hass.data[DOMAIN], dict)
+
+
+async def test_coordinator_degraded_polling(
+    hass: HomeAssistant, mock_api_client
+) -> None:
+    """Test that losing the WebSocket speeds up polling of key categories."""
+    coordinator = UnraidDataUpdateCoordinator(
+        hass, client=mock_api_client, update_interval=30, enable_websocket=True
+    )
+    await coordinator.async_refresh()
+    assert mock_api_client.get_system_info.call_count == 1
+    assert mock_api_client.get_disks.call_count == 1
+
+    coordinator._handle_websocket_connection(False)
+    await hass.async_block_till_done()
+
+    assert coordinator.degraded is True
+    assert coordinator.update_interval == timedelta(seconds=DEGRADED_POLL_INTERVAL)
+    assert coordinator.poll_plan[KEY_SYSTEM] == DEGRADED_POLL_INTERVAL
+    assert coordinator.poll_plan[KEY_DISKS] == 30
+    # Only the degraded categories are re-fetched, the rest keep their data
+    assert mock_api_client.get_system_info.call_count == 2
+    assert mock_api_client.get_array_status.call_count == 2
+    assert mock_api_client.get_disks.call_count == 1
+    assert coordinator.data[KEY_DISKS]
+    assert coordinator.data[KEY_ARRAY]
+
+    await coordinator.async_shutdown()
+
+
+async def test_coordinator_degraded_recovery_hysteresis(
+    hass: HomeAssistant, mock_api_client
+) -> None:
+    """Test that polling only reverts after push stays up for the window."""
+    coordinator = UnraidDataUpdateCoordinator(
+        hass, client=mock_api_client, update_interval=30, enable_websocket=True
+    )
+    coordinator._handle_websocket_connection(False)
+    await hass.async_block_till_done()
+
+    # A flapping connection does not leave degraded mode
+    coordinator._handle_websocket_connection(True)
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=DEGRADED_RECOVERY_DELAY / 2)
+    )
+    coordinator._handle_websocket_connection(False)
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=DEGRADED_RECOVERY_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+    assert coordinator.degraded is True
+
+    # A connection that stays up restores the configured interval
+    coordinator._handle_websocket_connection(True)
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=DEGRADED_RECOVERY_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+    assert coordinator.degraded is False
+    assert coordinator.update_interval == timedelta(seconds=30)
+
+    await coordinator.async_shutdown()
+
+
+async def test_coordinator_adaptive_array_polling(
+    hass: HomeAssistant, mock_api_client
+) -> None:
+    """Test that a running parity check speeds up array polling, then decays."""
+    coordinator = UnraidDataUpdateCoordinator(
+        hass, client=mock_api_client, update_interval=30, enable_websocket=True
+    )
+    mock_api_client.get_array_status.return_value = {
+        **MOCK_ARRAY_DATA,
+        "parity_check_status": "running",
+    }
+    await coordinator.async_refresh()
+
+    assert coordinator.poll_plan[KEY_ARRAY] == ACTIVE_POLL_INTERVAL
+    assert coordinator.poll_plan[KEY_SYSTEM] == 30
+    assert coordinator.update_interval == timedelta(seconds=ACTIVE_POLL_INTERVAL)
+
+    # Once idle the interval doubles on every array poll until it is normal
+    mock_api_client.get_array_status.return_value = MOCK_ARRAY_DATA
+    intervals = []
+    for _ in range(3):
+        coordinator._last_polled.pop(KEY_ARRAY)
+        await coordinator.async_refresh()
+        intervals.append(coordinator.poll_plan[KEY_ARRAY])
+    assert intervals == [
+        ACTIVE_POLL_INTERVAL * 2,
+        ACTIVE_POLL_INTERVAL * 4,
+        30,
+    ]
+    assert coordinator.update_interval == timedelta(seconds=30)
+
+    await coordinator.async_shutdown()
+
+
+async def test_partial_poll_only_writes_polled_categories(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that busy-array and degraded ticks leave other entities alone."""
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+    coordinator: UnraidDataUpdateCoordinator = hass.data[DOMAIN][
+        mock_config_entry.entry_id
+    ]
+
+    written: set[str] = set()
+    write_state = Entity._async_write_ha_state
+
+    def record_write(entity: Entity) -> None:
+        written.add(entity.entity_id)
+        write_state(entity)
+
+    with patch.object(Entity, "_async_write_ha_state", record_write):
+        # A parity check in progress: only the array is polled
+        mock_api_client.get_array_status.return_value = {
+            **MOCK_ARRAY_DATA,
+            "parity_check_status": "running",
+            "sync_percent": 10,
+        }
+        coordinator._last_polled.pop(KEY_ARRAY)
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert coordinator.poll_plan[KEY_ARRAY] == ACTIVE_POLL_INTERVAL
+        assert "sensor.unraid_unraid_test_parity_check_progress" in written
+        assert "sensor.unraid_unraid_test_cpu_usage" not in written
+        assert not [entity_id for entity_id in written if "disk" in entity_id]
+
+        # WebSocket down: system, array and UPS are polled, disks are not
+        written.clear()
+        mock_api_client.get_system_info.return_value = {
+            **MOCK_SYSTEM_DATA,
+            "cpu_usage_percent": 99.0,
+        }
+        coordinator._handle_websocket_connection(False)
+        await hass.async_block_till_done()
+        assert coordinator.degraded is True
+        assert "sensor.unraid_unraid_test_cpu_usage" in written
+        assert not [entity_id for entity_id in written if "disk" in entity_id]
+
+    await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_coordinator_ups_on_battery(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, mock_api_client
+) -> None:
+    """Test that a UPS on battery is sampled fast and fires power events."""
+    events = async_capture_events(hass, EVENT_UPS_POWER_CHANGED)
+    coordinator = UnraidDataUpdateCoordinator(
+        hass, client=mock_api_client, update_interval=30, enable_websocket=True
+    )
+    await coordinator.async_refresh()
+    assert coordinator.poll_plan[KEY_UPS] == UPS_POLL_INTERVAL
+    updates = {KEY_UPS: 0, KEY_SYSTEM: 0}
+
+    def count_update(key: str) -> None:
+        updates[key] += 1
+
+    for key in updates:
+        coordinator.async_add_listener(partial(count_update, key), key)
+
+    # Detected from a poll
+    mock_api_client.get_ups_status.return_value = {
+        **MOCK_UPS_DATA,
+        "status": "ONBATT",
+        "battery_charge_percent": 95,
+    }
+    coordinator._last_polled.pop(KEY_UPS)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert coordinator.ups_sample_interval == UPS_ON_BATTERY_POLL_INTERVAL
+    assert len(events) == 1
+    assert events[0].data["on_battery"] is True
+    assert events[0].data["battery_charge"] == 95
+
+    # Sampled on its own: the refresh schedule and other entities stay put
+    assert coordinator.update_interval == timedelta(seconds=30)
+    system_calls = mock_api_client.get_system_info.call_count
+    ups_calls = mock_api_client.get_ups_status.call_count
+    updates.update(dict.fromkeys(updates, 0))
+    mock_api_client.get_ups_status.return_value = {
+        **MOCK_UPS_DATA,
+        "status": "ONBATT",
+        "battery_charge_percent": 94,
+    }
+    freezer.tick(timedelta(seconds=UPS_ON_BATTERY_POLL_INTERVAL))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert mock_api_client.get_ups_status.call_count == ups_calls + 1
+    assert mock_api_client.get_system_info.call_count == system_calls
+    assert updates == {KEY_UPS: 1, KEY_SYSTEM: 0}
+
+    # Further samples on battery fire nothing new
+    coordinator._handle_websocket_event(
+        EVENT_UPS_STATUS_UPDATE, {**MOCK_UPS_DATA, "status": "ONBATT"}
+    )
+    await hass.async_block_till_done()
+    assert len(events) == 1
+
+    # Line power back, detected from a push, restores the normal interval
+    coordinator._handle_websocket_event(EVENT_UPS_STATUS_UPDATE, MOCK_UPS_DATA)
+    await hass.async_block_till_done()
+
+    assert len(events) == 2
+    assert events[1].data["on_battery"] is False
+    assert coordinator.ups_sample_interval is None
+    assert coordinator.poll_plan[KEY_UPS] == UPS_POLL_INTERVAL
+
+    # Without push, the UPS is polled at the configured interval
+    await coordinator.async_apply_options(update_interval=30, enable_websocket=False)
+    assert coordinator.poll_plan[KEY_UPS] == 30
+
+    await coordinator.async_shutdown()
+
+
+async def test_setup_from_snapshot_while_server_down(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    hass_storage: dict[str, Any],
+    mock_config_entry,
+    mock_api_client,
+    mock_websocket_client,
+) -> None:
+    """Test that a stored snapshot brings entities up without the server."""
+    hass_storage[f"{DOMAIN}.{mock_config_entry.entry_id}"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.{mock_config_entry.entry_id}",
+        "data": {
+            "saved_at": "2025-10-03T03:41:13+00:00",
+            "data": {
+                KEY_SYSTEM: MOCK_SYSTEM_DATA,
+                KEY_ARRAY: MOCK_ARRAY_DATA,
+                KEY_DISKS: MOCK_DISKS_DATA,
+                KEY_SHARES: MOCK_SHARES_DATA,
+            },
+        },
+    }
+    for method, _default in CATEGORY_ENDPOINTS.values():
+        getattr(mock_api_client, method).side_effect = ConnectionError("down")
+
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert mock_config_entry.state == ConfigEntryState.LOADED
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    assert coordinator.stale is True
+    assert coordinator.data[KEY_SYSTEM] == MOCK_SYSTEM_DATA
+
+    state = hass.states.get("sensor.unraid_unraid_test_cpu_usage")
+    assert float(state.state) == MOCK_SYSTEM_DATA["cpu_usage_percent"]
+    assert state.attributes["assumed_state"] is True
+    for entity_id in SHARE_SENSORS:
+        assert hass.states.get(entity_id).attributes["assumed_state"] is True
+
+    # Polls that reach nothing fail once the snapshot stood in long enough
+    freezer.tick(timedelta(seconds=SNAPSHOT_STALE_GRACE))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert coordinator.last_update_success is False
+    assert hass.states.get("sensor.unraid_unraid_test_cpu_usage").state == (
+        STATE_UNAVAILABLE
+    )
+
+    # The server comes back: live data replaces the snapshot and is stored
+    for method, _default in CATEGORY_ENDPOINTS.values():
+        getattr(mock_api_client, method).side_effect = None
+    mock_api_client.get_system_info.return_value = {
+        **MOCK_SYSTEM_DATA,
+        "cpu_usage_percent": 80.0,
+    }
+    await coordinator.async_request_category_refresh(*CATEGORY_ENDPOINTS)
+    await hass.async_block_till_done()
+
+    assert coordinator.stale is False
+    state = hass.states.get("sensor.unraid_unraid_test_cpu_usage")
+    assert float(state.state) == 80.0
+    assert "assumed_state" not in state.attributes
+    # Shares unchanged since the snapshot still drop the assumed state
+    for entity_id in SHARE_SENSORS:
+        assert "assumed_state" not in hass.states.get(entity_id).attributes
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=SNAPSHOT_SAVE_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+    stored = hass_storage[f"{DOMAIN}.{mock_config_entry.entry_id}"]["data"]
+    assert stored["data"][KEY_SYSTEM]["cpu_usage_percent"] == 80.0
+
+
+async def test_snapshot_saved_while_polling_faster_than_save_delay(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_api_client,
+) -> None:
+    """Test that refreshes within the save delay do not postpone the save."""
+    coordinator = UnraidDataUpdateCoordinator(
+        hass,
+        client=mock_api_client,
+        update_interval=30,
+        enable_websocket=False,
+        store=Store(hass, 1, f"{DOMAIN}.test_snapshot"),
+    )
+    started = dt_util.utcnow()
+    for elapsed in (0, SNAPSHOT_SAVE_DELAY / 2, SNAPSHOT_SAVE_DELAY - 1):
+        async_fire_time_changed(hass, started + timedelta(seconds=elapsed))
+        coordinator._last_polled.clear()
+        await coordinator.async_refresh()
+
+    async_fire_time_changed(hass, started + timedelta(seconds=SNAPSHOT_SAVE_DELAY + 1))
+    await hass.async_block_till_done()
+
+    assert f"{DOMAIN}.test_snapshot" in hass_storage
+
+    await coordinator.async_shutdown()
@@ -0,0 +1,357 @@
+"""Test the Unraid Management Agent repair issues."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import issue_registry as ir
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.unraid_management_agent import (
+    CATEGORY_ENDPOINTS,
+    UnraidDataUpdateCoordinator,
+)
+from custom_components.unraid_management_agent.api_client import UnraidConnectionError
+from custom_components.unraid_management_agent.const import (
+    CONF_DISK_TEMPERATURE_THRESHOLD,
+    CONF_PARITY_STALL_MINUTES,
+    DOMAIN,
+    EVENT_ARRAY_STATUS_UPDATE,
+    EVENT_DISK_LIST_UPDATE,
+    EVENT_UPS_STATUS_UPDATE,
+    HEALTH_SAVE_DELAY,
+    ISSUE_DWELL_TIME,
+    KEY_DISKS,
+)
+
+from .const import MOCK_ARRAY_DATA, MOCK_DISKS_DATA, MOCK_UPS_DATA
+
+SMART_ERROR_DISKS = [{**MOCK_DISKS_DATA[0], "smart_errors": 3}, MOCK_DISKS_DATA[1]]
+
+
+def _disks(temperature: int) -> list[dict]:
+    """Return the mock disks with the first one at a temperature."""
+    return [
+        {**MOCK_DISKS_DATA[0], "temperature_celsius": temperature},
+        MOCK_DISKS_DATA[1],
+    ]
+
+
+async def _wait(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, seconds: float
+) -> None:
+    """Let time pass and run the timers that came due."""
+    freezer.tick(timedelta(seconds=seconds))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+
+async def _setup(
+    hass: HomeAssistant, entry, mock_api_client, mock_websocket_client
+) -> UnraidDataUpdateCoordinator:
+    """Set up the entry and return its coordinator."""
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+    ):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    return hass.data[DOMAIN][entry.entry_id]
+
+
+def _issue_ids(hass: HomeAssistant) -> set[str]:
+    """Return the ids of the integration's open issues."""
+    registry = ir.async_get(hass)
+    return {issue_id for domain, issue_id in registry.issues if domain == DOMAIN}
+
+
+async def test_issues_follow_pushed_data(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that issues are raised and cleared as pushed data changes."""
+    coordinator = await _setup(
+        hass, mock_config_entry, mock_api_client, mock_websocket_client
+    )
+    entry_id = mock_config_entry.entry_id
+    smart_errors = f"disk_health_{entry_id}_WDC_WD80EFAX_12345_smart_errors"
+    parity = f"array_parity_invalid_{entry_id}"
+
+    coordinator._handle_websocket_event(EVENT_DISK_LIST_UPDATE, SMART_ERROR_DISKS)
+    assert _issue_ids(hass) == {smart_errors}
+
+    coordinator._handle_websocket_event(
+        EVENT_ARRAY_STATUS_UPDATE, {**MOCK_ARRAY_DATA, "parity_valid": False}
+    )
+    assert _issue_ids(hass) == {smart_errors, parity}
+
+    coordinator._handle_websocket_event(EVENT_DISK_LIST_UPDATE, MOCK_DISKS_DATA)
+    coordinator._handle_websocket_event(EVENT_ARRAY_STATUS_UPDATE, MOCK_ARRAY_DATA)
+    assert _issue_ids(hass) == set()
+
+
+async def test_issues_only_raised_on_change(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that unchanged data does not raise an issue again."""
+    coordinator = await _setup(
+        hass, mock_config_entry, mock_api_client, mock_websocket_client
+    )
+    coordinator._handle_websocket_event(EVENT_DISK_LIST_UPDATE, SMART_ERROR_DISKS)
+    mock_api_client.get_disks.return_value = SMART_ERROR_DISKS
+
+    with patch.object(ir, "async_create_issue") as create_issue:
+        coordinator._handle_websocket_event(EVENT_DISK_LIST_UPDATE, SMART_ERROR_DISKS)
+        await coordinator.async_refresh()
+
+    create_issue.assert_not_called()
+
+
+async def test_connection_issue(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that failing refreshes raise the connection issue until one succeeds."""
+    coordinator = await _setup(
+        hass, mock_config_entry, mock_api_client, mock_websocket_client
+    )
+    connection = f"connection_{mock_config_entry.entry_id}"
+    for method, _default in CATEGORY_ENDPOINTS.values():
+        getattr(mock_api_client, method).side_effect = UnraidConnectionError("refused")
+
+    coordinator._last_polled.clear()
+    await coordinator.async_refresh()
+    assert connection in _issue_ids(hass)
+
+    for method, _default in CATEGORY_ENDPOINTS.values():
+        getattr(mock_api_client, method).side_effect = None
+    coordinator._last_polled.clear()
+    await coordinator.async_refresh()
+    assert connection not in _issue_ids(hass)
+
+
+async def test_issues_cleared_on_unload(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that unloading the entry clears its issues."""
+    coordinator = await _setup(
+        hass, mock_config_entry, mock_api_client, mock_websocket_client
+    )
+    coordinator._handle_websocket_event(EVENT_DISK_LIST_UPDATE, SMART_ERROR_DISKS)
+    assert _issue_ids(hass)
+
+    await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert _issue_ids(hass) == set()
+
+
+async def test_unload_before_tracking_starts(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that an entry unloaded while the tracker starts leaves nothing behind."""
+    mock_api_client.get_array_status.return_value = {
+        **MOCK_ARRAY_DATA,
+        "parity_valid": False,
+    }
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+        # Unloaded before the background start of the tracker ran
+        await hass.config_entries.async_unload(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert _issue_ids(hass) == set()
+    assert not coordinator._listeners
+    assert mock_config_entry.update_listeners == []
+
+
+async def test_smart_errors_counted_from_stored_baseline(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    hass_storage: dict[str, Any],
+    mock_config_entry,
+    mock_api_client,
+    mock_websocket_client,
+) -> None:
+    """Test that only SMART errors added since the stored count raise an issue."""
+    health_key = f"{DOMAIN}.{mock_config_entry.entry_id}.health"
+    hass_storage[health_key] = {
+        "version": 1,
+        "key": health_key,
+        "data": {"items": {KEY_DISKS: {"WDC_WD80EFAX_12345": {"smart_errors": 3}}}},
+    }
+    mock_api_client.get_disks.return_value = SMART_ERROR_DISKS
+    coordinator = await _setup(
+        hass, mock_config_entry, mock_api_client, mock_websocket_client
+    )
+    smart_errors = (
+        f"disk_health_{mock_config_entry.entry_id}_WDC_WD80EFAX_12345_smart_errors"
+    )
+
+    # Errors the disk already had are not reported again
+    assert smart_errors not in _issue_ids(hass)
+
+    coordinator._handle_websocket_event(
+        EVENT_DISK_LIST_UPDATE,
+        [{**MOCK_DISKS_DATA[0], "smart_errors": 4}, MOCK_DISKS_DATA[1]],
+    )
+    assert smart_errors in _issue_ids(hass)
+
+    # Disks seen for the first time are stored with their current count
+    await _wait(hass, freezer, HEALTH_SAVE_DELAY)
+    stored = hass_storage[health_key]["data"]["items"][KEY_DISKS]
+    assert stored == {
+        "WDC_WD80EFAX_12345": {"smart_errors": 3},
+        "Samsung_SSD_980_67890": {"smart_errors": 0},
+    }
+
+
+async def test_disk_temperature_hysteresis_and_dwell(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_config_entry,
+    mock_api_client,
+    mock_websocket_client,
+) -> None:
+    """Test that the temperature issue waits out its dwell time and band."""
+    coordinator = await _setup(
+        hass, mock_config_entry, mock_api_client, mock_websocket_client
+    )
+    high_temp = f"disk_health_{mock_config_entry.entry_id}_WDC_WD80EFAX_12345_high_temp"
+
+    # A short spike does not raise the issue
+    coordinator._handle_websocket_event(EVENT_DISK_LIST_UPDATE, _disks(51))
+    await _wait(hass, freezer, ISSUE_DWELL_TIME / 2)
+    coordinator._handle_websocket_event(EVENT_DISK_LIST_UPDATE, _disks(44))
+    await _wait(hass, freezer, ISSUE_DWELL_TIME)
+    assert high_temp not in _issue_ids(hass)
+
+    # A lasting one does, without further updates
+    coordinator._handle_websocket_event(EVENT_DISK_LIST_UPDATE, _disks(51))
+    await _wait(hass, freezer, ISSUE_DWELL_TIME)
+    assert high_temp in _issue_ids(hass)
+
+    # Hovering around the threshold keeps it
+    for temperature in (50, 49, 51, 48):
+        coordinator._handle_websocket_event(EVENT_DISK_LIST_UPDATE, _disks(temperature))
+        await _wait(hass, freezer, ISSUE_DWELL_TIME)
+    assert high_temp in _issue_ids(hass)
+
+    # Cooling below the band clears it once the dwell time is over
+    coordinator._handle_websocket_event(EVENT_DISK_LIST_UPDATE, _disks(45))
+    await _wait(hass, freezer, ISSUE_DWELL_TIME - 1)
+    assert high_temp in _issue_ids(hass)
+    await _wait(hass, freezer, 1)
+    assert high_temp not in _issue_ids(hass)
+
+
+async def test_parity_check_stall(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_config_entry,
+    mock_api_client,
+    mock_websocket_client,
+) -> None:
+    """Test that a parity check without progress for the stall time is stuck."""
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={CONF_PARITY_STALL_MINUTES: 10}
+    )
+    coordinator = await _setup(
+        hass, mock_config_entry, mock_api_client, mock_websocket_client
+    )
+    stuck = f"parity_check_stuck_{mock_config_entry.entry_id}"
+
+    def push(sync_percent: float) -> None:
+        # Polls in between see the same data
+        mock_api_client.get_array_status.return_value = {
+            **MOCK_ARRAY_DATA,
+            "parity_check_status": "running",
+            "sync_percent": sync_percent,
+        }
+        coordinator._handle_websocket_event(
+            EVENT_ARRAY_STATUS_UPDATE, mock_api_client.get_array_status.return_value
+        )
+
+    # Progress keeps the issue away
+    for sync_percent in (10, 20, 30):
+        push(sync_percent)
+        await _wait(hass, freezer, 9 * 60)
+    assert stuck not in _issue_ids(hass)
+
+    await _wait(hass, freezer, 60)
+    assert stuck in _issue_ids(hass)
+
+    push(31)
+    assert stuck not in _issue_ids(hass)
+
+
+async def test_ups_load_issue(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_config_entry,
+    mock_api_client,
+    mock_websocket_client,
+) -> None:
+    """Test that a lasting high UPS load raises an issue."""
+    coordinator = await _setup(
+        hass, mock_config_entry, mock_api_client, mock_websocket_client
+    )
+    high_load = f"ups_high_load_{mock_config_entry.entry_id}"
+
+    coordinator._handle_websocket_event(
+        EVENT_UPS_STATUS_UPDATE, {**MOCK_UPS_DATA, "load_percent": 90}
+    )
+    await _wait(hass, freezer, ISSUE_DWELL_TIME)
+    assert high_load in _issue_ids(hass)
+
+    coordinator._handle_websocket_event(EVENT_UPS_STATUS_UPDATE, MOCK_UPS_DATA)
+    await _wait(hass, freezer, ISSUE_DWELL_TIME)
+    assert high_load not in _issue_ids(hass)
+
+
+async def test_thresholds_from_options(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_config_entry,
+    mock_api_client,
+    mock_websocket_client,
+) -> None:
+    """Test that changed thresholds apply without new data."""
+    mock_api_client.get_disks.return_value = _disks(45)
+    await _setup(hass, mock_config_entry, mock_api_client, mock_websocket_client)
+    high_temp = f"disk_health_{mock_config_entry.entry_id}_WDC_WD80EFAX_12345_high_temp"
+
+    hass.config_entries.async_update_entry(
+        mock_config_entry,
+        options={**mock_config_entry.options, CONF_DISK_TEMPERATURE_THRESHOLD: 40},
+    )
+    await hass.async_block_till_done()
+    await _wait(hass, freezer, ISSUE_DWELL_TIME)
+
+    assert high_temp in _issue_ids(hass)
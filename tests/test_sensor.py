@@ -7,11 +7,21 @@ from unittest.mock import AsyncMock, patch
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.const import PERCENTAGE
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 
+from custom_components.unraid_management_agent.const import (
+    DOMAIN,
+    EVENT_GPU_UPDATE,
+    EVENT_NETWORK_LIST_UPDATE,
+    EVENT_SHARE_LIST_UPDATE,
+    KEY_SYSTEM,
+)
 from custom_components.unraid_management_agent.sensor import (
     _is_physical_network_interface,
 )
 
+from .const import MOCK_GPU_DATA, MOCK_SHARES_DATA
+
 
 async def test_sensor_setup(
     hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
@@ -23,7 +33,7 @@ async def test_sensor_setup(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -64,7 +74,7 @@ async def test_cpu_usage_sensor(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -92,7 +102,7 @@ async def test_ram_usage_sensor(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -120,7 +130,7 @@ async def test_temperature_sensor(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -148,7 +158,7 @@ async def test_array_usage_sensor(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -176,7 +186,7 @@ async def test_disk_usage_sensor(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -194,6 +204,374 @@ async def test_disk_usage_sensor(
     assert state.attributes.get("unit_of_measurement") == PERCENTAGE
 
 
+async def test_websocket_diagnostic_sensors(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test WebSocket diagnostic sensors are registered but disabled by default."""
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    entity_registry = er.async_get(hass)
+    for suffix in ("websocket_messages", "websocket_latency", "websocket_reconnects"):
+        entity_id = entity_registry.async_get_entity_id(
+            "sensor", "unraid_management_agent", f"test_entry_id_{suffix}"
+        )
+        assert entity_id is not None
+        entry = entity_registry.async_get(entity_id)
+        assert entry.disabled_by is er.RegistryEntryDisabler.INTEGRATION
+        assert hass.states.get(entity_id) is None
+
+
+async def test_responsiveness_diagnostic_sensors(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test the refresh time and API error rate sensors once enabled."""
+    entity_registry = er.async_get(hass)
+    entity_ids = {
+        suffix: entity_registry.async_get_or_create(
+            "sensor",
+            DOMAIN,
+            f"{mock_config_entry.entry_id}_{suffix}",
+            config_entry=mock_config_entry,
+        ).entity_id
+        for suffix in ("refresh_time_p50", "refresh_time_p95", "api_error_rate")
+    }
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    # The mocked client answers at once, within the first bucket
+    p50 = hass.states.get(entity_ids["refresh_time_p50"])
+    assert p50.state == "10.0"
+    assert p50.attributes["refreshes"] == 1
+    assert hass.states.get(entity_ids["refresh_time_p95"]).state == "10.0"
+    assert hass.states.get(entity_ids["api_error_rate"]).state == "unknown"
+
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    stats = mock_api_client.request_stats
+    stats.record_success("/api/v1/disks", 0.3, 100)
+    stats.record_error("/api/v1/disks", TimeoutError())
+    coordinator.async_set_updated_data(coordinator.data)
+
+    error_rate = hass.states.get(entity_ids["api_error_rate"])
+    assert error_rate.state == "50.0"
+    assert error_rate.attributes["/api/v1/disks"] == 50.0
+    assert hass.states.get(entity_ids["refresh_time_p50"]).attributes["endpoints"] == {
+        "/api/v1/disks": 500.0
+    }
+
+
+async def test_share_sensors(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test share sensors, the top shares summary and disabled-by-default shares."""
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+        patch(
+            "custom_components.unraid_management_agent.sensor.SHARE_SUMMARY_TOP_N", 2
+        ),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.unraid_unraid_test_share_media_usage")
+    assert state is not None
+    assert float(state.state) == 90.0
+    assert state.attributes["unit_of_measurement"] == PERCENTAGE
+
+    top = hass.states.get("sensor.unraid_unraid_test_top_share_usage")
+    assert float(top.state) == 90.0
+    assert [share["name"] for share in top.attributes["shares"]] == [
+        "media",
+        "appdata",
+    ]
+
+    # Shares outside the top N are registered but disabled
+    entity_registry = er.async_get(hass)
+    entity_id = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, "test_entry_id_share_isos_usage"
+    )
+    assert entity_registry.async_get(entity_id).disabled_by is (
+        er.RegistryEntryDisabler.INTEGRATION
+    )
+
+
+async def test_share_sensors_push_update(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that a share push only rewrites the shares that changed."""
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    appdata_before = hass.states.get("sensor.unraid_unraid_test_share_appdata_usage")
+
+    shares = [
+        {**share, "timestamp": "2025-10-03T13:41:13+10:00"}
+        for share in MOCK_SHARES_DATA
+    ]
+    shares[1]["usage_percent"] = 95.0
+    coordinator._handle_websocket_event(EVENT_SHARE_LIST_UPDATE, shares)
+    await hass.async_block_till_done()
+
+    media = hass.states.get("sensor.unraid_unraid_test_share_media_usage")
+    assert float(media.state) == 95.0
+    appdata_after = hass.states.get("sensor.unraid_unraid_test_share_appdata_usage")
+    assert appdata_after.last_reported == appdata_before.last_reported
+    assert coordinator.get_item("shares", "appdata") is MOCK_SHARES_DATA[0]
+
+
+async def test_network_rate_sensors(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that traffic rates follow the agent's sample times."""
+    interface = {
+        "name": "eth0",
+        "state": "up",
+        "bytes_received": 1_000_000,
+        "bytes_sent": 500_000,
+        "timestamp": "2025-10-03T13:41:00+00:00",
+    }
+    mock_api_client.get_network_interfaces.return_value = [interface]
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    assert hass.states.get("sensor.unraid_unraid_test_network_eth0_inbound").state == (
+        "0.0"
+    )
+
+    # Ten seconds later by the agent's clock, whenever it arrives
+    coordinator._handle_websocket_event(
+        EVENT_NETWORK_LIST_UPDATE,
+        [
+            {
+                **interface,
+                "bytes_received": 2_000_000,
+                "bytes_sent": 600_000,
+                "timestamp": "2025-10-03T13:41:10+00:00",
+            }
+        ],
+    )
+    await hass.async_block_till_done()
+    inbound = hass.states.get("sensor.unraid_unraid_test_network_eth0_inbound")
+    assert float(inbound.state) == 800_000.0
+    outbound = hass.states.get("sensor.unraid_unraid_test_network_eth0_outbound")
+    assert float(outbound.state) == 80_000.0
+
+    # A poll that skips the network leaves the rates alone
+    mock_api_client.get_system_info.return_value = {
+        **mock_api_client.get_system_info.return_value,
+        "cpu_usage_percent": 99.0,
+    }
+    await coordinator.async_request_category_refresh(KEY_SYSTEM)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.unraid_unraid_test_cpu_usage").state == "99.0"
+    after = hass.states.get("sensor.unraid_unraid_test_network_eth0_inbound")
+    assert after.state == inbound.state
+    assert after.last_reported == inbound.last_reported
+
+
+async def test_gpu_sensors(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test per-GPU sensors, optional metrics and GPU push updates."""
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    nvidia = hass.states.get("sensor.unraid_unraid_test_gpu_0_utilization")
+    assert float(nvidia.state) == 45.0
+    assert nvidia.attributes["gpu_name"] == "NVIDIA GeForce RTX 3080"
+    intel = hass.states.get("sensor.unraid_unraid_test_gpu_1_utilization")
+    assert float(intel.state) == 5.0
+    assert intel.attributes["gpu_name"] == "Intel UHD Graphics 770"
+
+    # Encoder, decoder and memory sensors only exist where reported
+    assert hass.states.get("sensor.unraid_unraid_test_gpu_0_encoder_utilization")
+    assert hass.states.get("sensor.unraid_unraid_test_gpu_0_decoder_utilization")
+    assert hass.states.get("sensor.unraid_unraid_test_gpu_0_memory_utilization")
+    assert (
+        hass.states.get("sensor.unraid_unraid_test_gpu_1_encoder_utilization") is None
+    )
+
+    # Unique IDs use the GPU UUID, or the PCI address when there is none
+    entity_registry = er.async_get(hass)
+    assert entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, "test_entry_id_gpu_0000:00:02.0_power"
+    )
+    assert entity_registry.async_get_entity_id(
+        "sensor",
+        DOMAIN,
+        "test_entry_id_gpu_gpu-5f3c9a1e-2b7d-4e8f-9a6b-1c2d3e4f5a6b_power",
+    )
+
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    gpus = [dict(gpu) for gpu in MOCK_GPU_DATA]
+    gpus[1]["utilization_gpu_percent"] = 60
+    coordinator._handle_websocket_event(EVENT_GPU_UPDATE, gpus)
+    await hass.async_block_till_done()
+
+    intel = hass.states.get("sensor.unraid_unraid_test_gpu_1_utilization")
+    assert float(intel.state) == 60.0
+    assert coordinator.get_item("gpu", "0000:01:00.0") is None
+    assert coordinator.get_item("gpu", MOCK_GPU_DATA[0]["uuid"]) is MOCK_GPU_DATA[0]
+
+
+async def test_numeric_item_ids(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that items with numeric ids get sensors and are found by them."""
+    mock_api_client.get_gpu_metrics.return_value = [
+        {"id": 7, "index": 0, "name": "GPU", "utilization_gpu_percent": 30}
+    ]
+    mock_api_client.get_disks.return_value = [
+        {**disk, "id": 100 + number}
+        for number, disk in enumerate(mock_api_client.get_disks.return_value)
+    ]
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    assert coordinator.get_item("gpu", "7")["name"] == "GPU"
+    gpu = hass.states.get("sensor.unraid_unraid_test_gpu_0_utilization")
+    assert float(gpu.state) == 30.0
+    assert er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, "test_entry_id_disk_101_usage"
+    )
+
+
+async def test_gpu_legacy_unique_id_migration(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that the old single-GPU sensors move to the first GPU."""
+    entity_registry = er.async_get(hass)
+    legacy = entity_registry.async_get_or_create(
+        "sensor",
+        DOMAIN,
+        "test_entry_id_gpu_utilization",
+        suggested_object_id="unraid_unraid_test_gpu_utilization",
+        config_entry=mock_config_entry,
+    )
+
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    migrated = entity_registry.async_get(legacy.entity_id)
+    assert migrated.unique_id == (
+        f"test_entry_id_gpu_{MOCK_GPU_DATA[0]['uuid'].lower()}_utilization"
+    )
+    assert hass.states.get(legacy.entity_id) is not None
+    assert hass.states.get("sensor.unraid_unraid_test_gpu_0_utilization") is None
+
+
 def test_is_physical_network_interface() -> None:
     """Test physical network interface detection."""
     # Physical interfaces
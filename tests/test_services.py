@@ -0,0 +1,251 @@
+"""Test the Unraid Management Agent services."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.unraid_management_agent import (
+    CATEGORY_ENDPOINTS,
+    UnraidDataUpdateCoordinator,
+)
+from custom_components.unraid_management_agent.api_client import UnraidActionStats
+from custom_components.unraid_management_agent.const import (
+    DOMAIN,
+    EVENT_CONTAINER_LIST_UPDATE,
+)
+
+from .const import MOCK_CONFIG, MOCK_CONTAINERS_DATA, MOCK_OPTIONS
+
+
+async def _setup(
+    hass: HomeAssistant, entry, mock_api_client, mock_websocket_client
+) -> UnraidDataUpdateCoordinator:
+    """Set up the entry with its services and return its coordinator."""
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+    ):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    return hass.data[DOMAIN][entry.entry_id]
+
+
+async def test_service_waits_for_pushed_state(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that wait_for_state returns once a push shows the new state."""
+    coordinator = await _setup(
+        hass, mock_config_entry, mock_api_client, mock_websocket_client
+    )
+    mock_api_client.get_containers.reset_mock()
+
+    call = asyncio.create_task(
+        hass.services.async_call(
+            DOMAIN,
+            "container_start",
+            {"container_id": "sonarr", "wait_for_state": True},
+            blocking=True,
+            return_response=True,
+        )
+    )
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert not call.done()
+
+    coordinator._handle_websocket_event(
+        EVENT_CONTAINER_LIST_UPDATE,
+        [MOCK_CONTAINERS_DATA[0], {**MOCK_CONTAINERS_DATA[1], "state": "running"}],
+    )
+    response = await call
+
+    assert response["result"] is True
+    assert response["state"] == "running"
+    assert response["confirmed"] is True
+    assert response["elapsed"] >= 0
+    mock_api_client.start_container.assert_called_once_with("sonarr")
+    mock_api_client.get_containers.assert_not_called()
+    assert not coordinator._waiters
+
+
+async def test_service_restart_waits_for_new_state(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that a restart is not confirmed by the state from before it."""
+    coordinator = await _setup(
+        hass, mock_config_entry, mock_api_client, mock_websocket_client
+    )
+
+    call = asyncio.create_task(
+        hass.services.async_call(
+            DOMAIN,
+            "container_restart",
+            {"container_id": "plex", "wait_for_state": True},
+            blocking=True,
+            return_response=True,
+        )
+    )
+    for _ in range(10):
+        await asyncio.sleep(0)
+    # Plex was running before the restart already
+    assert not call.done()
+
+    coordinator._handle_websocket_event(
+        EVENT_CONTAINER_LIST_UPDATE,
+        [{**MOCK_CONTAINERS_DATA[0], "status": "Up 1 second"}, MOCK_CONTAINERS_DATA[1]],
+    )
+    response = await call
+
+    assert response["confirmed"] is True
+    assert response["state"] == "running"
+
+
+async def test_service_wait_times_out(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that a state that never shows up is reported as not confirmed."""
+    await _setup(hass, mock_config_entry, mock_api_client, mock_websocket_client)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "vm_start",
+        {"vm_id": "ubuntu-server", "wait_for_state": True, "timeout": 1},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response["confirmed"] is False
+    assert response["state"] == "stopped"
+
+
+async def test_service_without_wait(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that a service without wait_for_state answers right away."""
+    await _setup(hass, mock_config_entry, mock_api_client, mock_websocket_client)
+
+    response = await hass.services.async_call(
+        DOMAIN, "array_stop", {}, blocking=True, return_response=True
+    )
+    # Responses are optional
+    await hass.services.async_call(DOMAIN, "array_stop", {}, blocking=True)
+
+    assert response["confirmed"] is None
+    assert response["state"] == "started"
+    assert mock_api_client.stop_array.call_count == 2
+
+
+async def test_service_error(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that a failing action raises a Home Assistant error."""
+    await _setup(hass, mock_config_entry, mock_api_client, mock_websocket_client)
+    mock_api_client.stop_container.side_effect = ConnectionError("refused")
+
+    with pytest.raises(HomeAssistantError, match="Failed to stop container"):
+        await hass.services.async_call(
+            DOMAIN, "container_stop", {"container_id": "plex"}, blocking=True
+        )
+
+
+async def _setup_second_server(
+    hass: HomeAssistant, mock_api_client: MagicMock, mock_websocket_client
+) -> tuple[ConfigEntry, MagicMock]:
+    """Set up a second server answering like the first; return it and its client."""
+    client = MagicMock()
+    for method in ("health_check", *(m for m, _ in CATEGORY_ENDPOINTS.values())):
+        setattr(
+            client,
+            method,
+            AsyncMock(return_value=getattr(mock_api_client, method).return_value),
+        )
+    client.start_container = AsyncMock(return_value=True)
+    client.action_stats = UnraidActionStats()
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Unraid (second)",
+        data={**MOCK_CONFIG, CONF_HOST: "192.168.1.101"},
+        options=MOCK_OPTIONS,
+        unique_id="192.168.1.101:8043",
+    )
+    entry.add_to_hass(hass)
+    await _setup(hass, entry, client, mock_websocket_client)
+    return entry, client
+
+
+async def test_services_route_to_target_server(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that services act on the server picked by entry or device."""
+    await _setup(hass, mock_config_entry, mock_api_client, mock_websocket_client)
+    second, second_client = await _setup_second_server(
+        hass, mock_api_client, mock_websocket_client
+    )
+
+    await hass.services.async_call(
+        DOMAIN,
+        "container_start",
+        {"container_id": "sonarr", "config_entry_id": second.entry_id},
+        blocking=True,
+    )
+    second_client.start_container.assert_called_once_with("sonarr")
+    mock_api_client.start_container.assert_not_called()
+
+    # A container device routes to the server it runs on
+    device = dr.async_get(hass).async_get_device(
+        identifiers={(DOMAIN, f"{mock_config_entry.entry_id}_container_sonarr")}
+    )
+    await hass.services.async_call(
+        DOMAIN,
+        "container_start",
+        {"container_id": "sonarr", "device_id": device.id},
+        blocking=True,
+    )
+    mock_api_client.start_container.assert_called_once_with("sonarr")
+
+    with pytest.raises(ServiceValidationError, match="2 Unraid servers"):
+        await hass.services.async_call(
+            DOMAIN, "container_start", {"container_id": "sonarr"}, blocking=True
+        )
+    with pytest.raises(ServiceValidationError, match="does not belong"):
+        await hass.services.async_call(
+            DOMAIN,
+            "container_start",
+            {
+                "container_id": "sonarr",
+                "device_id": device.id,
+                "config_entry_id": second.entry_id,
+            },
+            blocking=True,
+        )
+
+
+async def test_services_removed_with_last_server(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that services stay until the last server is unloaded."""
+    await _setup(hass, mock_config_entry, mock_api_client, mock_websocket_client)
+    second, _client = await _setup_second_server(
+        hass, mock_api_client, mock_websocket_client
+    )
+
+    await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    assert hass.services.has_service(DOMAIN, "container_start")
+
+    await hass.config_entries.async_unload(second.entry_id)
+    assert not hass.services.has_service(DOMAIN, "container_start")
@@ -2,11 +2,30 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from freezegun.api import FrozenDateTimeFactory
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.unraid_management_agent.api_client import (
+    UnraidActionSupersededError,
+)
+from custom_components.unraid_management_agent.const import (
+    DOMAIN,
+    EVENT_CONTAINER_LIST_UPDATE,
+    KEY_CONTAINERS,
+    TRANSITION_TIMEOUT,
+)
+
+from .const import MOCK_CONTAINERS_DATA
+
+SONARR = "switch.unraid_unraid_test_container_sonarr"
 
 
 async def test_switch_setup(
@@ -19,7 +38,7 @@ async def test_switch_setup(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -61,7 +80,7 @@ async def test_container_switch_on_state(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -89,7 +108,7 @@ async def test_container_switch_off_state(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -117,7 +136,7 @@ async def test_container_switch_turn_on(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -150,7 +169,7 @@ async def test_container_switch_turn_off(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -183,7 +202,7 @@ async def test_vm_switch_on_state(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -211,7 +230,7 @@ async def test_vm_switch_off_state(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -239,7 +258,7 @@ async def test_vm_switch_turn_on(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -272,7 +291,7 @@ async def test_vm_switch_turn_off(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -308,7 +327,7 @@ async def test_container_switch_turn_on_error(
             return_value=mock_api_client,
         ),
         patch(
-            "custom_components.unraid_management_agent.UnraidWebSocketClient",
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
             return_value=mock_websocket_client,
         ),
         patch(
@@ -327,3 +346,171 @@ async def test_container_switch_turn_on_error(
             {"entity_id": "switch.unraid_unraid_test_container_sonarr"},
             blocking=True,
         )
+
+    assert hass.states.get(SONARR).state == "off"
+
+
+async def test_container_switch_replaced_before_sent(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that a replaced switch leaves the transition of its replacement."""
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+
+    async def stop_replaced(container_id: str) -> None:
+        # Switched back on while the stop still waited to be sent
+        coordinator.async_start_transition(KEY_CONTAINERS, container_id, running=True)
+        raise UnraidActionSupersededError
+
+    mock_api_client.stop_container.side_effect = stop_replaced
+
+    await hass.services.async_call(
+        "switch", "turn_off", {"entity_id": SONARR}, blocking=True
+    )
+    await hass.async_block_till_done()
+
+    assert coordinator.transition_target(KEY_CONTAINERS, "sonarr") is True
+
+
+async def test_container_switch_holds_target_until_pushed(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test that a switched container shows its target until a push confirms it."""
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    mock_api_client.get_containers.reset_mock()
+
+    await hass.services.async_call(
+        "switch", "turn_on", {"entity_id": SONARR}, blocking=True
+    )
+    await hass.async_block_till_done()
+
+    # Still stopped according to the server, but shown as on without a refresh
+    assert hass.states.get(SONARR).state == "on"
+    assert coordinator.transition_target("containers", "sonarr") is True
+    mock_api_client.get_containers.assert_not_called()
+
+    # A push still reporting the old state does not end the transition
+    coordinator._handle_websocket_event(
+        EVENT_CONTAINER_LIST_UPDATE, MOCK_CONTAINERS_DATA
+    )
+    assert hass.states.get(SONARR).state == "on"
+
+    started = [
+        MOCK_CONTAINERS_DATA[0],
+        {**MOCK_CONTAINERS_DATA[1], "state": "running"},
+    ]
+    coordinator._handle_websocket_event(EVENT_CONTAINER_LIST_UPDATE, started)
+    assert coordinator.transition_target("containers", "sonarr") is None
+    assert hass.states.get(SONARR).state == "on"
+    mock_api_client.get_containers.assert_not_called()
+
+
+async def test_container_switch_target_times_out(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_config_entry,
+    mock_api_client,
+    mock_websocket_client,
+) -> None:
+    """Test that an unconfirmed target state is dropped after the timeout."""
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        "switch", "turn_on", {"entity_id": SONARR}, blocking=True
+    )
+    assert hass.states.get(SONARR).state == "on"
+
+    freezer.tick(timedelta(seconds=TRANSITION_TIMEOUT))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert hass.states.get(SONARR).state == "off"
+
+
+async def test_switch_child_devices(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, mock_websocket_client
+) -> None:
+    """Test container and VM switches get their own device under the server."""
+    with (
+        patch(
+            "custom_components.unraid_management_agent.UnraidAPIClient",
+            return_value=mock_api_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.websocket_client.UnraidWebSocketClient",
+            return_value=mock_websocket_client,
+        ),
+        patch(
+            "custom_components.unraid_management_agent.async_setup_services",
+            new=AsyncMock(),
+        ),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    device_registry = dr.async_get(hass)
+    entity_registry = er.async_get(hass)
+    server = device_registry.async_get_device(
+        identifiers={(DOMAIN, mock_config_entry.entry_id)}
+    )
+
+    entry = entity_registry.async_get("switch.unraid_unraid_test_container_plex")
+    device = device_registry.async_get(entry.device_id)
+    assert device.name == "Unraid (unraid-test) Container plex"
+    assert device.via_device_id == server.id
+
+    entry = entity_registry.async_get("switch.unraid_unraid_test_vm_windows_10")
+    device = device_registry.async_get(entry.device_id)
+    assert device.name == "Unraid (unraid-test) VM Windows 10"
+    assert device.via_device_id == server.id
+
+    # All server entities share one DeviceInfo object
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    device_info = coordinator.device_info(mock_config_entry.entry_id)
+    assert coordinator.device_info(mock_config_entry.entry_id) is device_info
@@ -0,0 +1,201 @@
+"""Test the Unraid WebSocket client."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.unraid_management_agent.const import (
+    EVENT_SYSTEM_UPDATE,
+    EVENT_UPS_STATUS_UPDATE,
+    WEBSOCKET_MAX_RETRIES,
+)
+from custom_components.unraid_management_agent.websocket_client import (
+    UnraidWebSocketCapture,
+    UnraidWebSocketClient,
+    UnraidWebSocketStats,
+    identify_event_type,
+    read_capture,
+)
+
+from .const import MOCK_SYSTEM_DATA
+
+
+def _client(callback=None) -> UnraidWebSocketClient:
+    """Create a WebSocket client with a dummy session."""
+    return UnraidWebSocketClient(
+        host="192.168.1.100",
+        port=8043,
+        session=MagicMock(),
+        callback=callback or MagicMock(),
+    )
+
+
+def test_identify_event_type() -> None:
+    """Test event type identification from payload shape."""
+    assert identify_event_type(MOCK_SYSTEM_DATA) == EVENT_SYSTEM_UPDATE
+    assert (
+        identify_event_type({"connected": True, "battery_charge_percent": 100})
+        == EVENT_UPS_STATUS_UPDATE
+    )
+    assert identify_event_type([]) == "empty_list"
+    assert identify_event_type("nope") == "unknown"
+
+
+async def test_handle_message_records_topic_stats() -> None:
+    """Test that decoded frames are counted per topic."""
+    callback = MagicMock()
+    client = _client(callback)
+    frame = json.dumps({"data": MOCK_SYSTEM_DATA})
+
+    await client._handle_message(frame)
+    await client._handle_message(frame)
+
+    callback.assert_called_with(EVENT_SYSTEM_UPDATE, MOCK_SYSTEM_DATA)
+    topic = client.stats.topics[EVENT_SYSTEM_UPDATE]
+    assert topic["messages"] == 2
+    assert topic["bytes"] == 2 * len(frame)
+    assert topic["latency_samples"] == 0
+    assert client.stats.total_messages == 2
+    assert client.stats.average_latency is None
+
+    # Sizes are bytes on the wire, not characters
+    named = json.dumps(
+        {"data": {**MOCK_SYSTEM_DATA, "hostname": "Türme"}}, ensure_ascii=False
+    )
+    await client._handle_message(named)
+    assert topic["bytes"] == 2 * len(frame) + len(named.encode())
+    assert len(named.encode()) == len(named) + 1
+
+
+async def test_handle_message_records_latency() -> None:
+    """Test that server-to-HA latency is recorded for timestamped frames."""
+    client = _client()
+    sent_at = dt_util.utcnow() - timedelta(seconds=2)
+    frame = json.dumps({"data": MOCK_SYSTEM_DATA, "timestamp": sent_at.isoformat()})
+
+    await client._handle_message(frame)
+
+    latency = client.stats.average_latency
+    assert latency is not None
+    assert 2 <= latency < 5
+    summary = client.stats.topic_summary()[EVENT_SYSTEM_UPDATE]
+    assert summary["avg_latency_ms"] >= 2000
+
+
+async def test_handle_message_decode_error() -> None:
+    """Test that undecodable frames are counted."""
+    client = _client()
+
+    await client._handle_message("{not json")
+
+    assert client.stats.decode_errors == 1
+    assert client.stats.total_messages == 0
+
+
+def test_stats_connection_history() -> None:
+    """Test that reconnects are counted and kept in the history."""
+    stats = UnraidWebSocketStats()
+
+    stats.record_disconnected("error: refused", was_connected=False)
+    stats.record_connected()
+    assert stats.reconnect_count == 0
+
+    stats.record_disconnected("closed by server")
+    stats.record_connected()
+
+    assert stats.reconnect_count == 1
+    assert [event["event"] for event in stats.history] == [
+        "connect_failed",
+        "connected",
+        "disconnected",
+        "connected",
+    ]
+    assert stats.as_dict()["connected_since"] is not None
+
+
+async def test_reconnect_reports_connection_loss() -> None:
+    """Test that the owner is told when the push channel drops."""
+    on_connection_change = MagicMock()
+    client = UnraidWebSocketClient(
+        host="192.168.1.100",
+        port=8043,
+        session=MagicMock(),
+        callback=MagicMock(),
+        on_connection_change=on_connection_change,
+    )
+    client._reconnect_count = WEBSOCKET_MAX_RETRIES
+
+    await client._reconnect("closed by server")
+
+    on_connection_change.assert_called_once_with(False)
+
+
+def _append_cut_batch(path: str) -> None:
+    """Append a batch cut short, as a crash while writing leaves it."""
+    with Path(path).open("ab") as file:
+        file.write(gzip.compress(b'{"time": 1, "frame": "x"}\n')[:20])
+
+
+async def test_capture_round_trip(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test that captured frames are read back in order with their times."""
+    path = str(tmp_path / "capture.jsonl.gz")
+    frames = [json.dumps({"data": {"n": n}}) for n in range(3)]
+
+    # Two batches, as from two sessions appending to the same file
+    for frame in frames:
+        capture = UnraidWebSocketCapture(hass, path)
+        await capture.async_record(frame)
+        await capture.async_flush()
+
+    captured = await hass.async_add_executor_job(read_capture, path)
+    assert [frame for _received, frame in captured] == frames
+    assert captured[0][0] <= captured[1][0] <= captured[2][0]
+
+    # A batch cut short ends the capture without losing the earlier ones
+    await hass.async_add_executor_job(_append_cut_batch, path)
+    assert len(await hass.async_add_executor_job(read_capture, path)) == 3
+
+
+async def test_capture_rotates_at_max_bytes(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test that a full capture file is moved aside and a new one started."""
+    path = str(tmp_path / "capture.jsonl.gz")
+    capture = UnraidWebSocketCapture(hass, path, max_bytes=1)
+
+    await capture.async_record(json.dumps({"data": {"n": 0}}))
+    await capture.async_flush()
+    assert capture.rotations == 1
+    assert not await hass.async_add_executor_job(Path(path).exists)
+
+    # The next rotation replaces the file moved aside before
+    await capture.async_record(json.dumps({"data": {"n": 1}}))
+    await capture.async_flush()
+    assert capture.rotations == 2
+    rotated = await hass.async_add_executor_job(read_capture, f"{path}.1")
+    assert [frame for _received, frame in rotated] == [json.dumps({"data": {"n": 1}})]
+
+
+async def test_replay_spaces_frames_by_speed() -> None:
+    """Test that replayed frames are handled with their gaps divided by speed."""
+    callback = MagicMock()
+    client = _client(callback)
+    frame = json.dumps({"data": MOCK_SYSTEM_DATA})
+    frames = [(100.0, frame), (102.0, frame), (102.5, frame)]
+
+    with patch("asyncio.sleep", new=AsyncMock()) as sleep:
+        await client.async_replay(frames, speed=2.0)
+    assert sleep.await_args_list == [call(1.0), call(0.25)]
+    assert callback.call_count == 3
+
+    with patch("asyncio.sleep", new=AsyncMock()) as sleep:
+        await client.async_replay(frames, speed=None)
+    sleep.assert_not_awaited()
+    assert client.stats.topics[EVENT_SYSTEM_UPDATE]["messages"] == 6